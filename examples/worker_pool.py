@@ -29,13 +29,11 @@ if __name__ == "__main__":
     pool_size = 4
 
     # Start resolvers
-    pool = [Resolver.start().proxy() for _ in range(pool_size)]
+    pool = pykka.Pool.start(Resolver, pool_size, routing="smallest_mailbox")
+    resolver = pool.proxy()
 
-    # Distribute work by mapping IPs to resolvers (not blocking)
-    hosts: list[pykka.Future[str]] = []
-    for i, ip in enumerate(ip_addresses):
-        resolver = pool[i % len(pool)]
-        hosts.append(resolver.resolve(ip))
+    # Distribute work by sending each IP to the least busy resolver (not blocking)
+    hosts: list[pykka.Future[str]] = [resolver.resolve(ip) for ip in ip_addresses]
 
     # Gather results (blocking)
     result = list(zip(ip_addresses, pykka.get_all(hosts), strict=True))
@@ -2,30 +2,55 @@
 
 import logging as _logging
 
-from pykka._exceptions import ActorDeadError, Timeout
-from pykka._future import Future, get_all
+from pykka._dispatcher import ThreadPoolDispatcher
+from pykka._exceptions import ActorDeadError, MailboxFull, Timeout
+from pykka._future import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    as_completed,
+    get_all,
+    wait,
+)
 from pykka._proxy import ActorProxy, CallableProxy, traversable
 from pykka._ref import ActorRef
 from pykka._registry import ActorRegistry
+from pykka._shared_memory import SharedBuffer
 
 # The following must be imported late, in this specific order.
 from pykka._actor import Actor  # isort:skip
 from pykka._threading import ThreadingActor, ThreadingFuture  # isort:skip
+from pykka._asyncio import AsyncioActor, AsyncioFuture  # isort:skip
+from pykka._process import ProcessActor  # isort:skip
+from pykka._pool import Pool  # isort:skip
+from pykka._supervisor import Supervisor  # isort:skip
 
 
 __all__ = [
+    "ALL_COMPLETED",
+    "FIRST_COMPLETED",
     "Actor",
     "ActorDeadError",
     "ActorProxy",
     "ActorRef",
     "ActorRegistry",
+    "AsyncioActor",
+    "AsyncioFuture",
     "CallableProxy",
     "Future",
+    "MailboxFull",
+    "Pool",
+    "ProcessActor",
+    "SharedBuffer",
+    "Supervisor",
+    "ThreadPoolDispatcher",
     "ThreadingActor",
     "ThreadingFuture",
     "Timeout",
+    "as_completed",
     "get_all",
     "traversable",
+    "wait",
 ]
 
 _logging.getLogger(__name__).addHandler(_logging.NullHandler())
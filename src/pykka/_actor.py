@@ -4,17 +4,28 @@ import abc
 import logging
 import sys
 import threading
+import time
 import uuid
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
-from pykka import ActorDeadError, ActorRef, ActorRegistry, messages
+from pykka import (
+    ActorDeadError,
+    ActorRef,
+    ActorRegistry,
+    _metrics,
+    _tracing,
+    messages,
+)
+from pykka._inbox import BalancingInbox
 from pykka._introspection import get_attr_directly
+from pykka.messages import _ChildFailed
 
 if TYPE_CHECKING:
     from types import TracebackType
 
     from pykka import Future
     from pykka._envelope import Envelope
+    from pykka._types import OptExcInfo
 
 __all__ = ["Actor"]
 
@@ -26,7 +37,13 @@ A = TypeVar("A", bound="Actor")
 
 
 class ActorInbox(Protocol):
-    def put(self, envelope: Envelope[Any], /) -> None: ...
+    def put(
+        self,
+        envelope: Envelope[Any],
+        /,
+        *,
+        timeout: float | None = None,
+    ) -> None: ...
 
     def get(self) -> Envelope[Any]: ...
 
@@ -41,6 +58,8 @@ class Actor(abc.ABC):
     1.  subclass one of the [`Actor`][pykka.Actor] implementations:
 
         - [`ThreadingActor`][pykka.ThreadingActor]
+        - [`AsyncioActor`][pykka.AsyncioActor]
+        - [`ProcessActor`][pykka.ProcessActor]
 
     2.  implement your methods, including `__init__()`, as usual,
     3.  call [`Actor.start()`][pykka.Actor.start] on your actor class,
@@ -116,14 +135,51 @@ class Actor(abc.ABC):
 
         """
         obj = cls(*args, **kwargs)
-        assert obj.actor_ref is not None, (
+        return obj._register_and_start()
+
+    @classmethod
+    def _start_with_inbox(
+        cls: type[A],
+        inbox: ActorInbox,
+        *args: Any,
+        **kwargs: Any,
+    ) -> ActorRef[A]:
+        """Start an actor that uses the given inbox instead of creating one.
+
+        Internal method used by balancing pools, where the actors share a
+        queue of messages.
+        """
+        obj = cls.__new__(cls)
+        obj.actor_inbox = inbox
+        obj.__init__(*args, **kwargs)  # type: ignore[misc]
+        return obj._register_and_start()  # noqa: SLF001
+
+    @classmethod
+    def _start_supervised(
+        cls: type[A],
+        supervisor: ActorRef[Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ActorRef[A]:
+        """Start an actor that is restarted by the supervisor if it fails.
+
+        Internal method used by [`Supervisor`][pykka.Supervisor].
+        """
+        obj = cls.__new__(cls)
+        obj._actor_supervisor = supervisor  # noqa: SLF001
+        obj._actor_start_args = (args, kwargs)  # noqa: SLF001
+        obj.__init__(*args, **kwargs)  # type: ignore[misc]
+        return obj._register_and_start()  # noqa: SLF001
+
+    def _register_and_start(self: A) -> ActorRef[A]:
+        assert self.actor_ref is not None, (
             "Actor.__init__() have not been called. "
             "Did you forget to call super() in your override?"
         )
-        ActorRegistry.register(obj.actor_ref)
-        logger.debug(f"Starting {obj}")
-        obj._start_actor_loop()
-        return obj.actor_ref
+        ActorRegistry.register(self.actor_ref)
+        logger.debug(f"Starting {self}")
+        self._start_actor_loop()
+        return self.actor_ref
 
     @staticmethod
     @abc.abstractmethod
@@ -173,6 +229,13 @@ class Actor(abc.ABC):
 
     _actor_ref: ActorRef[Any]
 
+    # Set for actors started by a supervisor.
+    _actor_supervisor: ActorRef[Any] | None = None
+    _actor_start_args: tuple[tuple[Any, ...], dict[str, Any]] = ((), {})
+
+    # The failure of a supervised actor, until the supervisor has handled it.
+    _actor_failure: OptExcInfo | None = None
+
     @property
     def actor_ref(self: A) -> ActorRef[A]:
         """The actor's [`ActorRef`][pykka.ActorRef] instance."""
@@ -211,8 +274,12 @@ class Actor(abc.ABC):
         `__init__()` is called before the actor is started and registered
         in the [`ActorRegistry`][pykka.ActorRegistry].
         """
+        if "_actor_ref" in self.__dict__:
+            return  # The actor is being restarted, and keeps its identity.
         self.actor_urn = uuid.uuid4().urn
-        self.actor_inbox = self._create_actor_inbox()
+        if "actor_inbox" not in self.__dict__:
+            # Unless given an inbox by _start_with_inbox().
+            self.actor_inbox = self._create_actor_inbox()
         self.actor_stopped = threading.Event()
 
         self._actor_ref = ActorRef(self)
@@ -252,49 +319,158 @@ class Actor(abc.ABC):
             self.on_start()
         except Exception:  # noqa: BLE001
             self._handle_failure(*sys.exc_info())
+        self._recover()
 
     def _actor_loop_running(self) -> None:
         while not self.actor_stopped.is_set():
-            envelope = self.actor_inbox.get()
-            try:
-                response = self._handle_receive(envelope.message)
+            envelopes = self._get_envelopes()
+            self._handle_envelopes(envelopes)
+
+    def _get_envelopes(self) -> list[Envelope[Any]]:
+        """Take the next envelopes from the inbox, blocking until there is one.
+
+        Internal method for implementors of new actor types. The default
+        implementation takes a single envelope from the inbox.
+        """
+        return [self.actor_inbox.get()]
+
+    def _handle_envelopes(self, envelopes: list[Envelope[Any]]) -> None:
+        """Handle a batch of envelopes taken from the inbox, in order.
+
+        If the actor stops while handling the batch, the remaining envelopes
+        are rejected as if they were left in the inbox.
+
+        Internal method for implementors of new actor types.
+        """
+        use_batch_hook = type(self).on_receive_batch is not Actor.on_receive_batch
+        i = 0
+        while i < len(envelopes):
+            if self.actor_stopped.is_set():
+                for envelope in envelopes[i:]:
+                    self._reject_envelope(envelope)
+                return
+            if use_batch_hook and not isinstance(
+                envelopes[i].message, _INTERNAL_MESSAGE_TYPES
+            ):
+                j = i + 1
+                while j < len(envelopes) and not isinstance(
+                    envelopes[j].message, _INTERNAL_MESSAGE_TYPES
+                ):
+                    j += 1
+                self._handle_envelope_batch(envelopes[i:j])
+                i = j
+            else:
+                self._handle_envelope(envelopes[i])
+                i += 1
+
+    def _handle_envelope(self, envelope: Envelope[Any]) -> None:
+        """Handle a single envelope taken from the inbox.
+
+        Internal method for implementors of new actor types.
+        """
+        started = time.monotonic() if _metrics.enabled else None
+        span = (
+            _tracing.ReceiveSpan(self.actor_ref, [envelope])
+            if _tracing.tracers
+            else None
+        )
+        try:
+            response = self._handle_receive(envelope.message)
+            if envelope.reply_to is not None:
+                envelope.reply_to.set(response)
+        except Exception as exc:  # noqa: BLE001
+            if span is not None:
+                span.exception = exc
+            self._handle_receive_exception([envelope])
+        except BaseException as exc:  # noqa: BLE001
+            if span is not None:
+                span.exception = exc
+            self._handle_receive_base_exception()
+        if span is not None:
+            span.end()
+        if started is not None:
+            _metrics.record_handled(self, [envelope], started, time.monotonic())
+
+    def _handle_envelope_batch(self, envelopes: list[Envelope[Any]]) -> None:
+        """Handle a batch of regular messages with `on_receive_batch()`."""
+        started = time.monotonic() if _metrics.enabled else None
+        span = (
+            _tracing.ReceiveSpan(self.actor_ref, envelopes)
+            if _tracing.tracers
+            else None
+        )
+        try:
+            messages = [envelope.message for envelope in envelopes]
+            responses = self.on_receive_batch(messages)
+            if len(responses) != len(messages):
+                msg = (
+                    f"on_receive_batch() returned {len(responses)} responses "
+                    f"for {len(messages)} messages"
+                )
+                raise ValueError(msg)  # noqa: TRY301
+            for envelope, response in zip(envelopes, responses, strict=True):
                 if envelope.reply_to is not None:
                     envelope.reply_to.set(response)
-            except Exception:
-                if envelope.reply_to is not None:
-                    logger.info(
-                        f"Exception returned from {self} to caller:",
-                        exc_info=sys.exc_info(),
-                    )
-                    envelope.reply_to.set_exception()
-                else:
-                    self._handle_failure(*sys.exc_info())
-                    try:
-                        self.on_failure(*sys.exc_info())
-                    except Exception:  # noqa: BLE001
-                        self._handle_failure(*sys.exc_info())
-            except BaseException:  # noqa: BLE001
-                exception_value = sys.exc_info()[1]
-                logger.debug(f"{exception_value!r} in {self}. Stopping all actors.")
-                self._stop()
-                ActorRegistry.stop_all()
+        except Exception as exc:  # noqa: BLE001
+            if span is not None:
+                span.exception = exc
+            self._handle_receive_exception(envelopes)
+        except BaseException as exc:  # noqa: BLE001
+            if span is not None:
+                span.exception = exc
+            self._handle_receive_base_exception()
+        if span is not None:
+            span.end()
+        if started is not None:
+            _metrics.record_handled(self, envelopes, started, time.monotonic())
+
+    def _handle_receive_exception(self, envelopes: list[Envelope[Any]]) -> None:
+        """Return the exception being handled to the callers, or fail."""
+        exc_info = sys.exc_info()
+        reply_tos = [e.reply_to for e in envelopes if e.reply_to is not None]
+        if reply_tos:
+            logger.info(f"Exception returned from {self} to caller:", exc_info=exc_info)
+            for reply_to in reply_tos:
+                reply_to.set_exception(exc_info)
+        if len(reply_tos) < len(envelopes):
+            self._handle_failure(*exc_info)
+            try:
+                self.on_failure(*exc_info)
+            except Exception:  # noqa: BLE001
+                self._handle_failure(*sys.exc_info())
+            self._recover()
+
+    def _handle_receive_base_exception(self) -> None:
+        exception_value = sys.exc_info()[1]
+        logger.debug(f"{exception_value!r} in {self}. Stopping all actors.")
+        self._stop()
+        ActorRegistry.stop_all()
 
     def _actor_loop_teardown(self) -> None:
+        if isinstance(self.actor_inbox, BalancingInbox):
+            # The shared messages are left to any other actors sharing them.
+            for envelope in self.actor_inbox.detach():
+                self._reject_envelope(envelope)
+            return
         while not self.actor_inbox.empty():
-            envelope = self.actor_inbox.get()
-            if envelope.reply_to is not None:
-                if isinstance(envelope.message, messages._ActorStop):  # noqa: SLF001
-                    envelope.reply_to.set(None)
-                else:
-                    envelope.reply_to.set_exception(
-                        exc_info=(
-                            ActorDeadError,
-                            ActorDeadError(
-                                f"{self.actor_ref} stopped before handling the message"
-                            ),
-                            None,
-                        )
-                    )
+            self._reject_envelope(self.actor_inbox.get())
+
+    def _reject_envelope(self, envelope: Envelope[Any]) -> None:
+        """Reply to an envelope that arrived after the actor stopped."""
+        if envelope.reply_to is None:
+            return
+        if isinstance(envelope.message, messages._ActorStop):  # noqa: SLF001
+            envelope.reply_to.set(None)
+        else:
+            envelope.reply_to.set_exception(
+                exc_info=(
+                    ActorDeadError,
+                    ActorDeadError(
+                        f"{self.actor_ref} stopped before handling the message"
+                    ),
+                    None,
+                )
+            )
 
     def on_start(self) -> None:  # noqa: B027
         """Run code at the beginning of the actor's life.
@@ -337,14 +513,63 @@ class Actor(abc.ABC):
         exception_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
-        """Log unexpected failures, unregisters and stops the actor."""
+        """Log unexpected failures, unregisters and stops the actor.
+
+        Supervised actors are not stopped, but are left for `_recover()` to
+        hand over to the supervisor, unless they are already stopping.
+        """
         logger.error(
             f"Unhandled exception in {self}:",
             exc_info=(exception_type, exception_value, traceback),  # type: ignore[arg-type]   # ty: ignore[invalid-argument-type]
         )
+        if self._actor_supervisor is not None and not self.actor_stopped.is_set():
+            if self._actor_failure is None:
+                self._actor_failure = (exception_type, exception_value, traceback)
+            return
         ActorRegistry.unregister(self.actor_ref)
         self.actor_stopped.set()
 
+    def _recover(self) -> None:
+        """Ask the supervisor of a failed actor whether to restart it.
+
+        The actor is restarted in place, keeping its URN, ref, and inbox, with
+        any messages waiting in it. It is stopped if the supervisor gives up.
+        """
+        while (failure := self._actor_failure) is not None:
+            self._actor_failure = None
+            assert self._actor_supervisor is not None
+            try:
+                delay = self._actor_supervisor.ask(
+                    _ChildFailed(self.actor_ref, failure[1]), block=True
+                )
+            except ActorDeadError:
+                delay = None
+            if delay is None:
+                logger.debug(f"Not restarting {self}")
+                ActorRegistry.unregister(self.actor_ref)
+                self.actor_stopped.set()
+                return
+            self._restart(delay)
+
+    def _restart(self, delay: float) -> None:
+        """Replace the actor's state with a new one, keeping its identity."""
+        if delay > 0:
+            time.sleep(delay)
+        logger.debug(f"Restarting {self}")
+        kept = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name in _RESTART_KEPT_ATTRS
+        }
+        self.__dict__.clear()
+        self.__dict__.update(kept)
+        args, kwargs = self._actor_start_args
+        try:
+            type(self).__init__(self, *args, **kwargs)
+            self.on_start()
+        except Exception:  # noqa: BLE001
+            self._handle_failure(*sys.exc_info())
+
     def on_failure(  # noqa: B027
         self,
         exception_type: type[BaseException] | None,
@@ -372,6 +597,8 @@ class Actor(abc.ABC):
         """Handle messages sent to the actor."""
         if isinstance(message, messages._ActorStop):  # noqa: SLF001
             return self._stop()
+        if isinstance(message, messages._ActorRestart):  # noqa: SLF001
+            return self._restart_sibling(message.delay)
         if isinstance(message, messages.ProxyCall):
             callee = get_attr_directly(self, message.attr_path)
             return callee(*message.args, **message.kwargs)
@@ -384,6 +611,15 @@ class Actor(abc.ABC):
             return setattr(parent_attr, attr_name, message.value)
         return self.on_receive(message)
 
+    def _restart_sibling(self, delay: float) -> None:
+        """Restart an actor whose sibling failed, by the one-for-all strategy."""
+        try:
+            self.on_stop()
+        except Exception:
+            logger.exception(f"Exception in on_stop() of {self} before restart:")
+        self._restart(delay)
+        self._recover()
+
     def on_receive(self, message: Any) -> Any:
         """May be implemented for the actor to handle regular non-proxy messages.
 
@@ -395,3 +631,50 @@ class Actor(abc.ABC):
 
         """
         logger.warning(f"Unexpected message received by {self}: {message}")
+
+    def on_receive_batch(self, messages: list[Any]) -> list[Any]:
+        """May be implemented for the actor to handle a batch of messages at once.
+
+        If implemented, this method is called instead of
+        [`on_receive()`][pykka.Actor.on_receive] with consecutive regular
+        messages that the runtime has taken from the inbox at once. Proxy
+        messages are still handled one by one, in order. How many messages
+        each batch contains depends on the runtime and its configuration, e.g.
+        [`ThreadingActor.inbox_batch_size`][pykka.ThreadingActor.inbox_batch_size].
+
+        If an exception is raised, it is returned to all callers in the batch
+        that are waiting for a reply. If any of the messages were sent without
+        waiting for a reply, the actor fails as if
+        [`on_receive()`][pykka.Actor.on_receive] had raised the exception.
+
+        Args:
+            messages: the messages to handle, in the order they were received
+
+        Returns:
+            a list with one reply for each message, in the same order
+
+        /// note | Version added: Pykka 4.5
+        ///
+
+        """
+        return [self.on_receive(message) for message in messages]
+
+
+_INTERNAL_MESSAGE_TYPES = (
+    messages._ActorStop,  # noqa: SLF001
+    messages._ActorRestart,  # noqa: SLF001
+    messages.ProxyCall,
+    messages.ProxyGetAttr,
+    messages.ProxySetAttr,
+)
+
+_RESTART_KEPT_ATTRS = frozenset(
+    {
+        "actor_urn",
+        "actor_inbox",
+        "actor_stopped",
+        "_actor_ref",
+        "_actor_supervisor",
+        "_actor_start_args",
+    }
+)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
+
+from pykka import Actor, Future, ThreadingFuture
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    from collections.abc import Generator
+
+    from pykka._actor import ActorInbox
+    from pykka._envelope import Envelope
+
+__all__ = ["AsyncioActor", "AsyncioFuture"]
+
+
+T = TypeVar("T")
+
+
+def _wake_waiter(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncioFuture(ThreadingFuture[T]):
+    """Implementation of [`Future`][pykka.Future] for use with `asyncio`.
+
+    The future can be used from both regular threads and coroutines. Calling
+    [`get()`][pykka.Future.get] blocks the calling thread, just like
+    [`ThreadingFuture`][pykka.ThreadingFuture]. Awaiting the future suspends
+    the calling coroutine without blocking the event loop.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    def __await__(self) -> Generator[Any, None, T]:
+        if self._result is None and self._get_hook is None:
+            loop = asyncio.get_running_loop()
+            waiter: asyncio.Future[None] = loop.create_future()
+
+            def wake(_: Future[T]) -> None:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(_wake_waiter, waiter)
+
+            self.add_done_callback(wake)
+            yield from waiter
+        value: T = self.get()
+        return value
+
+    __iter__ = __await__
+
+
+class AsyncioInbox:
+    """Actor inbox that can be awaited from an event loop.
+
+    Envelopes may be put into the inbox from any thread. Only the actor's own
+    task takes envelopes out of it.
+    """
+
+    def __init__(self) -> None:
+        self._envelopes: collections.deque[Envelope[Any]] = collections.deque()
+        self._lock = threading.Lock()
+        self._waiter: asyncio.Future[None] | None = None
+
+    def put(
+        self,
+        envelope: Envelope[Any],
+        /,
+        *,
+        timeout: float | None = None,  # noqa: ARG002
+    ) -> None:
+        with self._lock:
+            self._envelopes.append(envelope)
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            waiter.get_loop().call_soon_threadsafe(_wake_waiter, waiter)
+
+    def get(self) -> Envelope[Any]:
+        with self._lock:
+            if not self._envelopes:
+                raise queue.Empty
+            return self._envelopes.popleft()
+
+    def empty(self) -> bool:
+        return not self._envelopes
+
+    def qsize(self) -> int:
+        return len(self._envelopes)
+
+    async def get_async(self) -> Envelope[Any]:
+        while True:
+            with self._lock:
+                if self._envelopes:
+                    return self._envelopes.popleft()
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiter = waiter
+            await waiter
+
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop  # noqa: PLW0603
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="AsyncioActorLoop",
+                daemon=True,
+            )
+            thread.start()
+            _background_loop = loop
+        return _background_loop
+
+
+class AsyncioActor(Actor):
+    """Implementation of [`Actor`][pykka.Actor] running as `asyncio` tasks.
+
+    Each actor runs as a task on an event loop instead of on a thread of its
+    own, which makes it cheap to have a large number of mostly idle actors.
+
+    If [`Actor.start()`][pykka.Actor.start] is called from a coroutine, the
+    actor runs on the event loop of that coroutine, unless
+    [`event_loop`][pykka.AsyncioActor.event_loop] is set. Otherwise, the actor
+    runs on a shared event loop in a background daemon thread.
+
+    The actor's hooks and message handlers are regular functions executed on
+    the event loop. They must not block, as that blocks all other actors on
+    the same event loop. In particular, they must not call
+    [`Future.get()`][pykka.Future.get] on futures from other actors on the same
+    event loop, as that will deadlock.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    event_loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+    """
+    The event loop to run the actor on. This must be set before
+    [`Actor.start()`][pykka.Actor.start] is called.
+
+    If `None`, the default, the running event loop or a shared background
+    event loop is used.
+    """
+
+    _actor_tasks: ClassVar[set[concurrent.futures.Future[None]]] = set()
+
+    @staticmethod
+    def _create_actor_inbox() -> ActorInbox:
+        return AsyncioInbox()
+
+    @staticmethod
+    def _create_future() -> Future[Any]:
+        return AsyncioFuture()
+
+    def _start_actor_loop(self) -> None:
+        loop = self.event_loop
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = _get_background_loop()
+        task = asyncio.run_coroutine_threadsafe(self._async_actor_loop(), loop)
+        self._actor_tasks.add(task)
+        task.add_done_callback(self._actor_tasks.discard)
+
+    async def _async_actor_loop(self) -> None:
+        """Run the actor's core loop as a coroutine."""
+        inbox = cast("AsyncioInbox", self.actor_inbox)
+        self._actor_loop_setup()
+        while not self.actor_stopped.is_set():
+            envelope = await inbox.get_async()
+            self._handle_envelope(envelope)
+        self._actor_loop_teardown()
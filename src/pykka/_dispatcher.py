@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import collections
+import os
+import queue
+import threading
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pykka import Actor
+    from pykka._envelope import Envelope
+
+__all__ = ["ThreadPoolDispatcher"]
+
+
+class ThreadPoolDispatcher:
+    """Runs actors on a fixed-size pool of shared worker threads.
+
+    By default, each [`ThreadingActor`][pykka.ThreadingActor] runs on a thread
+    of its own. By setting the actor's
+    [`dispatcher`][pykka.ThreadingActor.dispatcher] attribute to a
+    [`ThreadPoolDispatcher`][pykka.ThreadPoolDispatcher], the actor is instead
+    run on one of the dispatcher's worker threads, but only while it has
+    messages in its inbox. Thus, a large number of actors can share a small
+    number of threads.
+
+    Example:
+        ```py
+        import pykka
+
+        dispatcher = pykka.ThreadPoolDispatcher(max_workers=8)
+
+        class MyActor(pykka.ThreadingActor):
+            dispatcher = dispatcher
+        ```
+
+    An actor processes at most `throughput` messages before giving the worker
+    thread back to the dispatcher, so that other actors get their turn. Each
+    actor still processes one message at a time, in the order they were
+    received.
+
+    /// warning | Blocking
+    If an actor blocks a worker thread, e.g. by calling
+    [`Future.get()`][pykka.Future.get] to wait for another actor on the
+    same dispatcher, the dispatcher may run out of worker threads and
+    deadlock. Keep the number of blocking calls in pooled actors low, or
+    size the pool accordingly.
+    ///
+
+    The worker threads are daemon threads. Thus, the program may exit while
+    actors still have unprocessed messages and before
+    [`Actor.on_stop()`][pykka.Actor.on_stop] is called.
+
+    Args:
+        max_workers: the maximum number of worker threads. Defaults to the
+            number of CPUs plus four, capped at 32.
+        throughput: the maximum number of messages an actor processes before
+            giving the worker thread back to the dispatcher.
+
+    /// note | Version added: Pykka 4.5
+    ///
+
+    """
+
+    max_workers: int
+    """The maximum number of worker threads."""
+
+    throughput: int
+    """The maximum number of messages an actor processes per turn."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        throughput: int = 5,
+    ) -> None:
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers < 1:
+            msg = "max_workers must be at least 1"
+            raise ValueError(msg)
+        if throughput < 1:
+            msg = "throughput must be at least 1"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self.throughput = throughput
+        self._runnable: queue.SimpleQueue[DispatchedInbox] = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<ThreadPoolDispatcher max_workers={self.max_workers} "
+            f"throughput={self.throughput}>"
+        )
+
+    def _schedule(self, inbox: DispatchedInbox) -> None:
+        if len(self._workers) < self.max_workers:
+            self._start_workers()
+        self._runnable.put(inbox)
+
+    def _start_workers(self) -> None:
+        with self._workers_lock:
+            while len(self._workers) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"ThreadPoolDispatcher-{next(_worker_thread_counter)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._workers.append(thread)
+
+    def _work(self) -> None:
+        while True:
+            inbox = self._runnable.get()
+            inbox._run()  # noqa: SLF001
+
+
+_worker_thread_counter = count(0)
+
+
+class DispatchedInbox:
+    """Actor inbox that schedules its actor on a dispatcher when it gets mail.
+
+    This is an internal type and is not part of the public API.
+    """
+
+    def __init__(self, dispatcher: ThreadPoolDispatcher) -> None:
+        self._dispatcher = dispatcher
+        self._envelopes: collections.deque[Envelope[Any]] = collections.deque()
+        self._lock = threading.Lock()
+        self._actor: Actor | None = None
+        self._started = False
+        # The inbox is marked as scheduled until an actor is attached, so that
+        # messages put into the inbox before the actor starts don't schedule it.
+        self._scheduled = True
+
+    def put(
+        self,
+        envelope: Envelope[Any],
+        /,
+        *,
+        timeout: float | None = None,  # noqa: ARG002
+    ) -> None:
+        with self._lock:
+            self._envelopes.append(envelope)
+            schedule = not self._scheduled
+            self._scheduled = True
+        if schedule:
+            self._dispatcher._schedule(self)  # noqa: SLF001
+
+    def get(self) -> Envelope[Any]:
+        with self._lock:
+            if not self._envelopes:
+                raise queue.Empty
+            return self._envelopes.popleft()
+
+    def empty(self) -> bool:
+        return not self._envelopes
+
+    def qsize(self) -> int:
+        return len(self._envelopes)
+
+    def attach(self, actor: Actor) -> None:
+        """Attach the actor and schedule it to run its startup hook."""
+        self._actor = actor
+        self._dispatcher._schedule(self)  # noqa: SLF001
+
+    def _run(self) -> None:
+        actor = self._actor
+        assert actor is not None
+
+        if not self._started:
+            self._started = True
+            actor._actor_loop_setup()  # noqa: SLF001
+
+        if not actor.actor_stopped.is_set():
+            with self._lock:
+                envelopes = [
+                    self._envelopes.popleft()
+                    for _ in range(
+                        min(self._dispatcher.throughput, len(self._envelopes))
+                    )
+                ]
+            actor._handle_envelopes(envelopes)  # noqa: SLF001
+
+        if actor.actor_stopped.is_set():
+            # The inbox stays marked as scheduled, so that the actor is never
+            # scheduled again.
+            actor._actor_loop_teardown()  # noqa: SLF001
+            return
+
+        with self._lock:
+            reschedule = bool(self._envelopes)
+            self._scheduled = reschedule
+        if reschedule:
+            self._dispatcher._schedule(self)  # noqa: SLF001
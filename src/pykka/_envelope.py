@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
     from pykka import Future
+    from pykka._tracing import SpanContext
 
 
 T = TypeVar("T")
@@ -16,7 +17,7 @@ class Envelope(Generic[T]):
     """
 
     # Using slots speeds up envelope creation with ~20%
-    __slots__ = ["message", "reply_to"]
+    __slots__ = ["enqueued_at", "message", "reply_to", "trace_context"]
 
     message: T
     """The message to send."""
@@ -24,9 +25,24 @@ class Envelope(Generic[T]):
     reply_to: Future[Any] | None
     """The future to reply to if there is a response."""
 
-    def __init__(self, message: T, reply_to: Future[Any] | None = None) -> None:
+    enqueued_at: float | None
+    """The [`time.monotonic()`][time.monotonic] time the envelope was sent,
+    if metrics or tracing are enabled."""
+
+    trace_context: SpanContext | None
+    """The span context of the message, if tracing is enabled."""
+
+    def __init__(
+        self,
+        message: T,
+        reply_to: Future[Any] | None = None,
+        enqueued_at: float | None = None,
+        trace_context: SpanContext | None = None,
+    ) -> None:
         self.message = message
         self.reply_to = reply_to
+        self.enqueued_at = enqueued_at
+        self.trace_context = trace_context
 
     def __repr__(self) -> str:
         return f"Envelope(message={self.message!r}, reply_to={self.reply_to!r})"
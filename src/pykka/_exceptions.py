@@ -1,9 +1,17 @@
-__all__ = ["ActorDeadError", "Timeout"]
+__all__ = ["ActorDeadError", "MailboxFull", "Timeout"]
 
 
 class ActorDeadError(Exception):
     """Exception raised when trying to use a dead or unavailable actor."""
 
 
+class MailboxFull(Exception):  # noqa: N818
+    """Exception raised when a message doesn't fit in a bounded actor inbox.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+
 class Timeout(Exception):  # noqa: N818
     """Exception raised at future timeout."""
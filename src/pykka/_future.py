@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import functools
-from collections.abc import Callable, Generator, Iterable
+import queue
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator
 from typing import TYPE_CHECKING, Any, Generic, TypeAlias, TypeVar, cast
 
+from pykka._exceptions import Timeout
+
 if TYPE_CHECKING:
     from pykka._types import OptExcInfo
 
-__all__ = ["Future", "get_all"]
+__all__ = [
+    "ALL_COMPLETED",
+    "FIRST_COMPLETED",
+    "Future",
+    "as_completed",
+    "get_all",
+    "wait",
+]
 
 
 T = TypeVar("T")
@@ -148,6 +160,38 @@ class Future(Generic[T]):
         """
         self._get_hook = func
 
+    def add_done_callback(
+        self,
+        func: Callable[[Future[T]], None],
+    ) -> None:
+        """Add a function to be called when the future's value is set.
+
+        The function is called with the future as its only argument, when
+        [`set()`][pykka.Future.set] or
+        [`set_exception()`][pykka.Future.set_exception] is called. If the
+        future already has a value, the function is called immediately.
+        Functions are called in the order they were added.
+
+        The function is called in the thread that sets the value, which
+        typically is the thread of the actor replying to a message. Thus, the
+        function should be quick and must not block. If the function raises an
+        exception, it is logged and ignored.
+
+        If the future has a get hook, the function is called when
+        [`get()`][pykka.Future.get] first evaluates the get hook.
+
+        Use [`get()`][pykka.Future.get] with `timeout=0` to get the value from
+        within the function.
+
+        Args:
+            func: callable accepting the future as its only argument
+
+        /// note | Version added: Pykka 4.5
+        ///
+
+        """
+        raise NotImplementedError
+
     def filter(
         self: Future[Iterable[J]],
         func: Callable[[J], bool],
@@ -177,11 +221,26 @@ class Future(Generic[T]):
         /// note | Version added: Pykka 1.2
         ///
 
+        /// note | Version changed: Pykka 4.5
+        The new future's value is computed as soon as this future's value is
+        set, using [`add_done_callback()`][pykka.Future.add_done_callback],
+        instead of when [`get()`][pykka.Future.get] is called on the new
+        future. Futures with a get hook are still computed on
+        [`get()`][pykka.Future.get].
+        ///
+
         """
         future = self.__class__()
-        future.set_get_hook(
-            lambda timeout: list(filter(func, self.get(timeout=timeout)))
-        )
+        if self._get_hook is not None:
+            future.set_get_hook(
+                lambda timeout: list(filter(func, self.get(timeout=timeout)))
+            )
+        else:
+            self.add_done_callback(
+                lambda _: _set_from(
+                    future, lambda: list(filter(func, self.get(timeout=0)))
+                )
+            )
         return future
 
     def join(
@@ -210,11 +269,36 @@ class Future(Generic[T]):
         /// note | Version added: Pykka 1.2
         ///
 
+        /// note | Version changed: Pykka 4.5
+        The new future's value is computed as soon as this future's value is
+        set, using [`add_done_callback()`][pykka.Future.add_done_callback],
+        instead of when [`get()`][pykka.Future.get] is called on the new
+        future. Futures with a get hook are still computed on
+        [`get()`][pykka.Future.get].
+        ///
+
         """
         future = cast("Future[Iterable[Any]]", self.__class__())
-        future.set_get_hook(
-            lambda timeout: [f.get(timeout=timeout) for f in [self, *futures]]
-        )
+        all_futures = [self, *futures]
+        if any(f._get_hook is not None for f in all_futures):  # noqa: SLF001
+            future.set_get_hook(
+                lambda timeout: [f.get(timeout=timeout) for f in all_futures]
+            )
+            return future
+
+        lock = threading.Lock()
+        remaining = len(all_futures)
+
+        def on_done(_: Future[Any]) -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                if remaining > 0:
+                    return
+            _set_from(future, lambda: [f.get(timeout=0) for f in all_futures])
+
+        for f in all_futures:
+            f.add_done_callback(on_done)
         return future
 
     def map(
@@ -252,9 +336,22 @@ class Future(Generic[T]):
         value is passed to the function.
         ///
 
+        /// note | Version changed: Pykka 4.5
+        The new future's value is computed as soon as this future's value is
+        set, using [`add_done_callback()`][pykka.Future.add_done_callback],
+        instead of when [`get()`][pykka.Future.get] is called on the new
+        future. Futures with a get hook are still computed on
+        [`get()`][pykka.Future.get].
+        ///
+
         """
         future = cast("Future[M]", self.__class__())
-        future.set_get_hook(lambda timeout: func(self.get(timeout=timeout)))
+        if self._get_hook is not None:
+            future.set_get_hook(lambda timeout: func(self.get(timeout=timeout)))
+        else:
+            self.add_done_callback(
+                lambda _: _set_from(future, lambda: func(self.get(timeout=0)))
+            )
         return future
 
     def reduce(
@@ -310,11 +407,27 @@ class Future(Generic[T]):
         /// note | Version added: Pykka 1.2
         ///
 
+        /// note | Version changed: Pykka 4.5
+        The new future's value is computed as soon as this future's value is
+        set, using [`add_done_callback()`][pykka.Future.add_done_callback],
+        instead of when [`get()`][pykka.Future.get] is called on the new
+        future. Futures with a get hook are still computed on
+        [`get()`][pykka.Future.get].
+        ///
+
         """
         future = cast("Future[R]", self.__class__())
-        future.set_get_hook(
-            lambda timeout: functools.reduce(func, self.get(timeout=timeout), *args)
-        )
+        if self._get_hook is not None:
+            future.set_get_hook(
+                lambda timeout: functools.reduce(func, self.get(timeout=timeout), *args)
+            )
+        else:
+            self.add_done_callback(
+                lambda _: _set_from(
+                    future,
+                    lambda: functools.reduce(func, self.get(timeout=0), *args),
+                )
+            )
         return future
 
     def __await__(self) -> Generator[None, None, T]:
@@ -325,6 +438,16 @@ class Future(Generic[T]):
     __iter__ = __await__
 
 
+def _set_from(future: Future[Any], func: Callable[[], Any]) -> None:
+    """Set the return value or exception from calling `func` on `future`."""
+    try:
+        value = func()
+    except Exception:  # noqa: BLE001
+        future.set_exception()
+    else:
+        future.set(value)
+
+
 def get_all(
     futures: Iterable[Future[T]],
     *,
@@ -332,8 +455,9 @@ def get_all(
 ) -> Iterable[T]:
     """Collect all values encapsulated in the list of futures.
 
-    If `timeout` is not `None`, the method will wait for a reply for
-    `timeout` seconds, and then raise [`pykka.Timeout`][pykka.Timeout].
+    If `timeout` is not `None`, the method will wait for the replies for up to
+    `timeout` seconds in total, and then raise
+    [`pykka.Timeout`][pykka.Timeout].
 
     Args:
         futures: futures for the results to collect
@@ -345,5 +469,147 @@ def get_all(
     Returns:
         list of results
 
+    /// note | Version changed: Pykka 4.5
+    Previously, `timeout` was applied to each future in turn, so that the
+    total time spent waiting could be many times `timeout`.
+    ///
+
+    """
+    deadline = _get_deadline(timeout)
+    return [future.get(timeout=_get_remaining(deadline)) for future in futures]
+
+
+FIRST_COMPLETED = "FIRST_COMPLETED"
+"""Make [`wait()`][pykka.wait] return when any future completes."""
+
+ALL_COMPLETED = "ALL_COMPLETED"
+"""Make [`wait()`][pykka.wait] return when all futures have completed."""
+
+
+def wait(
+    futures: Iterable[Future[T]],
+    *,
+    timeout: float | None = None,
+    return_when: str = ALL_COMPLETED,
+) -> tuple[set[Future[T]], set[Future[T]]]:
+    """Wait for the futures to complete.
+
+    The calling thread blocks on a single waiter, which is woken by the
+    futures' done callbacks, regardless of the number of futures.
+
+    Unlike [`get_all()`][pykka.get_all], `wait()` does not raise
+    [`pykka.Timeout`][pykka.Timeout] if `timeout` is reached. Instead, the
+    futures that have not completed are returned.
+
+    A future with a get hook is considered completed, as its value is
+    computed when [`get()`][pykka.Future.get] is called.
+
+    Args:
+        futures: futures to wait for
+        timeout: seconds to wait in total, or `None` to wait forever
+        return_when: [`FIRST_COMPLETED`][pykka.FIRST_COMPLETED] to return as
+            soon as any future completes, or
+            [`ALL_COMPLETED`][pykka.ALL_COMPLETED] to wait for all futures
+
+    Raises:
+        ValueError: if `return_when` is not a valid value
+
+    Returns:
+        a tuple of the set of completed futures and the set of futures that
+        have not completed
+
+    /// note | Version added: Pykka 4.5
+    ///
+
+    """
+    if return_when not in (FIRST_COMPLETED, ALL_COMPLETED):
+        msg = f"Invalid return_when value: {return_when!r}"
+        raise ValueError(msg)
+
+    pending = dict.fromkeys(futures)
+    completed = _get_completion_queue(pending)
+    deadline = _get_deadline(timeout)
+    done: set[Future[T]] = set()
+
+    while len(done) < len(pending):
+        if return_when == FIRST_COMPLETED and done:
+            break
+        try:
+            done.add(completed.get(timeout=_get_remaining(deadline)))
+        except queue.Empty:
+            break
+
+    # Include futures that completed while we were collecting the results.
+    while not completed.empty():
+        done.add(completed.get_nowait())
+
+    return done, set(pending) - done
+
+
+def as_completed(
+    futures: Iterable[Future[T]],
+    *,
+    timeout: float | None = None,
+) -> Iterator[Future[T]]:
+    """Iterate over the futures as they complete.
+
+    The futures are yielded in the order they complete. Duplicate futures are
+    only yielded once.
+
+    A future with a get hook is considered completed, as its value is
+    computed when [`get()`][pykka.Future.get] is called.
+
+    Example:
+        ```py
+        futures = [ref.ask("work", block=False) for ref in refs]
+        for future in pykka.as_completed(futures, timeout=10):
+            print(future.get())
+        ```
+
+    Args:
+        futures: futures to iterate over
+        timeout: seconds to wait in total, or `None` to wait forever
+
+    Raises:
+        pykka.Timeout: if not all futures have completed within `timeout`
+            seconds
+
+    /// note | Version added: Pykka 4.5
+    ///
+
     """
-    return [future.get(timeout=timeout) for future in futures]
+    pending = dict.fromkeys(futures)
+    completed = _get_completion_queue(pending)
+    deadline = _get_deadline(timeout)
+
+    try:
+        for _ in range(len(pending)):
+            yield completed.get(timeout=_get_remaining(deadline))
+    except queue.Empty:
+        msg = f"{timeout} seconds"
+        raise Timeout(msg) from None
+
+
+def _get_completion_queue(
+    futures: Iterable[Future[T]],
+) -> queue.SimpleQueue[Future[T]]:
+    """Return a queue that each future is put into when it completes."""
+    completed: queue.SimpleQueue[Future[T]] = queue.SimpleQueue()
+    for future in futures:
+        if future._get_hook is not None:  # noqa: SLF001
+            completed.put(future)
+        else:
+            future.add_done_callback(completed.put)
+    return completed
+
+
+def _get_deadline(timeout: float | None) -> float | None:
+    if timeout is None:
+        return None
+    return time.monotonic() + timeout
+
+
+def _get_remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
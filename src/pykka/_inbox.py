@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import collections
+import heapq
+import itertools
+import logging
+import queue
+from typing import TYPE_CHECKING, Any, get_args
+
+from pykka._exceptions import MailboxFull
+from pykka._types import OverflowPolicy
+from pykka.messages import _ActorStop
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pykka._envelope import Envelope
+    from pykka._types import OptExcInfo
+
+
+logger = logging.getLogger("pykka")
+
+
+class QueueInbox(queue.Queue["Envelope[Any]"]):
+    """Actor inbox based on [`queue.Queue`][queue.Queue].
+
+    If `maxsize` is greater than zero, the inbox is bounded, and
+    `overflow_policy` decides what happens when a message is put into a full
+    inbox. Requests to stop the actor are always accepted, even if the inbox
+    is full.
+
+    This is an internal type and is not part of the public API.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        *,
+        overflow_policy: OverflowPolicy = "block",
+        put_timeout: float | None = None,
+    ) -> None:
+        if overflow_policy not in get_args(OverflowPolicy):
+            msg = f"Unknown inbox overflow policy: {overflow_policy!r}"
+            raise ValueError(msg)
+        super().__init__(maxsize)
+        self.overflow_policy = overflow_policy
+        self.put_timeout = put_timeout
+
+    def put(
+        self,
+        item: Envelope[Any],
+        block: bool = True,  # noqa: FBT001, FBT002
+        timeout: float | None = None,
+    ) -> None:
+        if self.maxsize <= 0:
+            super().put(item, block=block, timeout=timeout)
+        elif isinstance(item.message, _ActorStop):
+            self._put_unbounded(item)
+        elif self.overflow_policy == "drop_oldest":
+            self._put_dropping_oldest(item)
+        else:
+            if self.overflow_policy == "block":
+                timeout = self.put_timeout if timeout is None else timeout
+            else:
+                block = False
+            try:
+                super().put(item, block=block, timeout=timeout)
+            except queue.Full:
+                if self.overflow_policy == "drop_newest":
+                    self._drop(item)
+                else:
+                    raise MailboxFull(self._full_message()) from None
+
+    def _put_unbounded(self, item: Envelope[Any]) -> None:
+        with self.mutex:
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def _put_dropping_oldest(self, item: Envelope[Any]) -> None:
+        with self.mutex:
+            dropped = None
+            if self._qsize() >= self.maxsize:
+                # Never drop requests to stop the actor.
+                if isinstance(self.queue[0].message, _ActorStop):
+                    dropped = item
+                else:
+                    dropped = self._get()
+            if dropped is not item:
+                self._put(item)
+                if dropped is None:
+                    self.unfinished_tasks += 1
+                self.not_empty.notify()
+        if dropped is not None:
+            self._drop(dropped)
+
+    def _full_message(self) -> str:
+        return f"Inbox is full, with {self.maxsize} messages"
+
+    def _drop(self, envelope: Envelope[Any]) -> None:
+        logger.debug(f"Dropped message from full inbox: {envelope.message!r}")
+        if envelope.reply_to is not None:
+            exc_info: OptExcInfo = (
+                MailboxFull,
+                MailboxFull(f"{self._full_message()}; the message was dropped"),
+                None,
+            )
+            envelope.reply_to.set_exception(exc_info)
+
+    def get_batch(self, max_items: int) -> list[Envelope[Any]]:
+        """Take up to `max_items` envelopes, blocking until there is one.
+
+        All envelopes are taken while holding the queue's lock once, instead of
+        once per envelope.
+        """
+        with self.not_empty:
+            while not self._qsize():
+                self.not_empty.wait()
+            envelopes = [self._get() for _ in range(min(max_items, self._qsize()))]
+            self.not_full.notify(len(envelopes))
+            return envelopes
+
+
+class PriorityInbox(QueueInbox):
+    """Actor inbox that hands out the most urgent envelopes first.
+
+    Requests to stop the actor are put in a separate lane that is always
+    emptied first. Other messages are ordered by the value returned by
+    `priority_key`, lowest first, and in the order they were put into the
+    inbox if they have the same priority.
+
+    This is an internal type and is not part of the public API.
+    """
+
+    queue: list[tuple[int, Any, int, Envelope[Any]]]
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        *,
+        priority_key: Callable[[Any], Any] | None = None,
+        overflow_policy: OverflowPolicy = "block",
+        put_timeout: float | None = None,
+    ) -> None:
+        if overflow_policy == "drop_oldest":
+            msg = "The drop_oldest overflow policy is not supported by priority inboxes"
+            raise ValueError(msg)
+        super().__init__(
+            maxsize,
+            overflow_policy=overflow_policy,
+            put_timeout=put_timeout,
+        )
+        self.priority_key = priority_key
+        self._counter = itertools.count()
+
+    def _init(self, maxsize: int) -> None:  # noqa: ARG002
+        self.queue = []
+
+    def _qsize(self) -> int:
+        return len(self.queue)
+
+    def _put(self, item: Envelope[Any]) -> None:
+        if isinstance(item.message, _ActorStop):
+            entry = (0, 0, next(self._counter), item)
+        elif self.priority_key is None:
+            entry = (1, 0, next(self._counter), item)
+        else:
+            entry = (1, self.priority_key(item.message), next(self._counter), item)
+        heapq.heappush(self.queue, entry)
+
+    def _get(self) -> Envelope[Any]:
+        return heapq.heappop(self.queue)[-1]
+
+
+class SimpleQueueInbox(queue.SimpleQueue["Envelope[Any]"]):
+    """Actor inbox based on [`queue.SimpleQueue`][queue.SimpleQueue].
+
+    This is an internal type and is not part of the public API.
+    """
+
+    def get_batch(self, max_items: int) -> list[Envelope[Any]]:
+        """Take up to `max_items` envelopes, blocking until there is one."""
+        envelopes = [self.get()]
+        try:
+            while len(envelopes) < max_items:
+                envelopes.append(self.get_nowait())
+        except queue.Empty:
+            pass
+        return envelopes
+
+
+class SharedInbox:
+    """Queue of envelopes shared by the actors of a balancing pool.
+
+    Each actor sharing the queue gets a `BalancingInbox` of its own from
+    `create_inbox()`, which it takes envelopes from.
+
+    This is an internal type and is not part of the public API.
+    """
+
+    def __init__(self, inbox: QueueInbox) -> None:
+        self.queue = inbox
+        self.consumers = 0
+        self.taken = 0
+
+    def create_inbox(self) -> BalancingInbox:
+        """Create an inbox for one more actor sharing the queue."""
+        with self.queue.mutex:
+            self.consumers += 1
+        return BalancingInbox(self)
+
+
+class BalancingInbox:
+    """Inbox of one of the actors sharing a `SharedInbox`.
+
+    Messages put into the inbox go to the shared queue, and are taken by
+    whichever actor sharing the queue is idle first. Requests to stop the
+    actor are put in a lane of its own instead, so that they stop the actor
+    whose inbox they were put into. A request to stop is taken from the lane
+    once the messages put into the shared queue before it have been taken.
+
+    This is an internal type and is not part of the public API.
+    """
+
+    def __init__(self, shared: SharedInbox) -> None:
+        self.shared = shared
+        # Requests to stop, with the number of shared envelopes to take first.
+        self._lane: collections.deque[tuple[int, Envelope[Any]]] = collections.deque()
+
+    def put(
+        self,
+        envelope: Envelope[Any],
+        /,
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        inbox = self.shared.queue
+        if not isinstance(envelope.message, _ActorStop):
+            inbox.put(envelope, timeout=timeout)
+            return
+        with inbox.mutex:
+            position = self.shared.taken + inbox._qsize()  # noqa: SLF001
+            self._lane.append((position, envelope))
+            # Wake all the actors, as we don't know which one is ours.
+            inbox.not_empty.notify_all()
+
+    def get(self) -> Envelope[Any]:
+        inbox = self.shared.queue
+        with inbox.not_empty:
+            while not self._lane and not inbox._qsize():  # noqa: SLF001
+                inbox.not_empty.wait()
+            if self._lane and (
+                self._lane[0][0] <= self.shared.taken or not inbox._qsize()  # noqa: SLF001
+            ):
+                if inbox._qsize():  # noqa: SLF001
+                    # We may have been woken up instead of another actor that
+                    # could have taken the shared envelope.
+                    inbox.not_empty.notify()
+                return self._lane.popleft()[1]
+            self.shared.taken += 1
+            envelope = inbox._get()  # noqa: SLF001
+            inbox.not_full.notify()
+            return envelope
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def qsize(self) -> int:
+        inbox = self.shared.queue
+        with inbox.mutex:
+            return len(self._lane) + inbox._qsize()  # noqa: SLF001
+
+    def detach(self) -> list[Envelope[Any]]:
+        """Stop sharing the queue, and return the envelopes left to reject.
+
+        These are the envelopes in the actor's own lane, and, if this was the
+        last actor sharing the queue, the envelopes in the shared queue.
+        """
+        inbox = self.shared.queue
+        with inbox.mutex:
+            self.shared.consumers -= 1
+            envelopes = [envelope for _, envelope in self._lane]
+            self._lane.clear()
+            if self.shared.consumers == 0:
+                while inbox._qsize():  # noqa: SLF001
+                    envelopes.append(inbox._get())  # noqa: SLF001
+                inbox.not_full.notify_all()
+            return envelopes
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import logging
+import weakref
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pykka import ActorProxy
     from pykka._types import AttrPath
 
@@ -15,6 +18,19 @@ class AttrInfo(NamedTuple):
     traversable: bool
 
 
+class _ClassAttrs(NamedTuple):
+    class_dict: dict[str, Any]
+    attrs: dict[AttrPath, AttrInfo]
+
+
+# Introspection results for the attributes defined on each actor class. The
+# results are reused as long as the class' attributes are the same objects,
+# so that e.g. mocking a method on the class is picked up.
+_class_attrs_cache: weakref.WeakKeyDictionary[type, _ClassAttrs] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def introspect_attrs(
     *,
     root: Any,
@@ -22,7 +38,22 @@ def introspect_attrs(
 ) -> dict[AttrPath, AttrInfo]:
     """Introspects the actor's attributes."""
     result: dict[AttrPath, AttrInfo] = {}
-    attr_paths_to_visit: list[AttrPath] = [(attr_name,) for attr_name in dir(root)]
+    attr_paths_to_visit: list[AttrPath] = []
+
+    # Attributes defined on the class are introspected once per class. Only
+    # the instance's own attributes, which may shadow the class' attributes,
+    # and the attributes of traversable objects are introspected every time.
+    instance_dict = getattr(root, "__dict__", {})
+    for attr_path, attr_info in _get_class_attrs(root.__class__).items():
+        if attr_path[0] in instance_dict:
+            continue
+        result[attr_path] = attr_info
+        if attr_info.traversable:
+            attr = get_attr_from_parent(root, attr_path)
+            attr_paths_to_visit.extend(
+                [(*attr_path, attr_name) for attr_name in dir(attr)]
+            )
+    attr_paths_to_visit.extend([(attr_name,) for attr_name in instance_dict])
 
     while attr_paths_to_visit:
         attr_path = attr_paths_to_visit.pop(0)
@@ -37,21 +68,10 @@ def introspect_attrs(
         # Keep `proxy` first to use it's `__eq__` method instead of `attr`'s
         # unknown implementation.
         if proxy == attr:
-            logger.warning(
-                f"{root} attribute {'.'.join(attr_path)!r} "
-                f"is a proxy to itself. "
-                f"Consider making it private "
-                f"by renaming it to {'_' + attr_path[-1]!r}."
-            )
+            _warn_proxy_to_self(root, attr_path)
             continue
 
-        attr_info = AttrInfo(
-            callable=callable(attr),
-            traversable=(
-                getattr(attr, "_pykka_traversable", False) is True
-                or getattr(attr, "pykka_traversable", False) is True
-            ),
-        )
+        attr_info = _get_attr_info(attr)
         result[attr_path] = attr_info
 
         if attr_info.traversable:
@@ -62,22 +82,93 @@ def introspect_attrs(
     return result
 
 
+def introspect_attr(
+    *,
+    root: Any,
+    proxy: ActorProxy[Any],
+    attr_path: AttrPath,
+) -> AttrInfo | None:
+    """Introspects a single attribute of the actor.
+
+    Returns `None` if the attribute does not exist or is not exposed via
+    ActorProxy. The parent of the attribute must be traversable.
+    """
+    if any(attr_name.startswith("_") for attr_name in attr_path):
+        return None
+    try:
+        attr = get_attr_from_parent(root, attr_path)
+    except AttributeError:
+        return None
+    if proxy == attr:
+        _warn_proxy_to_self(root, attr_path)
+        return None
+    return _get_attr_info(attr)
+
+
+def _warn_proxy_to_self(root: Any, attr_path: AttrPath) -> None:
+    logger.warning(
+        f"{root} attribute {'.'.join(attr_path)!r} "
+        f"is a proxy to itself. "
+        f"Consider making it private "
+        f"by renaming it to {'_' + attr_path[-1]!r}."
+    )
+
+
+def _get_class_attrs(cls: type) -> dict[AttrPath, AttrInfo]:
+    """Introspect the public attributes defined on the class and its bases."""
+    class_dict = get_class_dict(cls)
+    cached = _class_attrs_cache.get(cls)
+    if cached is not None and _is_same_dict(cached.class_dict, class_dict):
+        return cached.attrs
+
+    attrs: dict[AttrPath, AttrInfo] = {
+        (attr_name,): _get_attr_info(attr)
+        for attr_name, attr in class_dict.items()
+        if not attr_name.startswith("_")
+    }
+    _class_attrs_cache[cls] = _ClassAttrs(class_dict=class_dict, attrs=attrs)
+    return attrs
+
+
+def _is_same_dict(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    # Compare by identity, as the values may have unusual __eq__ methods.
+    if len(a) != len(b):
+        return False
+    return all(b.get(key, _MISSING) is value for key, value in a.items())
+
+
+_MISSING = object()
+
+
+def _get_attr_info(attr: Any) -> AttrInfo:
+    return AttrInfo(
+        callable=callable(attr),
+        traversable=(
+            getattr(attr, "_pykka_traversable", False) is True
+            or getattr(attr, "pykka_traversable", False) is True
+        ),
+    )
+
+
 def get_attr_from_parent(
     root: Any,
     attr_path: AttrPath,
 ) -> Any:
     """Get attribute information from `__dict__` on the parent."""
     parent = get_attr_directly(root, attr_path[:-1])
-    parent_attrs = get_obj_dict(parent)
     attr_name = attr_path[-1]
 
-    try:
-        return parent_attrs[attr_name]
-    except KeyError:
-        msg = (
-            f"type object {parent.__class__.__name__!r} has no attribute {attr_name!r}"
-        )
-        raise AttributeError(msg) from None
+    # Look the attribute up in the same order as `get_obj_dict()` combines
+    # the dicts, without building the combined dict.
+    for attrs in (getattr(parent, "__dict__", {}), *_get_mro_dicts(parent)):
+        if attr_name in attrs:
+            return attrs[attr_name]
+    msg = f"type object {parent.__class__.__name__!r} has no attribute {attr_name!r}"
+    raise AttributeError(msg)
+
+
+def _get_mro_dicts(obj: Any) -> list[Mapping[str, Any]]:
+    return [cls.__dict__ for cls in obj.__class__.mro()]
 
 
 def get_attr_directly(
@@ -93,9 +184,15 @@ def get_attr_directly(
 
 def get_obj_dict(obj: Any) -> dict[str, Any]:
     """Combine `__dict__` from `obj` and all its superclasses."""
-    result: dict[str, Any] = {}
-    for cls in reversed(obj.__class__.mro()):
-        result.update(cls.__dict__)
+    result = get_class_dict(obj.__class__)
     if hasattr(obj, "__dict__"):
         result.update(obj.__dict__)
     return result
+
+
+def get_class_dict(cls: type) -> dict[str, Any]:
+    """Combine `__dict__` from `cls` and all its superclasses."""
+    result: dict[str, Any] = {}
+    for base in reversed(cls.mro()):
+        result.update(base.__dict__)
+    return result
@@ -0,0 +1,126 @@
+"""Internal state of the metrics collection.
+
+See [`pykka.metrics`][pykka.metrics] for the public API.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pykka import Actor, ActorRef
+    from pykka._envelope import Envelope
+
+
+enabled = False
+"""Whether metrics are collected. Checked by the hot paths before recording."""
+
+
+class Counters:
+    """Message counters and timings for one actor, or a class of actors."""
+
+    __slots__ = (
+        "handler_seconds_max",
+        "handler_seconds_total",
+        "lock",
+        "messages_processed",
+        "messages_sent",
+        "wait_seconds_max",
+        "wait_seconds_total",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.messages_sent = 0
+        self.messages_processed = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.handler_seconds_total = 0.0
+        self.handler_seconds_max = 0.0
+
+    def add(self, other: Counters) -> None:
+        self.messages_sent += other.messages_sent
+        self.messages_processed += other.messages_processed
+        self.wait_seconds_total += other.wait_seconds_total
+        self.wait_seconds_max = max(self.wait_seconds_max, other.wait_seconds_max)
+        self.handler_seconds_total += other.handler_seconds_total
+        self.handler_seconds_max = max(
+            self.handler_seconds_max, other.handler_seconds_max
+        )
+
+
+# Counters of running actors, by URN, together with the actor's class name.
+actors: dict[str, tuple[str, Counters]] = {}
+
+# Counters of stopped actors, summed up by class name.
+retired: dict[str, Counters] = {}
+
+lock = threading.Lock()
+
+
+def get_class_name(actor_class: type[Any]) -> str:
+    return f"{actor_class.__module__}.{actor_class.__qualname__}"
+
+
+def _get_counters(actor_ref: ActorRef[Any]) -> Counters:
+    entry = actors.get(actor_ref.actor_urn)
+    if entry is not None:
+        return entry[1]
+    class_name = get_class_name(actor_ref.actor_class)
+    with lock:
+        if actor_ref.actor_stopped.is_set():
+            # Don't bring a stopped actor back to life in the snapshots.
+            return retired.setdefault(class_name, Counters())
+        entry = actors.setdefault(actor_ref.actor_urn, (class_name, Counters()))
+    return entry[1]
+
+
+def record_sent(actor_ref: ActorRef[Any]) -> None:
+    """Record that a message was put into the actor's inbox."""
+    counters = _get_counters(actor_ref)
+    with counters.lock:
+        counters.messages_sent += 1
+
+
+def record_handled(
+    actor: Actor,
+    envelopes: list[Envelope[Any]],
+    started: float,
+    finished: float,
+) -> None:
+    """Record that the actor handled the envelopes between the given times."""
+    counters = _get_counters(actor.actor_ref)
+    # The handler time of a batch is shared evenly by its messages.
+    handler_seconds = (finished - started) / len(envelopes)
+    with counters.lock:
+        counters.messages_processed += len(envelopes)
+        counters.handler_seconds_total += finished - started
+        counters.handler_seconds_max = max(
+            counters.handler_seconds_max, handler_seconds
+        )
+        for envelope in envelopes:
+            if envelope.enqueued_at is not None:
+                wait_seconds = started - envelope.enqueued_at
+                counters.wait_seconds_total += wait_seconds
+                counters.wait_seconds_max = max(counters.wait_seconds_max, wait_seconds)
+    if actor.actor_stopped.is_set():
+        retire(actor.actor_ref)
+
+
+def retire(actor_ref: ActorRef[Any]) -> None:
+    """Move the counters of a stopped actor into its class' totals."""
+    with lock:
+        entry = actors.pop(actor_ref.actor_urn, None)
+        if entry is None:
+            return
+        class_name, counters = entry
+        totals = retired.setdefault(class_name, Counters())
+        with totals.lock, counters.lock:
+            totals.add(counters)
+
+
+def reset() -> None:
+    with lock:
+        actors.clear()
+        retired.clear()
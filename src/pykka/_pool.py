@@ -0,0 +1,498 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import itertools
+import queue
+import random
+import threading
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    TypeVar,
+    get_args,
+    overload,
+)
+
+from pykka import ActorDeadError, ActorRef
+from pykka._inbox import BalancingInbox, QueueInbox, SharedInbox
+from pykka._types import Routing
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pykka import Actor, Future
+    from pykka._envelope import Envelope
+
+__all__ = ["Pool"]
+
+
+A = TypeVar("A", bound="Actor")
+
+
+class Pool(ActorRef[A]):
+    """Reference to a pool of actors of the same class, used as one actor.
+
+    Each message sent to the pool is routed to one of the actors in the pool,
+    called the routees, using one of the following routing strategies:
+
+    - `"round_robin"`: The routees get a message each in turn. This is the
+      default.
+
+    - `"random"`: Each message goes to a random routee.
+
+    - `"smallest_mailbox"`: Each message goes to the routee with the fewest
+      messages waiting in its inbox. This keeps the work flowing to the
+      routees that are keeping up when the cost of handling a message varies.
+      If the actor's inbox cannot report its size, it is considered empty.
+
+    - `"balancing"`: All the routees share a single inbox, and each routee
+      takes the next message from it as soon as it is idle, so that no
+      message waits behind a slow message while another routee is idle. This
+      is only supported by pools created with
+      [`Pool.start()`][pykka.Pool.start], for
+      [`ThreadingActor`][pykka.ThreadingActor] subclasses running on
+      dedicated threads with the default, [`queue.Queue`][queue.Queue] based,
+      inbox. As the inbox is shared, messages sent directly to one of the
+      routees may be handled by any of them, except for requests to stop,
+      and messages are not batched.
+
+    - `"consistent_hash"`: Each message goes to the routee that owns the
+      message's key on a consistent hash ring, so that all messages with the
+      same key go to the same routee, e.g. to keep each customer's state in
+      one actor. The key is found by calling `hash_key` with the message,
+      which for proxy method calls is a
+      [`ProxyCall`][pykka.messages.ProxyCall], and is hashed as a string.
+      Each routee is placed on the ring `virtual_nodes` times, to spread the
+      keys evenly. When a routee is added, removed, or stops, only the keys
+      owned by that routee move to other routees.
+
+    A [`Pool`][pykka.Pool] is an [`ActorRef`][pykka.ActorRef], so it can be
+    used wherever an actor reference is expected. Calling
+    [`proxy()`][pykka.ActorRef.proxy] gives a proxy that routes each method
+    call to one of the routees. Setting an attribute through such a proxy only
+    sets it on one of the routees.
+
+    Routees that stop are skipped. The pool is alive until it is stopped, or
+    until all its routees have stopped.
+
+    Example:
+        ```py
+        pool = pykka.Pool.start(Resolver, 4, routing="smallest_mailbox")
+        futures = [pool.proxy().resolve(ip) for ip in ip_addresses]
+        hosts = pykka.get_all(futures)
+        pool.stop()
+        ```
+
+    Args:
+        routees: the actors to route messages to
+        routing: the routing strategy
+        hash_key: for consistent hash routing, a function returning the key of
+            a message
+        virtual_nodes: for consistent hash routing, the number of points on
+            the hash ring per routee
+
+    Raises:
+        ValueError: if there are no routees, the routing strategy is unknown,
+            or `hash_key` is missing for consistent hash routing
+
+    /// note | Version added: Pykka 4.5
+    ///
+
+    """
+
+    routees: list[ActorRef[A]]
+    """The actors messages are routed to.
+
+    Use [`add_routee()`][pykka.Pool.add_routee] and
+    [`remove_routee()`][pykka.Pool.remove_routee] to change the routees.
+    """
+
+    routing: Routing
+    """The routing strategy."""
+
+    hash_key: Callable[[Any], Any] | None
+    """For consistent hash routing, the function returning a message's key."""
+
+    virtual_nodes: int
+    """For consistent hash routing, the number of points per routee on the
+    hash ring."""
+
+    def __init__(
+        self,
+        routees: Sequence[ActorRef[A]],
+        *,
+        routing: Routing = "round_robin",
+        hash_key: Callable[[Any], Any] | None = None,
+        virtual_nodes: int = 100,
+    ) -> None:
+        if not routees:
+            msg = "A pool needs at least one routee"
+            raise ValueError(msg)
+        if routing not in get_args(Routing):
+            msg = f"Unknown routing strategy: {routing!r}"
+            raise ValueError(msg)
+        if routing == "balancing" and not (
+            isinstance(inbox := routees[0].actor_inbox, BalancingInbox)
+            and all(
+                isinstance(routee.actor_inbox, BalancingInbox)
+                and routee.actor_inbox.shared is inbox.shared
+                for routee in routees
+            )
+        ):
+            msg = "Balancing pools must be started with Pool.start()"
+            raise ValueError(msg)
+        if routing == "consistent_hash" and hash_key is None:
+            msg = "Consistent hash routing requires a hash_key function"
+            raise ValueError(msg)
+        if virtual_nodes < 1:
+            msg = "virtual_nodes must be at least 1"
+            raise ValueError(msg)
+        self.routees = list(routees)
+        self.routing = routing
+        self.hash_key = hash_key
+        self.virtual_nodes = virtual_nodes
+        self._lock = threading.Lock()
+        self._ring: tuple[list[int], list[ActorRef[A]]] = ([], [])
+        if routing == "consistent_hash":
+            self._ring = self._build_ring(self.routees)
+        self.actor_class = self.routees[0].actor_class
+        self.actor_urn = uuid.uuid4().urn
+        self.actor_inbox = _PoolInbox(self)
+        self.actor_stopped = threading.Event()
+        self._counter = itertools.count()
+
+    @classmethod
+    def start(
+        cls,
+        actor_class: type[A],
+        size: int,
+        *args: Any,
+        routing: Routing = "round_robin",
+        hash_key: Callable[[Any], Any] | None = None,
+        virtual_nodes: int = 100,
+        **kwargs: Any,
+    ) -> Pool[A]:
+        """Start a pool of actors of the given class.
+
+        Any arguments other than `actor_class`, `size`, `routing`,
+        `hash_key`, and `virtual_nodes` are passed on to
+        [`start()`][pykka.Actor.start] of each actor.
+
+        Args:
+            actor_class: the class of the actors to start
+            size: the number of actors to start
+            args: positional arguments for each actor
+            routing: the routing strategy
+            hash_key: for consistent hash routing, a function returning the
+                key of a message
+            virtual_nodes: for consistent hash routing, the number of points
+                on the hash ring per routee
+            kwargs: keyword arguments for each actor
+
+        Returns:
+            a reference to the pool
+
+        Raises:
+            ValueError: if `size` is less than one
+            TypeError: if balancing routing is used with an actor class that
+                does not support sharing its inbox
+
+        """
+        if size < 1:
+            msg = "size must be at least 1"
+            raise ValueError(msg)
+        if routing != "balancing":
+            routees = [actor_class.start(*args, **kwargs) for _ in range(size)]
+            return cls(
+                routees,
+                routing=routing,
+                hash_key=hash_key,
+                virtual_nodes=virtual_nodes,
+            )
+
+        inbox = actor_class._create_actor_inbox()  # noqa: SLF001
+        if not isinstance(inbox, QueueInbox):
+            msg = (
+                "Balancing pools require threading actors on dedicated threads "
+                "with queue.Queue based inboxes"
+            )
+            raise TypeError(msg)
+        shared = SharedInbox(inbox)
+        routees = []
+        for _ in range(size):
+            routee_inbox = shared.create_inbox()
+            try:
+                routee = actor_class._start_with_inbox(  # noqa: SLF001
+                    routee_inbox, *args, **kwargs
+                )
+            except Exception:
+                routee_inbox.detach()
+                raise
+            routees.append(routee)
+        return cls(routees, routing=routing)
+
+    def __repr__(self) -> str:
+        return f"<Pool of {len(self.routees)} for {self}>"
+
+    def _actor_weakref(self) -> A | None:  # type: ignore[override]
+        # Proxies introspect one of the routees, as they are all alike.
+        for routee in self.routees:
+            actor = routee._actor_weakref()  # noqa: SLF001
+            if actor is not None and routee.is_alive():
+                return actor
+        return None
+
+    def is_alive(self) -> bool:
+        """Check if the pool is alive.
+
+        Returns:
+            `True` if the pool is not stopped and has a routee that is alive,
+            `False` otherwise.
+
+        """
+        return not self.actor_stopped.is_set() and any(
+            routee.is_alive() for routee in self.routees
+        )
+
+    def add_routee(self, routee: ActorRef[A]) -> None:
+        """Add an actor to the routees.
+
+        Args:
+            routee: the actor to add
+
+        Raises:
+            ValueError: if this is a balancing pool
+
+        """
+        if self.routing == "balancing":
+            msg = "Routees cannot be added to balancing pools"
+            raise ValueError(msg)
+        with self._lock:
+            routees = [*self.routees, routee]
+            if self.routing == "consistent_hash":
+                self._ring = self._build_ring(routees)
+            self.routees = routees
+
+    def remove_routee(self, routee: ActorRef[A]) -> None:
+        """Remove an actor from the routees, without stopping it.
+
+        Args:
+            routee: the actor to remove
+
+        Raises:
+            ValueError: if the actor is not one of the routees
+
+        """
+        with self._lock:
+            routees = list(self.routees)
+            routees.remove(routee)
+            if self.routing == "consistent_hash":
+                self._ring = self._build_ring(routees)
+            self.routees = routees
+
+    def _build_ring(
+        self,
+        routees: list[ActorRef[A]],
+    ) -> tuple[list[int], list[ActorRef[A]]]:
+        nodes = sorted(
+            (_hash(f"{routee.actor_urn}-{i}"), routee)
+            for routee in routees
+            for i in range(self.virtual_nodes)
+        )
+        return [point for point, _ in nodes], [routee for _, routee in nodes]
+
+    def route(self, message: Any = None) -> ActorRef[A] | None:
+        """Select the routee to send a message to.
+
+        Args:
+            message: the message to send, used by consistent hash routing
+
+        Returns:
+            a routee that is alive, or `None` if there are none
+
+        /// note | Version changed: Pykka 4.5
+        Added the `message` argument.
+        ///
+
+        """
+        if self.actor_stopped.is_set():
+            return None
+        if self.routing == "consistent_hash":
+            return self._route_by_hash(message)
+        alive = [routee for routee in self.routees if routee.is_alive()]
+        if not alive:
+            return None
+        if self.routing == "random":
+            return random.choice(alive)  # noqa: S311
+        offset = next(self._counter) % len(alive)
+        if self.routing == "smallest_mailbox":
+            # Start at the next routee in turn, so that ties between routees
+            # with equally small mailboxes are broken round-robin.
+            rotated = alive[offset:] + alive[:offset]
+            return min(rotated, key=_get_mailbox_size)
+        # Round-robin. In balancing pools, all the routees put the messages
+        # into the same shared queue, so any routee will do.
+        return alive[offset]
+
+    def _route_by_hash(self, message: Any) -> ActorRef[A] | None:
+        assert self.hash_key is not None
+        points, owners = self._ring
+        start = bisect.bisect(points, _hash(self.hash_key(message)))
+        # Keys owned by a dead routee move on to the next routee on the ring.
+        for i in range(len(points)):
+            owner = owners[(start + i) % len(points)]
+            if owner.is_alive():
+                return owner
+        return None
+
+    def tell(
+        self,
+        message: Any,
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        """Send message to one of the routees without waiting for any response.
+
+        See [`ActorRef.tell()`][pykka.ActorRef.tell].
+        """
+        routee = self.route(message)
+        if routee is None:
+            super().tell(message, timeout=timeout)  # Raises ActorDeadError
+            return
+        routee.tell(message, timeout=timeout)
+
+    @overload
+    def ask(
+        self,
+        message: Any,
+        *,
+        block: Literal[False],
+        timeout: float | None = None,
+    ) -> Future[Any]: ...
+
+    @overload
+    def ask(
+        self,
+        message: Any,
+        *,
+        block: Literal[True],
+        timeout: float | None = None,
+    ) -> Any: ...
+
+    @overload
+    def ask(
+        self,
+        message: Any,
+        *,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> Any | Future[Any]: ...
+
+    def ask(
+        self,
+        message: Any,
+        *,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> Any | Future[Any]:
+        """Send message to one of the routees and wait for the reply.
+
+        See [`ActorRef.ask()`][pykka.ActorRef.ask].
+        """
+        routee = self.route(message)
+        if routee is None:
+            # Fails with ActorDeadError, like for any dead actor.
+            return super().ask(message, block=block, timeout=timeout)
+        return routee.ask(message, block=block, timeout=timeout)
+
+    @overload
+    def stop(
+        self,
+        *,
+        block: Literal[True],
+        timeout: float | None = None,
+    ) -> bool: ...
+
+    @overload
+    def stop(
+        self,
+        *,
+        block: Literal[False],
+        timeout: float | None = None,
+    ) -> Future[bool]: ...
+
+    @overload
+    def stop(
+        self,
+        *,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> bool | Future[bool]: ...
+
+    def stop(
+        self,
+        *,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> bool | Future[bool]:
+        """Stop all the routees.
+
+        Messages already sent to the routees are processed before they stop.
+        `block` and `timeout` works as for [`ActorRef.stop()`][pykka.ActorRef.stop].
+
+        Returns:
+            `True` if any routee was stopped by this call, `False` if they were
+            all already dead. A future wrapping the result if not blocking.
+
+        """
+        self.actor_stopped.set()
+        futures = [routee.stop(block=False) for routee in self.routees]
+        future = futures[0].join(*futures[1:]).map(any)
+        if block:
+            return future.get(timeout=timeout)
+        return future
+
+
+class _PoolInbox:
+    """Inbox routing envelopes put directly into it to one of the routees."""
+
+    def __init__(self, pool: Pool[Any]) -> None:
+        self._pool = pool
+
+    def put(
+        self,
+        envelope: Envelope[Any],
+        /,
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        routee = self._pool.route(envelope.message)
+        if routee is None:
+            msg = f"{self._pool} not found"
+            raise ActorDeadError(msg)
+        if timeout is None:
+            routee.actor_inbox.put(envelope)
+        else:
+            routee.actor_inbox.put(envelope, timeout=timeout)
+
+    def get(self) -> Envelope[Any]:
+        # The envelopes are taken out of the routees' inboxes.
+        raise queue.Empty
+
+    def empty(self) -> bool:
+        return all(routee.actor_inbox.empty() for routee in self._pool.routees)
+
+
+def _get_mailbox_size(actor_ref: ActorRef[Any]) -> int:
+    qsize = getattr(actor_ref.actor_inbox, "qsize", None)
+    if qsize is None:
+        return 0
+    return int(qsize())
+
+
+def _hash(key: Any) -> int:
+    digest = hashlib.blake2b(str(key).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
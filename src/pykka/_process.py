@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import collections
+import logging
+import multiprocessing
+import queue
+import sys
+import threading
+import traceback
+from itertools import count
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, cast
+
+from pykka import Actor, ActorDeadError, ActorRef, ActorRegistry, Future, messages
+from pykka._envelope import Envelope
+from pykka._threading import ThreadingFuture
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+    from types import TracebackType
+
+    from pykka._actor import ActorInbox
+    from pykka._types import OptExcInfo
+
+__all__ = ["ProcessActor"]
+
+
+logger = logging.getLogger("pykka")
+
+
+class _RemoteTraceback(Exception):  # noqa: N818
+    """The traceback of an exception raised in an actor's process."""
+
+    def __init__(self, tb: str) -> None:
+        super().__init__(tb)
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
+class _Reply(NamedTuple):
+    """Message from an actor's process with the reply to a request."""
+
+    request_id: int
+    value: Any
+    exc_value: BaseException | None
+    tb: str | None
+
+
+class _Stopped(NamedTuple):
+    """Message from an actor's process telling that the actor has stopped."""
+
+
+class ProcessInbox:
+    """Parent process side of the inbox of an actor running in a child process.
+
+    Messages are sent to the actor's process through a pipe. If a message
+    expects a reply, the reply future is kept in the parent process until the
+    reply arrives through another pipe.
+
+    This is an internal type and is not part of the public API.
+    """
+
+    def __init__(self) -> None:
+        self.requests_reader, self._requests_writer = multiprocessing.Pipe(duplex=False)
+        self._replies_reader, self.replies_writer = multiprocessing.Pipe(duplex=False)
+        # The pending futures and the pipe have separate locks, so that the
+        # replies can be handled while a sender waits for the actor's process
+        # to make room in the pipe.
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._pending: dict[int, Future[Any]] = {}
+        self._request_ids = count()
+        self._closed = False
+
+    def put(
+        self,
+        envelope: Envelope[Any],
+        /,
+        *,
+        timeout: float | None = None,  # noqa: ARG002
+    ) -> None:
+        request_id = None
+        with self._lock:
+            if self._closed:
+                _reject(envelope)
+                return
+            if envelope.reply_to is not None:
+                request_id = next(self._request_ids)
+                self._pending[request_id] = envelope.reply_to
+        try:
+            with self._send_lock:
+                self._requests_writer.send(
+                    (request_id, envelope.message, envelope.trace_context)
+                )
+        except Exception:
+            with self._lock:
+                if request_id is not None:
+                    self._pending.pop(request_id, None)
+                if self._closed:
+                    # The actor's process stopped while we were sending.
+                    _reject(envelope)
+                    return
+            raise
+
+    def get(self) -> Envelope[Any]:
+        # The envelopes are taken out of the inbox in the actor's process.
+        raise queue.Empty
+
+    def empty(self) -> bool:
+        return True
+
+    def qsize(self) -> int:
+        # Only messages awaiting a reply are known to be in the actor's
+        # process, either in the pipe or being handled.
+        return len(self._pending)
+
+    def attach(self, actor: ProcessActor, process: BaseProcess) -> None:
+        """Start passing replies from the actor's process to the futures."""
+        # The child's ends of the pipes are owned by the child process now.
+        self.requests_reader.close()
+        self.replies_writer.close()
+        thread = threading.Thread(
+            target=self._read_replies,
+            args=(actor, process),
+            name=f"{process.name}-replies",
+            daemon=True,
+        )
+        thread.start()
+
+    def _read_replies(self, actor: ProcessActor, process: BaseProcess) -> None:
+        while True:
+            try:
+                reply = self._replies_reader.recv()
+            except (EOFError, OSError):
+                break
+            except Exception:
+                logger.exception(f"Failed to receive reply from {actor}:")
+                continue
+            if isinstance(reply, _Stopped):
+                _mark_stopped(actor)
+                continue
+            with self._lock:
+                future = self._pending.pop(reply.request_id, None)
+            if future is None:
+                continue
+            if reply.exc_value is None:
+                future.set(reply.value)
+            else:
+                exc_value = reply.exc_value
+                if reply.tb is not None:
+                    exc_value.__cause__ = _RemoteTraceback(reply.tb)
+                future.set_exception((type(exc_value), exc_value, None))
+
+        # The actor's process has exited, or closed its end of the pipe.
+        _mark_stopped(actor)
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(
+                (
+                    ActorDeadError,
+                    ActorDeadError(f"{actor} stopped before handling the message"),
+                    None,
+                )
+            )
+        with self._send_lock:
+            self._requests_writer.close()
+        self._replies_reader.close()
+        process.join()
+
+
+def _reject(envelope: Envelope[Any]) -> None:
+    if envelope.reply_to is None:
+        return
+    if isinstance(envelope.message, messages._ActorStop):  # noqa: SLF001
+        envelope.reply_to.set(None)
+    else:
+        envelope.reply_to.set_exception(
+            (ActorDeadError, ActorDeadError("Actor process has stopped"), None)
+        )
+
+
+def _mark_stopped(actor: ProcessActor) -> None:
+    if not actor.actor_stopped.is_set():
+        ActorRegistry.unregister(actor.actor_ref)
+        actor.actor_stopped.set()
+        logger.debug(f"Stopped {actor}")
+
+
+class _ReplyFuture(Future[Any]):
+    """Future in an actor's process that sends its value to the parent process."""
+
+    def __init__(self, request_id: int, replies: _Replies) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._replies = replies
+
+    def set(
+        self,
+        value: Any | None = None,
+    ) -> None:
+        try:
+            self._replies.send(_Reply(self._request_id, value, None, None))
+        except Exception:  # noqa: BLE001
+            # The value could not be pickled.
+            self.set_exception()
+
+    def set_exception(
+        self,
+        exc_info: OptExcInfo | None = None,
+    ) -> None:
+        if exc_info is None:
+            exc_info = sys.exc_info()
+        exc_type, exc_value, exc_traceback = exc_info
+        assert exc_type is not None
+        if exc_value is None:
+            exc_value = exc_type()
+        tb = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        try:
+            self._replies.send(_Reply(self._request_id, None, exc_value, tb))
+        except Exception:  # noqa: BLE001
+            # The exception could not be pickled.
+            error = RuntimeError(f"Unpicklable exception: {exc_value!r}")
+            self._replies.send(_Reply(self._request_id, None, error, tb))
+
+
+class _Replies:
+    """Child process side of the pipe for replies to the parent process."""
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+        self._lock = threading.Lock()
+
+    def send(self, message: _Reply | _Stopped) -> None:
+        with self._lock:
+            self._connection.send(message)
+
+
+class _ChildInbox:
+    """Child process side of the inbox of an actor running in a child process.
+
+    Envelopes put into the inbox from the actor's own process, e.g. when the
+    actor stops itself, are kept in the child process and are taken out
+    before the next message from the parent process.
+    """
+
+    def __init__(self, requests: Connection, replies: _Replies) -> None:
+        self._requests = requests
+        self._replies = replies
+        self._local: collections.deque[Envelope[Any]] = collections.deque()
+        self._closed = False
+
+    def put(
+        self,
+        envelope: Envelope[Any],
+        /,
+        *,
+        timeout: float | None = None,  # noqa: ARG002
+    ) -> None:
+        self._local.append(envelope)
+
+    def get(self) -> Envelope[Any]:
+        if self._local:
+            return self._local.popleft()
+        try:
+            request_id, message, trace_context = self._requests.recv()
+        except (EOFError, OSError):
+            # The parent process has gone away. Stop the actor.
+            self._closed = True
+            return Envelope(messages._ActorStop())  # noqa: SLF001
+        reply_to = None
+        if request_id is not None:
+            reply_to = _ReplyFuture(request_id, self._replies)
+        return Envelope(message, reply_to=reply_to, trace_context=trace_context)
+
+    def empty(self) -> bool:
+        return not self._local and (self._closed or not self._requests.poll())
+
+
+def _run_actor_process(
+    actor: ProcessActor,
+    requests: Connection,
+    replies_connection: Connection,
+) -> None:
+    """Run the actor's core loop in the actor's process."""
+    replies = _Replies(replies_connection)
+    actor.actor_inbox = _ChildInbox(requests, replies)
+    actor.actor_stopped = threading.Event()
+    actor._actor_ref = ActorRef(actor)  # noqa: SLF001
+    actor._process_replies = replies  # noqa: SLF001
+    try:
+        actor._actor_loop()  # noqa: SLF001
+    finally:
+        requests.close()
+        replies_connection.close()
+
+
+_actor_process_counter = count(0)
+
+
+class ProcessActor(Actor):
+    """Implementation of [`Actor`][pykka.Actor] running in a child process.
+
+    Each actor runs in a process of its own, so that CPU-bound actors are not
+    limited by the global interpreter lock of the process that started them.
+
+    The actor is created by calling `__init__()` in the process calling
+    [`Actor.start()`][pykka.Actor.start], and is then copied to the actor's
+    process, where [`on_start()`][pykka.Actor.on_start], the message handlers,
+    and [`on_stop()`][pykka.Actor.on_stop] are executed. The copy left in the
+    starting process is only used by [`ActorProxy`][pykka.ActorProxy] to find
+    the actor's attributes and methods.
+
+    Thus, the actor's state, and all messages and replies, must be picklable.
+    Replies are returned through regular [`Future`][pykka.Future] objects in
+    the sending process. Exceptions raised in the actor's process are returned
+    with the formatted remote traceback as their `__cause__`.
+
+    The actor class must be importable by the actor's process. With the
+    default `"spawn"` start method, the main module of the program must
+    protect its entry point with `if __name__ == "__main__":`, as described in
+    the [`multiprocessing`][multiprocessing] documentation.
+
+    [`ActorRef`][pykka.ActorRef] and [`ActorProxy`][pykka.ActorProxy] objects
+    cannot be sent to or from the actor's process.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    process_start_method: ClassVar[str] = "spawn"
+    """
+    The [`multiprocessing`][multiprocessing] start method used to create the
+    actor's process. This must be set before
+    [`Actor.start()`][pykka.Actor.start] is called.
+
+    The `"fork"` start method is faster, but is unsafe in a program with
+    other threads running, which every program using Pykka has.
+    """
+
+    use_daemon_process: ClassVar[bool] = False
+    """
+    A boolean value indicating whether this actor is executed in a process
+    that is a daemon process (`True`) or not (`False`). This must be set
+    before [`Actor.start()`][pykka.Actor.start] is called.
+
+    When the program exits, daemon processes are terminated, while other
+    processes are waited for. A daemon process cannot start other processes.
+    """
+
+    _process_replies: _Replies | None = None
+
+    @staticmethod
+    def _create_actor_inbox() -> ActorInbox:
+        return ProcessInbox()
+
+    @staticmethod
+    def _create_future() -> Future[Any]:
+        return ThreadingFuture()
+
+    def _start_actor_loop(self) -> None:
+        inbox = cast("ProcessInbox", self.actor_inbox)
+        context = multiprocessing.get_context(self.process_start_method)
+        process = context.Process(  # type: ignore[attr-defined]
+            target=_run_actor_process,
+            args=(self, inbox.requests_reader, inbox.replies_writer),
+            name=f"ProcessActor-{next(_actor_process_counter)}",
+            daemon=self.use_daemon_process,
+        )
+        try:
+            process.start()
+        except Exception:
+            ActorRegistry.unregister(self.actor_ref)
+            self.actor_stopped.set()
+            raise
+        inbox.attach(self, process)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The inbox, stopped flag, and ref are replaced in the actor's process.
+        state = self.__dict__.copy()
+        for name in ("actor_inbox", "actor_stopped", "_actor_ref"):
+            state.pop(name, None)
+        return state
+
+    def _stop(self) -> None:
+        super()._stop()
+        self._notify_stopped()
+
+    def _handle_failure(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        super()._handle_failure(exception_type, exception_value, traceback)
+        self._notify_stopped()
+
+    def _notify_stopped(self) -> None:
+        # Let the starting process know before any reply to the stop request.
+        if self._process_replies is not None:
+            self._process_replies.send(_Stopped())
@@ -4,7 +4,7 @@ import logging
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from pykka import ActorDeadError, messages
-from pykka._introspection import AttrInfo, introspect_attrs
+from pykka._introspection import AttrInfo, introspect_attr, introspect_attrs
 
 if TYPE_CHECKING:
     from pykka import Actor, ActorRef, Future
@@ -175,13 +175,16 @@ class ActorProxy(Generic[A]):
         """Get a field or callable from the actor."""
         attr_path: AttrPath = (*self._attr_path, name)
 
-        if attr_path not in self._known_attrs:
-            self._known_attrs = introspect_attrs(root=self._actor, proxy=self)
-
         attr_info = self._known_attrs.get(attr_path)
         if attr_info is None:
-            msg = f"{self} has no attribute {name!r}"
-            raise AttributeError(msg)
+            # The attribute may have been added after the proxy was created.
+            attr_info = introspect_attr(
+                root=self._actor, proxy=self, attr_path=attr_path
+            )
+            if attr_info is None:
+                msg = f"{self} has no attribute {name!r}"
+                raise AttributeError(msg)
+            self._known_attrs[attr_path] = attr_info
 
         if attr_info.callable:
             if attr_path not in self._callable_proxies:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 import weakref
 from typing import (
     TYPE_CHECKING,
@@ -11,7 +12,7 @@ from typing import (
     overload,
 )
 
-from pykka import ActorDeadError, ActorProxy
+from pykka import ActorDeadError, ActorProxy, MailboxFull, _metrics, _tracing
 from pykka._envelope import Envelope
 from pykka.messages import _ActorStop
 
@@ -80,23 +81,44 @@ class ActorRef(Generic[A]):
     def tell(
         self,
         message: Any,
+        *,
+        timeout: float | None = None,
     ) -> None:
         """Send message to actor without waiting for any response.
 
-        Will generally not block, but if the underlying queue is full it will
-        block until a free slot is available.
+        Will generally not block, but if the actor's inbox is bounded and full,
+        it may block until a free slot is available, depending on the actor's
+        [`inbox_overflow_policy`][pykka.ThreadingActor.inbox_overflow_policy].
 
         Args:
             message: message to send
+            timeout: seconds to wait for a free slot in a full inbox before
+                raising [`MailboxFull`][pykka.MailboxFull]
 
         Raises:
             ActorDeadError: if actor is not available
+            MailboxFull: if the actor's inbox is full
+
+        /// note | Version changed: Pykka 4.5
+        Added the `timeout` argument.
+        ///
 
         """
         if not self.is_alive():
             msg = f"{self} not found"
             raise ActorDeadError(msg)
-        self.actor_inbox.put(Envelope(message))
+        if _metrics.enabled or _tracing.tracers:
+            envelope = Envelope(message, enqueued_at=time.monotonic())
+            if _tracing.tracers:
+                _tracing.send(self, envelope)
+        else:
+            envelope = Envelope(message)
+        if timeout is None:
+            self.actor_inbox.put(envelope)
+        else:
+            self.actor_inbox.put(envelope, timeout=timeout)
+        if _metrics.enabled:
+            _metrics.record_sent(self)
 
     @overload
     def ask(
@@ -148,8 +170,13 @@ class ActorRef(Generic[A]):
             block: whether to block while waiting for a reply
             timeout: seconds to wait before timeout if blocking
 
+        If the actor's inbox is bounded and full, the future may fail with
+        [`MailboxFull`][pykka.MailboxFull], depending on the actor's
+        [`inbox_overflow_policy`][pykka.ThreadingActor.inbox_overflow_policy].
+
         Raises:
             Timeout: if timeout is reached if blocking
+            MailboxFull: if the actor's inbox is full if blocking
             Exception: any exception returned by the receiving actor if blocking
 
         Returns:
@@ -162,10 +189,19 @@ class ActorRef(Generic[A]):
             if not self.is_alive():
                 msg = f"{self} not found"
                 raise ActorDeadError(msg)  # noqa: TRY301
-        except ActorDeadError:
+            if _metrics.enabled or _tracing.tracers:
+                envelope = Envelope(
+                    message, reply_to=future, enqueued_at=time.monotonic()
+                )
+                if _tracing.tracers:
+                    _tracing.send(self, envelope)
+                self.actor_inbox.put(envelope)
+                if _metrics.enabled:
+                    _metrics.record_sent(self)
+            else:
+                self.actor_inbox.put(Envelope(message, reply_to=future))
+        except (ActorDeadError, MailboxFull):
             future.set_exception()
-        else:
-            self.actor_inbox.put(Envelope(message, reply_to=future))
 
         if block:
             return future.get(timeout=timeout)
@@ -225,17 +261,19 @@ class ActorRef(Generic[A]):
         """
         ask_future = self.ask(_ActorStop(), block=False)
 
-        def _stop_result_converter(timeout: float | None) -> bool:
+        converted_future = cast("Future[bool]", ask_future.__class__())
+
+        def _convert_stop_result(_: Future[Any]) -> None:
             try:
-                ask_future.get(timeout=timeout)
+                ask_future.get(timeout=0)
             except ActorDeadError:
-                return False
+                converted_future.set(False)
+            except Exception:  # noqa: BLE001
+                converted_future.set_exception()
             else:
-                return True
+                converted_future.set(True)
 
-        converted_future = ask_future.__class__()
-        converted_future.set_get_hook(_stop_result_converter)
-        converted_future = cast("Future[bool]", converted_future)
+        ask_future.add_done_callback(_convert_stop_result)
 
         if block:
             return converted_future.get(timeout=timeout)
@@ -2,16 +2,27 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
+from itertools import count
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Literal,
+    TypeAlias,
     TypeVar,
     overload,
 )
 
+from pykka import _metrics, _tracing
+from pykka._envelope import Envelope
+from pykka._exceptions import MailboxFull
+from pykka._future import get_all
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from pykka import Actor, ActorRef, Future
 
 __all__ = ["ActorRegistry"]
@@ -22,6 +33,22 @@ logger = logging.getLogger("pykka")
 
 A = TypeVar("A", bound="Actor")
 
+# A registered ref, with its registration sequence number.
+_Entry: TypeAlias = "tuple[int, ActorRef[Any]]"
+
+
+class _RegistryShard:
+    """A part of the registry, guarded by a lock of its own."""
+
+    __slots__ = ("entries", "entries_by_class", "lock")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Refs are indexed by URN and by the exact actor class, so that
+        # lookups don't have to scan all refs.
+        self.entries: dict[str, _Entry] = {}
+        self.entries_by_class: dict[type[Actor], dict[str, _Entry]] = {}
+
 
 class ActorRegistry:
     """Registry which provides easy access to all running actors.
@@ -29,24 +56,67 @@ class ActorRegistry:
     Contains global state, but should be thread-safe.
     """
 
-    _actor_refs: ClassVar[list[ActorRef[Any]]] = []
-    _actor_refs_lock: ClassVar[threading.RLock] = threading.RLock()
+    # The refs are spread over a number of shards by URN, so that actors
+    # started or stopped from different threads rarely wait for each other,
+    # and so that lookups only hold up registration in one shard at a time.
+    _shards: ClassVar[tuple[_RegistryShard, ...]] = tuple(
+        _RegistryShard() for _ in range(16)
+    )
+    _registration_counter: ClassVar[count[int]] = count()
+
+    # Names are rare compared to actors, and are guarded by a single lock. The
+    # names lock is only ever acquired while holding a shard lock, never the
+    # other way around.
+    _actor_refs_by_name: ClassVar[dict[str, ActorRef[Any]]] = {}
+    _actor_names_by_urn: ClassVar[dict[str, set[str]]] = {}
+    _actor_names_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _get_shard(cls, actor_urn: str) -> _RegistryShard:
+        return cls._shards[hash(actor_urn) % len(cls._shards)]
+
+    @classmethod
+    def _collect(
+        cls,
+        select: Callable[[_RegistryShard], Iterable[_Entry]],
+    ) -> list[ActorRef[Any]]:
+        """Collect the selected refs from all shards, in registration order."""
+        entries: list[_Entry] = []
+        for shard in cls._shards:
+            with shard.lock:
+                entries.extend(select(shard))
+        entries.sort(key=itemgetter(0))
+        return [ref for _, ref in entries]
 
     @classmethod
     def broadcast(
         cls,
         message: Any,
         target_class: str | type[Actor] | None = None,
-    ) -> None:
+    ) -> list[ActorRef[Any]]:
         """Broadcast `message` to all actors of the specified `target_class`.
 
         If no `target_class` is specified, the message is broadcasted to all
         actors.
 
+        The same message is shared by all the receiving actors, so it must
+        not be mutated after it is sent. Actors that are stopped
+        or whose inbox is full are skipped instead of interrupting the
+        broadcast.
+
         Args:
             message: the message to send
             target_class: optional actor class or class name
 
+        Returns:
+            a list of the actors that did not receive the message
+
+        /// note | Version changed: Pykka 4.5
+        Previously, the broadcast stopped with
+        [`ActorDeadError`][pykka.ActorDeadError] if one of the actors stopped
+        during the broadcast. The skipped actors are now returned instead.
+        ///
+
         """
         if isinstance(target_class, str):
             targets = cls.get_by_class_name(target_class)
@@ -54,14 +124,37 @@ class ActorRegistry:
             targets = cls.get_by_class(target_class)
         else:
             targets = cls.get_all()
-        for ref in targets:
-            ref.tell(message)
+
+        if _metrics.enabled:
+            envelope = Envelope(message, enqueued_at=time.monotonic())
+        else:
+            envelope = Envelope(message)
+        skipped = [ref for ref in targets if not cls._deliver(ref, envelope)]
+        if skipped:
+            logger.debug(f"Broadcast skipped {len(skipped)} actors")
+        return skipped
+
+    @staticmethod
+    def _deliver(actor_ref: ActorRef[Any], envelope: Envelope[Any]) -> bool:
+        """Put a broadcast envelope into an actor's inbox, unless it is full."""
+        if actor_ref.actor_stopped.is_set():
+            return False
+        if _tracing.tracers:
+            # Each recipient gets a span of its own.
+            envelope = Envelope(envelope.message, enqueued_at=envelope.enqueued_at)
+            _tracing.send(actor_ref, envelope)
+        try:
+            actor_ref.actor_inbox.put(envelope)
+        except MailboxFull:
+            return False
+        if _metrics.enabled:
+            _metrics.record_sent(actor_ref)
+        return True
 
     @classmethod
     def get_all(cls) -> list[ActorRef[Any]]:
         """Get all running actors."""
-        with cls._actor_refs_lock:
-            return cls._actor_refs[:]
+        return cls._collect(lambda shard: shard.entries.values())
 
     @classmethod
     def get_by_class(
@@ -74,12 +167,14 @@ class ActorRegistry:
             actor_class: actor class, or any superclass of the actor
 
         """
-        with cls._actor_refs_lock:
-            return [
-                ref
-                for ref in cls._actor_refs
-                if issubclass(ref.actor_class, actor_class)
+        return cls._collect(
+            lambda shard: [
+                entry
+                for ref_class, entries in shard.entries_by_class.items()
+                if issubclass(ref_class, actor_class)
+                for entry in entries.values()
             ]
+        )
 
     @classmethod
     def get_by_class_name(
@@ -87,12 +182,29 @@ class ActorRegistry:
         actor_class_name: str,
     ) -> list[ActorRef[Any]]:
         """Get all running actors of the given class name."""
-        with cls._actor_refs_lock:
-            return [
-                ref
-                for ref in cls._actor_refs
-                if ref.actor_class.__name__ == actor_class_name
+        return cls._collect(
+            lambda shard: [
+                entry
+                for ref_class, entries in shard.entries_by_class.items()
+                if ref_class.__name__ == actor_class_name
+                for entry in entries.values()
             ]
+        )
+
+    @classmethod
+    def get_by_name(
+        cls,
+        name: str,
+    ) -> ActorRef[Any] | None:
+        """Get an actor by a name it has been registered with.
+
+        See [`register_name()`][pykka.ActorRegistry.register_name].
+
+        /// note | Version added: Pykka 4.5
+        ///
+        """
+        with cls._actor_names_lock:
+            return cls._actor_refs_by_name.get(name)
 
     @classmethod
     def get_by_urn(
@@ -100,11 +212,10 @@ class ActorRegistry:
         actor_urn: str,
     ) -> ActorRef[Any] | None:
         """Get an actor by its universally unique URN."""
-        with cls._actor_refs_lock:
-            refs = [ref for ref in cls._actor_refs if ref.actor_urn == actor_urn]
-            if not refs:
-                return None
-            return refs[0]
+        shard = cls._get_shard(actor_urn)
+        with shard.lock:
+            entry = shard.entries.get(actor_urn)
+        return None if entry is None else entry[1]
 
     @classmethod
     def register(
@@ -116,10 +227,52 @@ class ActorRegistry:
         This is done automatically when an actor is started, e.g. by calling
         [`Actor.start()`][pykka.Actor.start].
         """
-        with cls._actor_refs_lock:
-            cls._actor_refs.append(actor_ref)
+        urn = actor_ref.actor_urn
+        shard = cls._get_shard(urn)
+        with shard.lock:
+            entry = (next(cls._registration_counter), actor_ref)
+            shard.entries[urn] = entry
+            shard.entries_by_class.setdefault(actor_ref.actor_class, {})[urn] = entry
         logger.debug(f"Registered {actor_ref}")
 
+    @classmethod
+    def register_name(
+        cls,
+        name: str,
+        actor_ref: ActorRef[Any],
+    ) -> None:
+        """Register a name for an actor, so it can be looked up by name.
+
+        The name is unregistered automatically when the actor is unregistered,
+        e.g. when it is stopped. An actor may have multiple names.
+
+        Args:
+            name: the name to register
+            actor_ref: the actor to register the name for
+
+        Raises:
+            ValueError: if the name is already registered for another actor,
+                or if the actor is not registered
+
+        /// note | Version added: Pykka 4.5
+        ///
+
+        """
+        shard = cls._get_shard(actor_ref.actor_urn)
+        with shard.lock:
+            entry = shard.entries.get(actor_ref.actor_urn)
+            if entry is None or entry[1] is not actor_ref:
+                msg = f"{actor_ref} is not registered"
+                raise ValueError(msg)
+            with cls._actor_names_lock:
+                registered_ref = cls._actor_refs_by_name.get(name)
+                if registered_ref is not None and registered_ref is not actor_ref:
+                    msg = f"Name {name!r} is already registered for {registered_ref}"
+                    raise ValueError(msg)
+                cls._actor_refs_by_name[name] = actor_ref
+                cls._actor_names_by_urn.setdefault(actor_ref.actor_urn, set()).add(name)
+        logger.debug(f"Registered name {name!r} for {actor_ref}")
+
     @overload
     @classmethod
     def stop_all(
@@ -127,6 +280,7 @@ class ActorRegistry:
         *,
         block: Literal[True],
         timeout: float | None = ...,
+        parallel: bool = ...,
     ) -> list[bool]: ...
 
     @overload
@@ -136,6 +290,7 @@ class ActorRegistry:
         *,
         block: Literal[False],
         timeout: float | None = ...,
+        parallel: bool = ...,
     ) -> list[Future[bool]]: ...
 
     @overload
@@ -145,6 +300,7 @@ class ActorRegistry:
         *,
         block: bool = True,
         timeout: float | None = None,
+        parallel: bool = False,
     ) -> list[bool] | list[Future[bool]]: ...
 
     @classmethod
@@ -153,6 +309,7 @@ class ActorRegistry:
         *,
         block: bool = True,
         timeout: float | None = None,
+        parallel: bool = False,
     ) -> list[bool] | list[Future[bool]]:
         """Stop all running actors.
 
@@ -170,10 +327,38 @@ class ActorRegistry:
         by stopping dependees from a dependency's
         [`on_stop()`][pykka.Actor.on_stop] method.
 
+        If `block` and `parallel` are both `True`, the stop requests are
+        instead sent to all actors at once, and then `stop_all()` waits for
+        all of them to stop, so that the actors'
+        [`on_stop()`][pykka.Actor.on_stop] hooks run concurrently. In this
+        mode, `timeout` is the deadline for all actors to stop, and not for
+        each actor in turn. The stop requests
+        are still sent in the reverse of the order the actors were started in,
+        but the actors are not guaranteed to stop in that order.
+
+        Args:
+            block: whether to block until all actors have stopped
+            timeout: seconds to wait before timeout
+            parallel: whether to stop all actors at once when blocking
+
+        Raises:
+            pykka.Timeout: if timeout is reached while blocking
+
         Returns:
             a list with the return values for each stop action
 
+        /// note | Version changed: Pykka 4.5
+        Added the `parallel` argument.
+        ///
+
         """
+        if block and parallel:
+            return list(
+                get_all(
+                    [ref.stop(block=False) for ref in reversed(cls.get_all())],
+                    timeout=timeout,
+                )
+            )
         return (
             [
                 ref.stop(
@@ -200,14 +385,48 @@ class ActorRegistry:
         """Remove an [`ActorRef`][pykka.ActorRef] from the registry.
 
         This is done automatically when an actor is stopped, e.g. by calling
-        [`Actor.stop()`][pykka.Actor.stop].
+        [`Actor.stop()`][pykka.Actor.stop]. Any names registered for the actor
+        are unregistered as well.
         """
         removed = False
-        with cls._actor_refs_lock:
-            if actor_ref in cls._actor_refs:
-                cls._actor_refs.remove(actor_ref)
+        urn = actor_ref.actor_urn
+        shard = cls._get_shard(urn)
+        with shard.lock:
+            entry = shard.entries.get(urn)
+            if entry is not None and entry[1] is actor_ref:
+                del shard.entries[urn]
+                entries = shard.entries_by_class[actor_ref.actor_class]
+                del entries[urn]
+                if not entries:
+                    del shard.entries_by_class[actor_ref.actor_class]
+                with cls._actor_names_lock:
+                    for name in cls._actor_names_by_urn.pop(urn, ()):
+                        del cls._actor_refs_by_name[name]
                 removed = True
         if removed:
+            _metrics.retire(actor_ref)
             logger.debug(f"Unregistered {actor_ref}")
         else:
             logger.debug(f"Unregistered {actor_ref} (not found in registry)")
+
+    @classmethod
+    def unregister_name(
+        cls,
+        name: str,
+    ) -> None:
+        """Remove a name registered for an actor.
+
+        See [`register_name()`][pykka.ActorRegistry.register_name].
+
+        /// note | Version added: Pykka 4.5
+        ///
+        """
+        with cls._actor_names_lock:
+            actor_ref = cls._actor_refs_by_name.pop(name, None)
+            if actor_ref is None:
+                return
+            names = cls._actor_names_by_urn[actor_ref.actor_urn]
+            names.discard(name)
+            if not names:
+                del cls._actor_names_by_urn[actor_ref.actor_urn]
+        logger.debug(f"Unregistered name {name!r} for {actor_ref}")
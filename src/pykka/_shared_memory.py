@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from _typeshed import ReadableBuffer
+
+__all__ = ["SharedBuffer"]
+
+
+S = TypeVar("S", bound="SharedBuffer")
+
+
+class SharedBuffer:
+    """A buffer in shared memory that can be sent to other processes cheaply.
+
+    When a [`SharedBuffer`][pykka.SharedBuffer] is part of a message to a
+    [`ProcessActor`][pykka.ProcessActor], or part of a reply from one, only
+    the name and size of the shared memory segment are pickled and sent
+    through the pipe. The receiving process maps the same memory, so the
+    content of the buffer is never copied.
+
+    The process creating the buffer owns the shared memory segment, and must
+    call [`release()`][pykka.SharedBuffer.release] when done with the buffer,
+    or use the buffer as a context manager. This frees the shared memory
+    segment, so the owner should release the buffer only after the receivers
+    are done with it, e.g. after the reply to the message has arrived.
+
+    Copies of the buffer received by other processes are borrowed views of
+    the same memory. They are unmapped when released, or when they are
+    garbage collected.
+
+    Creating a shared memory segment is relatively expensive. For the best
+    throughput, reuse buffers for multiple messages, e.g. by writing each new
+    frame into the same buffer once the previous reply has arrived.
+
+    The buffer can be written to by any process. Thus, an actor may also
+    return its results by writing them into a buffer received from the
+    sender, without copying.
+
+    Example:
+        ```py
+        import pykka
+
+        class Checksummer(pykka.ProcessActor):
+            def on_receive(self, message):
+                return zlib.crc32(message.buf)
+
+        ref = Checksummer.start()
+        with pykka.SharedBuffer.from_bytes(frame) as shared:
+            checksum = ref.ask(shared)
+        ```
+
+    To use a buffer with e.g. NumPy, wrap its
+    [`buf`][pykka.SharedBuffer.buf] with `numpy.frombuffer()`. All such
+    views of the buffer must be deleted before the buffer is released.
+
+    Args:
+        size: the size of the buffer in bytes
+
+    /// note | Version added: Pykka 4.5
+    ///
+
+    """
+
+    size: int
+    """The size of the buffer in bytes."""
+
+    owner: bool
+    """Whether this process owns, and eventually frees, the shared memory."""
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            msg = "size must be at least 1"
+            raise ValueError(msg)
+        self._shm: shared_memory.SharedMemory | None = shared_memory.SharedMemory(
+            create=True, size=size
+        )
+        self._name = self._shm.name
+        self.size = size
+        self.owner = True
+
+    @classmethod
+    def from_bytes(cls: type[S], data: ReadableBuffer) -> S:
+        """Create a buffer in shared memory with a copy of `data`.
+
+        Args:
+            data: a `bytes`, `bytearray`, `memoryview`, or any other object
+                supporting the buffer protocol
+
+        """
+        with memoryview(data) as view, view.cast("B") as source:
+            shared = cls(len(source))
+            with shared.buf as target:
+                target[:] = source
+        return shared
+
+    @classmethod
+    def _attach(cls: type[S], name: str, size: int) -> S:
+        shared = cls.__new__(cls)
+        shared._shm = shared_memory.SharedMemory(name=name)  # noqa: SLF001
+        shared._name = name  # noqa: SLF001
+        shared.size = size
+        shared.owner = False
+        return shared
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self._attach, (self._get_shm().name, self.size))
+
+    def __repr__(self) -> str:
+        state = "owned" if self.owner else "borrowed"
+        if self._shm is None:
+            state = "released"
+        return f"<SharedBuffer name={self._name!r} size={self.size} {state}>"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self: S) -> S:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory segment."""
+        return self._name
+
+    @property
+    def buf(self) -> memoryview:
+        """A writable [`memoryview`][memoryview] of the buffer's content.
+
+        The view must be released before the buffer is released.
+
+        Raises:
+            ValueError: if the buffer has been released
+
+        """
+        shm = self._get_shm()
+        assert shm.buf is not None
+        return shm.buf[: self.size]
+
+    def tobytes(self) -> bytes:
+        """Return a copy of the buffer's content."""
+        with self.buf as view:
+            return view.tobytes()
+
+    def release(self) -> None:
+        """Unmap the buffer from this process, and free it if this is the owner.
+
+        Releasing a buffer more than once has no effect.
+
+        Raises:
+            BufferError: if views of the buffer are still in use
+
+        """
+        shm = self._shm
+        if shm is None:
+            return
+        shm.close()
+        self._shm = None
+        if self.owner:
+            shm.unlink()
+
+    def _get_shm(self) -> shared_memory.SharedMemory:
+        if self._shm is None:
+            msg = f"{self!r} has been released"
+            raise ValueError(msg)
+        return self._shm
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import collections
+import logging
+import time
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, get_args
+
+from pykka import messages
+from pykka._threading import ThreadingActor
+from pykka._types import SupervisionStrategy
+
+if TYPE_CHECKING:
+    from pykka import Actor, ActorRef
+
+__all__ = ["Supervisor"]
+
+logger = logging.getLogger("pykka")
+
+
+A = TypeVar("A", bound="Actor")
+
+
+class Supervisor(ThreadingActor):
+    """An actor that restarts its child actors when they fail.
+
+    A child actor fails when it raises an exception from
+    [`on_start()`][pykka.Actor.on_start], or from handling a message sent
+    with [`tell()`][pykka.ActorRef.tell]. Exceptions raised while handling
+    messages sent with [`ask()`][pykka.ActorRef.ask] are returned to the
+    caller, as usual, and do not fail the actor.
+
+    When a child fails, it is restarted in place: a new instance of the
+    actor's state is created by calling `__init__()` with the arguments the
+    child was started with, and [`on_start()`][pykka.Actor.on_start] is
+    called again. The child keeps its URN, its
+    [`ActorRef`][pykka.ActorRef], and the messages waiting in its inbox, so
+    the rest of the application can keep on using the same ref.
+
+    The supervisor restarts its children by its
+    [`strategy`][pykka.Supervisor.strategy]. If the children fail more than
+    [`max_restarts`][pykka.Supervisor.max_restarts] times within
+    [`restart_window`][pykka.Supervisor.restart_window] seconds, the
+    supervisor gives up. It then stops all its children, and fails itself.
+
+    Children are started with [`start_child()`][pykka.Supervisor.start_child],
+    typically from the supervisor's [`on_start()`][pykka.Actor.on_start].
+    Stopping the supervisor also stops its children.
+
+    Example:
+        ```py
+        class MySupervisor(pykka.Supervisor):
+            strategy = "one_for_all"
+
+            def on_start(self):
+                self.db = self.start_child(Database, dsn)
+                self.cache = self.start_child(Cache, self.db)
+
+        supervisor = MySupervisor.start()
+        ```
+
+    /// warning | Blocking
+    A failed child waits for the supervisor's decision, and then waits out
+    the backoff delay, in its own thread. Children must be
+    [`ThreadingActor`][pykka.ThreadingActor] subclasses. Children on a
+    [`dispatcher`][pykka.ThreadingActor.dispatcher] block one of the
+    dispatcher's worker threads while waiting.
+    ///
+
+    /// note | Version added: Pykka 4.5
+    ///
+
+    """
+
+    strategy: ClassVar[SupervisionStrategy] = "one_for_one"
+    """
+    How to restart the children when one of them fails:
+
+    - `"one_for_one"`: only the child that failed is restarted. This is the
+      default.
+    - `"one_for_all"`: all the children are restarted. The children that did
+      not fail are stopped with [`on_stop()`][pykka.Actor.on_stop] before
+      they are restarted, after they have handled the messages that were
+      sent to them before the failure.
+    """
+
+    max_restarts: ClassVar[int] = 3
+    """
+    The maximum number of restarts within
+    [`restart_window`][pykka.Supervisor.restart_window] seconds, before the
+    supervisor gives up.
+    """
+
+    restart_window: ClassVar[float] = 5.0
+    """The number of seconds to count restarts within."""
+
+    restart_backoff: ClassVar[float] = 0.0
+    """
+    The number of seconds to wait before restarting a child for the first
+    time within the restart window. The delay is doubled for each further
+    restart within the window, up to
+    [`restart_backoff_max`][pykka.Supervisor.restart_backoff_max]. If zero,
+    the default, children are restarted right away.
+    """
+
+    restart_backoff_max: ClassVar[float] = 10.0
+    """The maximum number of seconds to wait before restarting a child."""
+
+    children: list[ActorRef[Any]]
+    """The actors started by [`start_child()`][pykka.Supervisor.start_child]."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if self.strategy not in get_args(SupervisionStrategy):
+            msg = f"Unknown supervision strategy: {self.strategy!r}"
+            raise ValueError(msg)
+        self.children = []
+        self._restarts: collections.deque[float] = collections.deque()
+
+    def start_child(
+        self,
+        actor_class: type[A],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ActorRef[A]:
+        """Start an actor supervised by this supervisor.
+
+        Any arguments other than `actor_class` are passed on to the actor's
+        constructor, both when it is started and when it is restarted.
+
+        Args:
+            actor_class: the class of the actor to start
+            args: positional arguments for the actor
+            kwargs: keyword arguments for the actor
+
+        Returns:
+            a reference to the child
+
+        Raises:
+            TypeError: if the actor class is not a
+                [`ThreadingActor`][pykka.ThreadingActor] subclass
+
+        """
+        if ThreadingActor not in actor_class.__mro__:
+            msg = "Supervised actors must be ThreadingActor subclasses"
+            raise TypeError(msg)
+        child = actor_class._start_supervised(self.actor_ref, *args, **kwargs)  # noqa: SLF001
+        self.children.append(child)
+        return child
+
+    def on_stop(self) -> None:
+        """Stop the children when the supervisor stops.
+
+        If you override this method, remember to call the superclass'
+        implementation.
+        """
+        self._stop_children()
+
+    def _stop_children(self) -> None:
+        # Don't wait for the children, as they may be waiting for us.
+        for child in self.children:
+            child.stop(block=False)
+
+    def _handle_receive(self, message: Any) -> Any:
+        if isinstance(message, messages._ChildFailed):  # noqa: SLF001
+            return self._handle_child_failure(message.child, message.exception)
+        return super()._handle_receive(message)
+
+    def _handle_child_failure(
+        self,
+        child: ActorRef[Any],
+        exception: BaseException | None,
+    ) -> float | None:
+        """Decide how long the child should wait before restarting.
+
+        Returns `None` if the child should stop instead.
+        """
+        now = time.monotonic()
+        while self._restarts and self._restarts[0] <= now - self.restart_window:
+            self._restarts.popleft()
+        if len(self._restarts) >= self.max_restarts:
+            logger.error(
+                f"{self} gives up after {len(self._restarts)} restarts "
+                f"within {self.restart_window} seconds; "
+                f"stopping its children and itself."
+            )
+            self._stop_children()
+            self._handle_failure(
+                type(exception) if exception is not None else None,
+                exception,
+                exception.__traceback__ if exception is not None else None,
+            )
+            self._recover()
+            return None
+
+        delay = 0.0
+        if self.restart_backoff > 0:
+            delay = min(
+                self.restart_backoff * 2 ** len(self._restarts),
+                self.restart_backoff_max,
+            )
+        self._restarts.append(now)
+        if self.strategy == "one_for_all":
+            for sibling in self.children:
+                if sibling != child and sibling.is_alive():
+                    sibling.tell(messages._ActorRestart(delay))  # noqa: SLF001
+        return delay
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+import logging
 import queue
 import sys
 import threading
-import time
 from itertools import count
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeVar
 
 from pykka import Actor, Future, Timeout
+from pykka._dispatcher import DispatchedInbox, ThreadPoolDispatcher
+from pykka._future import _Unset
+from pykka._inbox import PriorityInbox, QueueInbox, SimpleQueueInbox
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pykka._actor import ActorInbox
     from pykka._envelope import Envelope
     from pykka._future import GetHookFunc
-    from pykka._types import OptExcInfo
+    from pykka._types import OptExcInfo, OverflowPolicy
 
 __all__ = ["ThreadingActor", "ThreadingFuture"]
 
+logger = logging.getLogger("pykka")
+
 
 T = TypeVar("T")
 
@@ -26,6 +33,16 @@ class ThreadingFutureResult(NamedTuple):
     exc_info: OptExcInfo | None = None
 
 
+# Futures share a small, fixed set of locks instead of allocating a lock each.
+# The locks are only held briefly, to make the transitions of a future's state
+# atomic, and never while waiting for a result.
+_future_locks = tuple(threading.Lock() for _ in range(64))
+
+
+def _future_lock(future: ThreadingFuture[Any]) -> threading.Lock:
+    return _future_locks[(id(future) >> 4) % len(_future_locks)]
+
+
 class ThreadingFuture(Future[T]):
     """Implementation of [`Future`][pykka.Future] for use with regular Python threads.
 
@@ -45,51 +62,80 @@ class ThreadingFuture(Future[T]):
 
     def __init__(self) -> None:
         super().__init__()
-        self._condition: threading.Condition = threading.Condition()
         self._result: ThreadingFutureResult | None = None
+        # Only allocated if a caller has to wait for the result.
+        self._waiters: list[threading.Lock] | None = None
+        # Only allocated if a get hook is set.
+        self._get_hook_lock: threading.Lock | None = None
+        # Only allocated if a done callback is added before the result is set.
+        self._callbacks: list[Callable[[Future[T]], None]] | None = None
 
     def get(
         self,
         *,
         timeout: float | None = None,
     ) -> Any:
-        deadline: float | None = None if timeout is None else time.monotonic() + timeout
-
-        with self._condition:
-            try:
-                return super().get(timeout=timeout)
-            except NotImplementedError:
-                pass
-
-            while self._result is None:
-                remaining = (
-                    deadline - time.monotonic() if deadline is not None else None
-                )
-                if remaining is not None and remaining <= 0.0:
-                    msg = f"{timeout} seconds"
-                    raise Timeout(msg)
-                self._condition.wait(timeout=remaining)
-
-            if self._result.exc_info is not None:
-                (exc_type, exc_value, exc_traceback) = self._result.exc_info
-                assert exc_type is not None
-                if exc_value is None:
-                    exc_value = exc_type()
-                if exc_value.__traceback__ is not exc_traceback:
-                    raise exc_value.with_traceback(exc_traceback)
-                raise exc_value
-
-            return self._result.value
+        result = self._result
+        if result is None:
+            if self._get_hook is not None:
+                return self._get_from_hook(timeout)
+            self._wait(timeout)
+            result = self._result
+            if result is None:
+                # A get hook was set while we were waiting.
+                return self._get_from_hook(timeout)
+
+        if result.exc_info is not None:
+            (exc_type, exc_value, exc_traceback) = result.exc_info
+            assert exc_type is not None
+            if exc_value is None:
+                exc_value = exc_type()
+            if exc_value.__traceback__ is not exc_traceback:
+                raise exc_value.with_traceback(exc_traceback)
+            raise exc_value
+
+        return result.value
+
+    def _wait(self, timeout: float | None) -> None:
+        # The waiter is a lock that is acquired up front, and released by the
+        # setter. This is cheaper than allocating a condition variable.
+        waiter = threading.Lock()
+        waiter.acquire()
+        with _future_lock(self):
+            if self._result is not None or self._get_hook is not None:
+                return
+            if self._waiters is None:
+                self._waiters = []
+            self._waiters.append(waiter)
+        if waiter.acquire(timeout=-1 if timeout is None else timeout):
+            return
+        with _future_lock(self):
+            if self._waiters is not None and waiter in self._waiters:
+                self._waiters.remove(waiter)
+                msg = f"{timeout} seconds"
+                raise Timeout(msg)
+
+    def _release_waiters(self) -> None:
+        """Release all waiters. Must be called while holding the future's lock."""
+        if self._waiters is not None:
+            for waiter in self._waiters:
+                waiter.release()
+            self._waiters = None
+
+    def _get_from_hook(self, timeout: float | None) -> Any:
+        assert self._get_hook_lock is not None
+        with self._get_hook_lock:
+            value = super().get(timeout=timeout)
+            with _future_lock(self):
+                callbacks, self._callbacks = self._callbacks, None
+        self._run_callbacks(callbacks)
+        return value
 
     def set(
         self,
         value: Any | None = None,
     ) -> None:
-        with self._condition:
-            if self._result is not None or self._get_hook is not None:
-                raise queue.Full
-            self._result = ThreadingFutureResult(value=value)
-            self._condition.notify_all()
+        self._set_result(ThreadingFutureResult(value=value))
 
     def set_exception(
         self,
@@ -98,22 +144,54 @@ class ThreadingFuture(Future[T]):
         assert exc_info is None or len(exc_info) == 3
         if exc_info is None:
             exc_info = sys.exc_info()
+        self._set_result(ThreadingFutureResult(exc_info=exc_info))
 
-        with self._condition:
+    def _set_result(self, result: ThreadingFutureResult) -> None:
+        with _future_lock(self):
             if self._result is not None or self._get_hook is not None:
                 raise queue.Full
-            self._result = ThreadingFutureResult(exc_info=exc_info)
-            self._condition.notify_all()
+            self._result = result
+            self._release_waiters()
+            callbacks, self._callbacks = self._callbacks, None
+        self._run_callbacks(callbacks)
+
+    def add_done_callback(
+        self,
+        func: Callable[[Future[T]], None],
+    ) -> None:
+        with _future_lock(self):
+            if self._result is None and not self._get_hook_evaluated():
+                if self._callbacks is None:
+                    self._callbacks = []
+                self._callbacks.append(func)
+                return
+        self._run_callbacks([func])
+
+    def _get_hook_evaluated(self) -> bool:
+        return not isinstance(self._get_hook_result, _Unset)
+
+    def _run_callbacks(
+        self,
+        callbacks: list[Callable[[Future[T]], None]] | None,
+    ) -> None:
+        if callbacks is None:
+            return
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:  # noqa: PERF203
+                logger.exception(f"Exception in done callback of {self!r}:")
 
     def set_get_hook(
         self,
         func: GetHookFunc[T],
     ) -> None:
-        with self._condition:
+        with _future_lock(self):
             if self._result is not None:
                 raise queue.Full
+            self._get_hook_lock = threading.Lock()
             super().set_get_hook(func)
-            self._condition.notify_all()
+            self._release_waiters()
 
 
 _actor_thread_counter = count(0)
@@ -138,16 +216,193 @@ class ThreadingActor(Actor):
     always has to be set explicitly for the actor to run on a daemonic thread.
     """
 
+    dispatcher: ClassVar[ThreadPoolDispatcher | None] = None
+    """
+    A [`ThreadPoolDispatcher`][pykka.ThreadPoolDispatcher] to run the actor on,
+    or `None` to run the actor on a dedicated thread. This must be set before
+    [`Actor.start()`][pykka.Actor.start] is called.
+
+    When a dispatcher is set,
+    [`use_daemon_thread`][pykka.ThreadingActor.use_daemon_thread] has no
+    effect, as the dispatcher's worker threads are always daemon threads.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    inbox_batch_size: ClassVar[int] = 1
+    """
+    The maximum number of messages the actor takes from its inbox at once.
+
+    All messages already waiting in the inbox, up to this number, are taken
+    from the inbox in a single locked operation, which reduces locking
+    overhead when the actor receives messages at a high rate. This also
+    decides the maximum size of the batches passed to
+    [`Actor.on_receive_batch()`][pykka.Actor.on_receive_batch].
+
+    When running on a [`dispatcher`][pykka.ThreadingActor.dispatcher], the
+    dispatcher's `throughput` is used as the batch size instead.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    use_simple_queue_inbox: ClassVar[bool] = False
+    """
+    A boolean value indicating whether the actor's inbox is based on
+    [`queue.SimpleQueue`][queue.SimpleQueue] (`True`) or
+    [`queue.Queue`][queue.Queue] (`False`). This must be set before
+    [`Actor.start()`][pykka.Actor.start] is called.
+
+    [`queue.SimpleQueue`][queue.SimpleQueue] is implemented in C and makes
+    [`ActorRef.tell()`][pykka.ActorRef.tell] and
+    [`ActorRef.ask()`][pykka.ActorRef.ask] cheaper, but it lacks features
+    that some of the other inbox options depend on.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    inbox_maxsize: ClassVar[int] = 0
+    """
+    The maximum number of messages in the actor's inbox. If zero, the default,
+    the inbox is unbounded. This must be set before
+    [`Actor.start()`][pykka.Actor.start] is called.
+
+    Requests to stop the actor are always accepted, even if the inbox is
+    full.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    inbox_overflow_policy: ClassVar[OverflowPolicy] = "block"
+    """
+    What to do when a message is sent to an actor with a full inbox:
+
+    - `"block"`: block the sender until there is room in the inbox, or until
+      [`inbox_put_timeout`][pykka.ThreadingActor.inbox_put_timeout] is
+      reached, and then raise [`MailboxFull`][pykka.MailboxFull].
+    - `"raise"`: raise [`MailboxFull`][pykka.MailboxFull] immediately.
+    - `"drop_newest"`: drop the message that was sent.
+    - `"drop_oldest"`: drop the oldest message in the inbox to make room for
+      the message that was sent.
+
+    If a dropped message was sent with [`ask()`][pykka.ActorRef.ask],
+    [`MailboxFull`][pykka.MailboxFull] is set on its future.
+
+    Only used if [`inbox_maxsize`][pykka.ThreadingActor.inbox_maxsize] is set.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    inbox_put_timeout: ClassVar[float | None] = None
+    """
+    The default number of seconds to block a sender when the inbox is full
+    and the overflow policy is `"block"`. If `None`, the default, the sender
+    is blocked until there is room in the inbox.
+
+    Can be overridden per message with the `timeout` argument to
+    [`ActorRef.tell()`][pykka.ActorRef.tell].
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    use_priority_inbox: ClassVar[bool] = False
+    """
+    A boolean value indicating whether the actor's inbox hands out the most
+    urgent messages first. This must be set before
+    [`Actor.start()`][pykka.Actor.start] is called.
+
+    In a priority inbox, requests to stop the actor skip ahead of all other
+    messages, so that the actor stops quickly even if it has a large backlog.
+    Messages left in the inbox when the actor stops are replied to with
+    [`ActorDeadError`][pykka.ActorDeadError], as usual.
+
+    Other messages are ordered by
+    [`message_priority()`][pykka.ThreadingActor.message_priority].
+
+    The `"drop_oldest"`
+    [`inbox_overflow_policy`][pykka.ThreadingActor.inbox_overflow_policy] is
+    not supported by priority inboxes.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
     @staticmethod
-    def _create_actor_inbox() -> ActorInbox:
-        inbox: queue.Queue[Envelope[Any]] = queue.Queue()
-        return inbox
+    def message_priority(message: Any) -> Any:  # noqa: ARG004
+        """Return the priority of a message put in a priority inbox.
+
+        May be overridden to prioritize messages when
+        [`use_priority_inbox`][pykka.ThreadingActor.use_priority_inbox] is
+        set. Messages with lower priority values are handled first. Messages
+        with the same priority are handled in the order they were received.
+        By default, all messages have the same priority.
+
+        The method is called in the sender's thread, and must be a static
+        method.
+
+        Example:
+            ```py
+            class MyActor(pykka.ThreadingActor):
+                use_priority_inbox = True
+
+                @staticmethod
+                def message_priority(message):
+                    return 0 if message == "health check" else 1
+            ```
+
+        /// note | Version added: Pykka 4.5
+        ///
+
+        """
+        return 0
+
+    @classmethod
+    def _create_actor_inbox(cls) -> ActorInbox:
+        if (cls.inbox_maxsize > 0 or cls.use_priority_inbox) and (
+            cls.dispatcher is not None or cls.use_simple_queue_inbox
+        ):
+            msg = (
+                "inbox_maxsize and use_priority_inbox cannot be combined with "
+                "dispatcher or use_simple_queue_inbox"
+            )
+            raise ValueError(msg)
+        if cls.dispatcher is not None:
+            return DispatchedInbox(cls.dispatcher)
+        if cls.use_simple_queue_inbox:
+            return SimpleQueueInbox()
+        if cls.use_priority_inbox:
+            return PriorityInbox(
+                cls.inbox_maxsize,
+                priority_key=cls.message_priority,
+                overflow_policy=cls.inbox_overflow_policy,
+                put_timeout=cls.inbox_put_timeout,
+            )
+        return QueueInbox(
+            cls.inbox_maxsize,
+            overflow_policy=cls.inbox_overflow_policy,
+            put_timeout=cls.inbox_put_timeout,
+        )
 
     @staticmethod
     def _create_future() -> Future[Any]:
         return ThreadingFuture()
 
+    def _get_envelopes(self) -> list[Envelope[Any]]:
+        if self.inbox_batch_size > 1 and isinstance(
+            self.actor_inbox, (QueueInbox, SimpleQueueInbox)
+        ):
+            return self.actor_inbox.get_batch(self.inbox_batch_size)
+        return [self.actor_inbox.get()]
+
     def _start_actor_loop(self) -> None:
+        if isinstance(self.actor_inbox, DispatchedInbox):
+            self.actor_inbox.attach(self)
+            return
         thread = threading.Thread(
             target=self._actor_loop,
             name=f"{self.__class__.__name__}-{next(_actor_thread_counter)}",
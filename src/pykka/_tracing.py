@@ -0,0 +1,227 @@
+"""Internal state of the tracing hooks.
+
+See [`pykka.tracing`][pykka.tracing] for the public API.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from pykka import ActorRef, Future
+    from pykka._envelope import Envelope
+
+
+logger = logging.getLogger("pykka")
+
+
+class SpanContext(NamedTuple):
+    """Identifies the span of a message, and links it to its parent span.
+
+    The span of a message covers the message from it is sent until the
+    receiving actor has handled it. The ids are formatted as in the W3C Trace
+    Context, so they can be passed on to e.g. OpenTelemetry.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    trace_id: str
+    """The id of the trace, shared by all spans caused by the same root
+    message, as 32 hex digits."""
+
+    span_id: str
+    """The id of this span, as 16 hex digits."""
+
+    parent_span_id: str | None
+    """The id of the span of the message the sender was handling when it sent
+    this message, or `None` if the message was sent from outside an actor."""
+
+
+class TraceEvent(NamedTuple):
+    """An event in the life of a message, as passed to tracers.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    actor_ref: ActorRef[Any]
+    """The actor the message was sent to."""
+
+    message: Any
+    """The message."""
+
+    context: SpanContext
+    """The span context of the message."""
+
+    timestamp: float
+    """The [`time.monotonic()`][time.monotonic] time of the event."""
+
+    duration: float | None = None
+    """For receive end events, the time spent handling the message. For reply
+    events, the time from the message was sent until the reply was set."""
+
+    exception: BaseException | None = None
+    """For receive end and reply events, the exception raised by the actor,
+    if any."""
+
+
+class Tracer:
+    """Base class for tracers, called as messages pass between actors.
+
+    Subclass this and override the methods for the events you are
+    interested in, then register an instance of your tracer with
+    [`add_tracer()`][pykka.tracing.add_tracer].
+
+    The methods are called synchronously in the thread where the event
+    happens, so they should return quickly. Exceptions raised by a tracer are
+    logged and otherwise ignored.
+
+    /// note | Version added: Pykka 4.5
+    ///
+    """
+
+    def on_send(self, event: TraceEvent) -> None:
+        """Trace a message right before it is put into an actor's inbox."""
+
+    def on_receive_start(self, event: TraceEvent) -> None:
+        """Trace the start of an actor handling a message.
+
+        This is called in the actor's thread.
+        """
+
+    def on_receive_end(self, event: TraceEvent) -> None:
+        """Trace the end of an actor handling a message.
+
+        This is called in the actor's thread. If the message was sent with
+        [`ask()`][pykka.ActorRef.ask], this is called after the reply has been
+        set.
+        """
+
+    def on_reply(self, event: TraceEvent) -> None:
+        """Trace the reply to a message sent with `ask()` being set.
+
+        This is called in the thread setting the reply, and is also called if
+        the message failed, e.g. because the actor was dead.
+        """
+
+
+# Registered tracers. The tuple is replaced, never mutated, so that the hot
+# paths can check and iterate over it without locking.
+tracers: tuple[Tracer, ...] = ()
+
+lock = threading.Lock()
+
+current: contextvars.ContextVar[SpanContext | None] = contextvars.ContextVar(
+    "pykka_span_context", default=None
+)
+"""The span context of the message being handled by the current actor."""
+
+
+def _new_context() -> SpanContext:
+    parent = current.get()
+    span_id = f"{random.getrandbits(64):016x}"
+    if parent is None:
+        return SpanContext(f"{random.getrandbits(128):032x}", span_id, None)
+    return SpanContext(parent.trace_id, span_id, parent.span_id)
+
+
+def _call(method_name: str, event: TraceEvent) -> None:
+    for tracer in tracers:
+        try:
+            getattr(tracer, method_name)(event)
+        except Exception:  # noqa: PERF203
+            logger.exception(f"Exception in {method_name}() of {tracer!r}:")
+
+
+def send(actor_ref: ActorRef[Any], envelope: Envelope[Any]) -> None:
+    """Start a span for an envelope about to be put into the actor's inbox."""
+    context = _new_context()
+    envelope.trace_context = context
+    if envelope.enqueued_at is None:
+        envelope.enqueued_at = time.monotonic()
+    _call(
+        "on_send",
+        TraceEvent(actor_ref, envelope.message, context, envelope.enqueued_at),
+    )
+    if envelope.reply_to is None:
+        return
+    sent_at = envelope.enqueued_at
+    message = envelope.message
+
+    def on_reply(future: Future[Any]) -> None:
+        timestamp = time.monotonic()
+        exception = None
+        try:
+            future.get(timeout=0)
+        except Exception as exc:  # noqa: BLE001
+            exception = exc
+        _call(
+            "on_reply",
+            TraceEvent(
+                actor_ref,
+                message,
+                context,
+                timestamp,
+                duration=timestamp - sent_at,
+                exception=exception,
+            ),
+        )
+
+    # Reply events are not supported by futures without done callbacks.
+    with contextlib.suppress(NotImplementedError):
+        envelope.reply_to.add_done_callback(on_reply)
+
+
+class ReceiveSpan:
+    """The tracing state of an actor handling one or more envelopes."""
+
+    __slots__ = ["actor_ref", "envelopes", "exception", "started", "token"]
+
+    def __init__(
+        self,
+        actor_ref: ActorRef[Any],
+        envelopes: list[Envelope[Any]],
+    ) -> None:
+        self.actor_ref = actor_ref
+        self.envelopes = [e for e in envelopes if e.trace_context is not None]
+        self.exception: BaseException | None = None
+        self.started = time.monotonic()
+        # Messages sent while handling a batch of messages have no parent.
+        self.token = current.set(
+            envelopes[0].trace_context if len(envelopes) == 1 else None
+        )
+        for envelope in self.envelopes:
+            assert envelope.trace_context is not None
+            _call(
+                "on_receive_start",
+                TraceEvent(
+                    actor_ref,
+                    envelope.message,
+                    envelope.trace_context,
+                    self.started,
+                ),
+            )
+
+    def end(self) -> None:
+        current.reset(self.token)
+        finished = time.monotonic()
+        for envelope in self.envelopes:
+            assert envelope.trace_context is not None
+            _call(
+                "on_receive_end",
+                TraceEvent(
+                    self.actor_ref,
+                    envelope.message,
+                    envelope.trace_context,
+                    finished,
+                    duration=finished - self.started,
+                    exception=self.exception,
+                ),
+            )
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 from types import TracebackType
-from typing import TypeAlias
+from typing import Literal, TypeAlias
 
 AttrPath: TypeAlias = tuple[str, ...]
 
+OverflowPolicy: TypeAlias = Literal["block", "drop_newest", "drop_oldest", "raise"]
+
+Routing: TypeAlias = Literal[
+    "round_robin",
+    "random",
+    "smallest_mailbox",
+    "balancing",
+    "consistent_hash",
+]
+
+SupervisionStrategy: TypeAlias = Literal["one_for_one", "one_for_all"]
+
 
 # OptExcInfo matches the return type of sys.exc_info() in typeshed
 OptExcInfo = tuple[
@@ -29,6 +29,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
+    from pykka import ActorRef
     from pykka._types import AttrPath
 
 
@@ -36,6 +37,19 @@ class _ActorStop(NamedTuple):  # pyright: ignore[reportUnusedClass]
     """Internal message."""
 
 
+class _ActorRestart(NamedTuple):  # pyright: ignore[reportUnusedClass]
+    """Internal message."""
+
+    delay: float
+
+
+class _ChildFailed(NamedTuple):  # pyright: ignore[reportUnusedClass]
+    """Internal message."""
+
+    child: ActorRef[Any]
+    exception: BaseException | None
+
+
 class ProxyCall(NamedTuple):
     """Message to ask the actor to call the method with the arguments.
 
@@ -0,0 +1,252 @@
+"""Metrics on the messages sent to and processed by actors.
+
+Metrics collection is disabled by default, and must be enabled with
+[`enable()`][pykka.metrics.enable]. Once enabled, Pykka keeps count of the
+messages sent to and processed by each actor, how long messages waited in
+the actor's inbox, and how long the actor spent handling them. Counters of
+stopped actors are added to the totals of their actor class.
+
+To find the actor that is the bottleneck of your application:
+
+    import pykka.metrics
+
+    pykka.metrics.enable()
+
+    ...  # Start actors and send them messages
+
+    for metrics in pykka.metrics.snapshot().actors:
+        print(metrics.actor_urn, metrics.mailbox_depth, metrics.mean_wait_seconds)
+
+The metrics can also be exported in the Prometheus text format with
+[`write_prometheus()`][pykka.metrics.write_prometheus], e.g. to a file read
+by the Prometheus node exporter's textfile collector.
+
+Messages handled in the process of a [`ProcessActor`][pykka.ProcessActor]
+are not counted in the process that started the actor.
+
+/// note | Version added: Pykka 4.5
+///
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from pykka import _metrics
+
+if TYPE_CHECKING:
+    from typing import TextIO
+
+__all__ = [
+    "ActorMetrics",
+    "MetricsSnapshot",
+    "disable",
+    "enable",
+    "format_prometheus",
+    "reset",
+    "snapshot",
+    "write_prometheus",
+]
+
+
+class ActorMetrics(NamedTuple):
+    """Metrics of an actor, or of all actors of a class."""
+
+    actor_class: str
+    """The fully qualified name of the actor class."""
+
+    actor_urn: str | None
+    """The actor's URN, or `None` for the totals of an actor class."""
+
+    messages_sent: int
+    """The number of messages put into the inbox."""
+
+    messages_processed: int
+    """The number of messages handled by the actor."""
+
+    wait_seconds_total: float
+    """The total time messages spent in the inbox before being handled."""
+
+    wait_seconds_max: float
+    """The longest time a message spent in the inbox before being handled."""
+
+    handler_seconds_total: float
+    """The total time spent handling messages."""
+
+    handler_seconds_max: float
+    """The longest time spent handling a single message."""
+
+    @property
+    def mailbox_depth(self) -> int:
+        """The number of messages sent, but not yet processed."""
+        return max(0, self.messages_sent - self.messages_processed)
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """The mean time messages spent in the inbox before being handled."""
+        if not self.messages_processed:
+            return 0.0
+        return self.wait_seconds_total / self.messages_processed
+
+    @property
+    def mean_handler_seconds(self) -> float:
+        """The mean time spent handling a message."""
+        if not self.messages_processed:
+            return 0.0
+        return self.handler_seconds_total / self.messages_processed
+
+
+class MetricsSnapshot(NamedTuple):
+    """The metrics of all actors at a point in time."""
+
+    actors: list[ActorMetrics]
+    """Metrics of each running actor."""
+
+    classes: list[ActorMetrics]
+    """Metrics of all actors of each actor class, including stopped actors."""
+
+
+def enable() -> None:
+    """Start collecting metrics."""
+    _metrics.enabled = True
+
+
+def disable() -> None:
+    """Stop collecting metrics. The metrics collected so far are kept."""
+    _metrics.enabled = False
+
+
+def reset() -> None:
+    """Forget all metrics collected so far."""
+    _metrics.reset()
+
+
+def snapshot() -> MetricsSnapshot:
+    """Get the metrics collected so far."""
+    with _metrics.lock:
+        running = list(_metrics.actors.items())
+        retired = list(_metrics.retired.items())
+
+    actors: list[ActorMetrics] = []
+    classes: dict[str, _metrics.Counters] = {}
+    for class_name, counters in retired:
+        with counters.lock:
+            classes.setdefault(class_name, _metrics.Counters()).add(counters)
+    for actor_urn, (class_name, counters) in running:
+        with counters.lock:
+            actors.append(_to_actor_metrics(class_name, actor_urn, counters))
+            classes.setdefault(class_name, _metrics.Counters()).add(counters)
+
+    return MetricsSnapshot(
+        actors=actors,
+        classes=[
+            _to_actor_metrics(class_name, None, counters)
+            for class_name, counters in sorted(classes.items())
+        ],
+    )
+
+
+def _to_actor_metrics(
+    class_name: str,
+    actor_urn: str | None,
+    counters: _metrics.Counters,
+) -> ActorMetrics:
+    return ActorMetrics(
+        actor_class=class_name,
+        actor_urn=actor_urn,
+        messages_sent=counters.messages_sent,
+        messages_processed=counters.messages_processed,
+        wait_seconds_total=counters.wait_seconds_total,
+        wait_seconds_max=counters.wait_seconds_max,
+        handler_seconds_total=counters.handler_seconds_total,
+        handler_seconds_max=counters.handler_seconds_max,
+    )
+
+
+_PROMETHEUS_METRICS = [
+    ("messages_sent", "counter", "Messages put into actor inboxes."),
+    ("messages_processed", "counter", "Messages handled by actors."),
+    ("mailbox_depth", "gauge", "Messages sent, but not yet processed."),
+    ("wait_seconds_total", "counter", "Time messages spent in actor inboxes."),
+    ("wait_seconds_max", "gauge", "Longest time a message spent in an inbox."),
+    ("handler_seconds_total", "counter", "Time actors spent handling messages."),
+    ("handler_seconds_max", "gauge", "Longest time spent handling a message."),
+]
+
+
+def format_prometheus(
+    metrics: MetricsSnapshot | None = None,
+    *,
+    per_actor: bool = False,
+) -> str:
+    """Format metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: the metrics to format. Defaults to a new
+            [`snapshot()`][pykka.metrics.snapshot].
+        per_actor: whether to include a series for each running actor,
+            labeled with the actor's URN, in addition to the series for each
+            actor class
+
+    Returns:
+        the formatted metrics
+
+    """
+    if metrics is None:
+        metrics = snapshot()
+    series = list(metrics.classes)
+    if per_actor:
+        series.extend(metrics.actors)
+
+    lines: list[str] = []
+    for name, metric_type, description in _PROMETHEUS_METRICS:
+        metric_name = f"pykka_{name}"
+        if metric_type == "counter" and not name.endswith("_total"):
+            metric_name += "_total"
+        lines.append(f"# HELP {metric_name} {description}")
+        lines.append(f"# TYPE {metric_name} {metric_type}")
+        for item in series:
+            labels = f'actor_class="{_escape(item.actor_class)}"'
+            if item.actor_urn is not None:
+                labels += f',actor_urn="{_escape(item.actor_urn)}"'
+            lines.append(f"{metric_name}{{{labels}}} {getattr(item, name)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(
+    target: str | os.PathLike[str] | TextIO,
+    *,
+    per_actor: bool = False,
+) -> None:
+    """Write a snapshot of the metrics in the Prometheus text format.
+
+    If `target` is a path, the file is replaced atomically, so that readers
+    never see a partially written file. To write to a socket, pass a file
+    object made with [`socket.makefile()`][socket.socket.makefile].
+
+    Args:
+        target: the path of the file to write, or a text file object
+        per_actor: see [`format_prometheus()`][pykka.metrics.format_prometheus]
+
+    """
+    text = format_prometheus(per_actor=per_actor)
+    if not isinstance(target, (str, os.PathLike)):
+        target.write(text)
+        target.flush()
+        return
+    path = Path(target)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(text)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
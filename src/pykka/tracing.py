@@ -0,0 +1,92 @@
+"""Hooks for tracing messages as they pass between actors.
+
+Tracing is disabled until a [`Tracer`][pykka.tracing.Tracer] is registered
+with [`add_tracer()`][pykka.tracing.add_tracer]. While no tracers are
+registered, the cost of the hooks is a single check per message sent and
+handled.
+
+Each message sent while tracing gets a [`SpanContext`][pykka.tracing.SpanContext]
+which travels with the message to the receiving actor. Messages sent by an
+actor while it handles a message become child spans of the handled
+message's span, so that the spans of a trace link up across the actor graph.
+
+To collect the events in memory, e.g. in a test:
+
+    import pykka.tracing
+
+    class Collector(pykka.tracing.Tracer):
+        def __init__(self):
+            self.events = []
+
+        def on_receive_end(self, event):
+            self.events.append(event)
+
+    collector = Collector()
+    pykka.tracing.add_tracer(collector)
+    try:
+        ...  # Start actors and send them messages
+    finally:
+        pykka.tracing.remove_tracer(collector)
+
+The span context is kept in the actor's process. Messages sent to a
+[`ProcessActor`][pykka.ProcessActor] keep their span context, but tracers
+must be registered in the actor's process to receive its events.
+
+/// note | Version added: Pykka 4.5
+///
+"""
+
+from __future__ import annotations
+
+from pykka import _tracing
+from pykka._tracing import SpanContext, TraceEvent, Tracer
+
+__all__ = [
+    "SpanContext",
+    "TraceEvent",
+    "Tracer",
+    "add_tracer",
+    "current_context",
+    "remove_tracer",
+]
+
+
+def add_tracer(tracer: Tracer) -> None:
+    """Register a tracer to be called for all messages sent from now on.
+
+    Args:
+        tracer: the tracer to add
+
+    """
+    with _tracing.lock:
+        _tracing.tracers = (*_tracing.tracers, tracer)
+
+
+def remove_tracer(tracer: Tracer) -> None:
+    """Unregister a tracer.
+
+    Args:
+        tracer: the tracer to remove
+
+    Raises:
+        ValueError: if the tracer is not registered
+
+    """
+    with _tracing.lock:
+        tracers = list(_tracing.tracers)
+        tracers.remove(tracer)
+        _tracing.tracers = tuple(tracers)
+
+
+def current_context() -> SpanContext | None:
+    """Get the span context of the message the current actor is handling.
+
+    This can be used to link spans of your own, e.g. around a database query
+    made by the actor, to the message being handled.
+
+    Returns:
+        the span context, or `None` if not called from an actor handling a
+        traced message
+
+    """
+    return _tracing.current.get()
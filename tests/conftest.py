@@ -11,7 +11,14 @@ from typing import (
 
 import pytest
 
-from pykka import ActorRegistry, ThreadingActor, ThreadingFuture
+from pykka import (
+    ActorRegistry,
+    AsyncioActor,
+    AsyncioFuture,
+    ThreadingActor,
+    ThreadingFuture,
+    ThreadPoolDispatcher,
+)
 from tests.log_handler import PykkaTestLogHandler
 from tests.types import Events, Runtime
 
@@ -21,6 +28,14 @@ if TYPE_CHECKING:
     from pykka import Actor, Future
 
 
+class PooledThreadingActor(ThreadingActor):
+    dispatcher = ThreadPoolDispatcher(max_workers=16)
+
+
+class SimpleQueueThreadingActor(ThreadingActor):
+    use_simple_queue_inbox = True
+
+
 RUNTIMES = {
     "threading": pytest.param(
         Runtime(
@@ -31,7 +46,37 @@ RUNTIMES = {
             sleep_func=time.sleep,
         ),
         id="threading",
-    )
+    ),
+    "threading-simple-queue": pytest.param(
+        Runtime(
+            name="threading-simple-queue",
+            actor_class=SimpleQueueThreadingActor,
+            event_class=threading.Event,
+            future_class=ThreadingFuture,
+            sleep_func=time.sleep,
+        ),
+        id="threading-simple-queue",
+    ),
+    "threading-pooled": pytest.param(
+        Runtime(
+            name="threading-pooled",
+            actor_class=PooledThreadingActor,
+            event_class=threading.Event,
+            future_class=ThreadingFuture,
+            sleep_func=time.sleep,
+        ),
+        id="threading-pooled",
+    ),
+    "asyncio": pytest.param(
+        Runtime(
+            name="asyncio",
+            actor_class=AsyncioActor,
+            event_class=threading.Event,
+            future_class=AsyncioFuture,
+            sleep_func=time.sleep,
+        ),
+        id="asyncio",
+    ),
 }
 
 
@@ -5,7 +5,13 @@ from __future__ import annotations
 import time
 from typing import TYPE_CHECKING, Any
 
-from pykka import ActorRegistry, ThreadingActor
+from pykka import (
+    ActorRegistry,
+    ProcessActor,
+    SharedBuffer,
+    ThreadingActor,
+    ThreadPoolDispatcher,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -64,11 +70,112 @@ def test_traversable_callable_attribute_access() -> None:
         actor.bar.func().get()
 
 
+class DedicatedThreadActor(ThreadingActor):
+    def func(self) -> None:
+        pass
+
+
+class PooledActor(ThreadingActor):
+    dispatcher = ThreadPoolDispatcher()
+
+    def func(self) -> None:
+        pass
+
+
+def test_many_actors_on_dedicated_threads() -> None:
+    proxies = [DedicatedThreadActor.start().proxy() for _ in range(1000)]
+    for _ in range(10):
+        for proxy in proxies:
+            proxy.func().get()
+    ActorRegistry.stop_all()
+
+
+def test_many_actors_on_thread_pool_dispatcher() -> None:
+    proxies = [PooledActor.start().proxy() for _ in range(1000)]
+    for _ in range(10):
+        for proxy in proxies:
+            proxy.func().get()
+    ActorRegistry.stop_all()
+
+
+class QueueInboxActor(ThreadingActor):
+    def on_receive(self, message: Any) -> Any:
+        return message
+
+
+class SimpleQueueInboxActor(QueueInboxActor):
+    use_simple_queue_inbox = True
+
+
+def test_ask_with_queue_inbox() -> None:
+    actor = QueueInboxActor.start()
+    for _ in range(10000):
+        actor.ask("ping")
+    actor.stop()
+
+
+def test_ask_with_simple_queue_inbox() -> None:
+    actor = SimpleQueueInboxActor.start()
+    for _ in range(10000):
+        actor.ask("ping")
+    actor.stop()
+
+
+def test_tell_with_queue_inbox() -> None:
+    actor = QueueInboxActor.start()
+    for _ in range(100000):
+        actor.tell("ping")
+    actor.stop()
+
+
+def test_tell_with_simple_queue_inbox() -> None:
+    actor = SimpleQueueInboxActor.start()
+    for _ in range(100000):
+        actor.tell("ping")
+    actor.stop()
+
+
+class FrameActor(ProcessActor):
+    def on_receive(self, message: Any) -> Any:
+        if isinstance(message, SharedBuffer):
+            with message, message.buf as view:
+                return len(view)
+        return len(message)
+
+
+FRAME = bytes(8 * 1024 * 1024)
+
+
+def test_ask_process_actor_with_pickled_frames() -> None:
+    actor = FrameActor.start()
+    for _ in range(100):
+        actor.ask(FRAME)
+    actor.stop()
+
+
+def test_ask_process_actor_with_shared_buffer_frames() -> None:
+    actor = FrameActor.start()
+    with SharedBuffer(len(FRAME)) as shared:
+        for _ in range(100):
+            with shared.buf as view:
+                view[:] = FRAME
+            actor.ask(shared)
+    actor.stop()
+
+
 if __name__ == "__main__":
     try:
         time_it(test_direct_plain_attribute_access)
         time_it(test_direct_callable_attribute_access)
         time_it(test_traversable_plain_attribute_access)
         time_it(test_traversable_callable_attribute_access)
+        time_it(test_many_actors_on_dedicated_threads)
+        time_it(test_many_actors_on_thread_pool_dispatcher)
+        time_it(test_ask_with_queue_inbox)
+        time_it(test_ask_with_simple_queue_inbox)
+        time_it(test_tell_with_queue_inbox)
+        time_it(test_tell_with_simple_queue_inbox)
+        time_it(test_ask_process_actor_with_pickled_frames)
+        time_it(test_ask_process_actor_with_shared_buffer_frames)
     finally:
         ActorRegistry.stop_all()
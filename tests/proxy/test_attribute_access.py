@@ -117,3 +117,15 @@ def test_property_is_not_accessed_when_creating_proxy(runtime: Runtime) -> None:
         actor_ref.proxy()
     finally:
         actor_ref.stop()
+
+
+def test_instance_attr_shadows_class_attr(actor_class: type[PropertyActor]) -> None:
+    class ShadowingActor(actor_class):  # type: ignore[valid-type,misc]
+        def __init__(self) -> None:
+            super().__init__()
+            self.an_attr = lambda: "an_instance_attr"
+
+    actor_class.start().proxy()  # Introspect the class attributes first.
+    proxy = ShadowingActor.start().proxy()
+
+    assert proxy.an_attr().get() == "an_instance_attr"
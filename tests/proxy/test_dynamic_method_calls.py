@@ -4,11 +4,14 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+import pykka._proxy
 from pykka import Actor
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from pytest_mock import MockerFixture
+
     from pykka import ActorProxy, Future
     from tests.types import Runtime
 
@@ -62,3 +65,17 @@ def test_can_proxy_itself_and_use_attrs_added_at_runtime(
     result = inner_future.get(timeout=1)
 
     assert result == "returned by foo"
+
+
+def test_unknown_attr_is_looked_up_without_introspecting_all_attrs(
+    proxy: ActorProxy[DynamicMethodActor],
+    mocker: MockerFixture,
+) -> None:
+    introspect_attrs = mocker.spy(pykka._proxy, "introspect_attrs")  # noqa: SLF001
+    proxy.add_method("bar").get()
+
+    assert proxy.bar().get() == "returned by bar"
+    with pytest.raises(AttributeError):
+        proxy.baz  # noqa: B018
+
+    assert introspect_attrs.call_count == 0
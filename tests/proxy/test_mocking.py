@@ -98,3 +98,17 @@ def test_actor_with_mocked_method_works(
     assert proxy.a_method().get() == "mocked method return"
 
     assert mock.call_count == 1
+
+
+def test_actor_with_method_mocked_after_first_proxy_works(
+    actor_class: type[ActorForMocking],
+    mocker: MockerFixture,
+) -> None:
+    actor_class.start().proxy()
+    mock = mocker.NonCallableMock()
+    mocker.patch.object(actor_class, "a_method", new=mock)
+
+    proxy = actor_class.start().proxy()
+
+    # The introspection of the class is redone when the class has changed.
+    assert proxy.a_method.get() is mock
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pykka import AsyncioActor, AsyncioFuture
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pykka import ActorRef
+
+
+class ThreadRecordingActor(AsyncioActor):
+    def on_receive(self, message: Any) -> Any:
+        return threading.current_thread()
+
+
+@pytest.fixture
+def actor_refs() -> Iterator[list[ActorRef[ThreadRecordingActor]]]:
+    refs = [ThreadRecordingActor.start() for _ in range(10)]
+    yield refs
+    for ref in refs:
+        ref.stop()
+
+
+def test_actors_share_a_single_thread(
+    actor_refs: list[ActorRef[ThreadRecordingActor]],
+) -> None:
+    threads = {ref.ask("which thread?") for ref in actor_refs}
+
+    assert len(threads) == 1
+    assert threads.pop() is not threading.current_thread()
+
+
+def test_actor_started_from_coroutine_runs_on_the_running_loop() -> None:
+    async def run() -> tuple[threading.Thread, threading.Thread]:
+        ref = ThreadRecordingActor.start()
+        try:
+            actor_thread = await ref.ask("which thread?", block=False)
+        finally:
+            ref.stop(block=False)
+            while ref.is_alive():  # noqa: ASYNC110
+                await asyncio.sleep(0.001)
+        return actor_thread, threading.current_thread()
+
+    actor_thread, loop_thread = asyncio.run(run())
+
+    assert actor_thread is loop_thread
+
+
+def test_awaiting_future_does_not_block_the_event_loop() -> None:
+    future: AsyncioFuture[str] = AsyncioFuture()
+
+    async def run() -> list[str]:
+        result: list[str] = []
+
+        async def waiter() -> None:
+            result.append(await future)
+
+        async def setter() -> None:
+            result.append("setting")
+            future.set("done")
+
+        await asyncio.gather(waiter(), setter())
+        return result
+
+    assert asyncio.run(run()) == ["setting", "done"]
+
+
+def test_awaiting_future_set_from_another_thread() -> None:
+    future: AsyncioFuture[str] = AsyncioFuture()
+
+    async def run() -> str:
+        threading.Timer(0.01, future.set, args=("done",)).start()
+        return await future
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_awaiting_future_raises_exception_set_on_it() -> None:
+    future: AsyncioFuture[str] = AsyncioFuture()
+
+    async def run() -> str:
+        future.set_exception((ValueError, ValueError("boom"), None))
+        return await future
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(run())
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pykka import ThreadingActor, ThreadPoolDispatcher
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pykka import ActorRef
+
+
+dispatcher = ThreadPoolDispatcher(max_workers=2, throughput=1)
+
+
+class PooledActor(ThreadingActor):
+    dispatcher = dispatcher
+
+    def __init__(self, log: list[tuple[str, Any]] | None = None) -> None:
+        super().__init__()
+        self.log = log
+
+    def on_receive(self, message: Any) -> Any:
+        if self.log is not None:
+            self.log.append((self.actor_urn, message))
+        return threading.current_thread()
+
+
+@pytest.fixture
+def actor_refs() -> Iterator[list[ActorRef[PooledActor]]]:
+    refs = [PooledActor.start() for _ in range(20)]
+    yield refs
+    for ref in refs:
+        ref.stop()
+
+
+def test_actors_share_the_dispatchers_worker_threads(
+    actor_refs: list[ActorRef[PooledActor]],
+) -> None:
+    threads = {ref.ask("which thread?", block=True) for ref in actor_refs}
+
+    assert 1 <= len(threads) <= dispatcher.max_workers
+    assert all(thread.name.startswith("ThreadPoolDispatcher") for thread in threads)
+    assert all(thread.daemon for thread in threads)
+
+
+def test_actors_process_messages_in_order() -> None:
+    log: list[tuple[str, Any]] = []
+    ref = PooledActor.start(log)
+
+    for i in range(100):
+        ref.tell(i)
+    ref.stop()
+
+    assert [message for _, message in log] == list(range(100))
+
+
+def test_actors_give_the_worker_thread_back_after_throughput_messages() -> None:
+    single_worker = ThreadPoolDispatcher(max_workers=1, throughput=2)
+
+    class SingleWorkerActor(PooledActor):
+        dispatcher = single_worker
+
+    log: list[tuple[str, Any]] = []
+    refs = [SingleWorkerActor.start(log) for _ in range(2)]
+    for ref in refs:
+        ref.ask("ready")
+    log.clear()
+
+    # Occupy the only worker thread while the messages are queued up.
+    blocker = threading.Event()
+    single_worker._runnable.put(_BlockingInbox(blocker))  # type: ignore[arg-type]  # noqa: SLF001
+    for ref in refs:
+        for i in range(4):
+            ref.tell(i)
+    blocker.set()
+    for ref in refs:
+        ref.stop()
+
+    assert [urn for urn, _ in log] == [
+        refs[0].actor_urn,
+        refs[0].actor_urn,
+        refs[1].actor_urn,
+        refs[1].actor_urn,
+    ] * 2
+
+
+class _BlockingInbox:
+    def __init__(self, event: threading.Event) -> None:
+        self.event = event
+
+    def _run(self) -> None:
+        self.event.wait()
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    [
+        ({"max_workers": 0}, "max_workers must be at least 1"),
+        ({"throughput": 0}, "throughput must be at least 1"),
+    ],
+)
+def test_dispatcher_rejects_invalid_arguments(
+    kwargs: dict[str, int],
+    error: str,
+) -> None:
+    with pytest.raises(ValueError, match=error):
+        ThreadPoolDispatcher(**kwargs)
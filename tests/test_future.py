@@ -3,13 +3,22 @@ from __future__ import annotations
 import asyncio
 import queue
 import sys
+import threading
 import traceback
 import types
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from pykka import Future, Timeout, get_all
+from pykka import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    Timeout,
+    as_completed,
+    get_all,
+    wait,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterable
@@ -46,6 +55,13 @@ def test_base_future_set_exception_is_not_implemented() -> None:
         future.set_exception(None)
 
 
+def test_base_future_add_done_callback_is_not_implemented() -> None:
+    future: Future[Any] = Future()
+
+    with pytest.raises(NotImplementedError):
+        future.add_done_callback(lambda _: None)
+
+
 def test_set_multiple_times_fails(
     future: Future[int],
 ) -> None:
@@ -78,6 +94,19 @@ def test_get_all_raises_timeout_if_not_all_futures_are_available(
         get_all(futures, timeout=0)
 
 
+def test_get_all_timeout_is_a_deadline_for_all_futures(
+    futures: list[Future[int]],
+) -> None:
+    for future in futures:
+        threading.Timer(0.2, future.set, args=(0,)).start()
+
+    with pytest.raises(Timeout):
+        get_all(futures, timeout=0.1)
+
+    # Give the timers time to fire, so that they don't outlive the test.
+    assert get_all(futures, timeout=1) == [0, 0, 0]
+
+
 def test_get_all_can_be_called_multiple_times(
     futures: list[Future[int]],
 ) -> None:
@@ -382,3 +411,229 @@ def test_reduce_reuses_result_if_called_multiple_times(
     assert reduced.get(timeout=0) == 6
     assert reduced.get(timeout=0) == 6  # First result is reused
     assert reduced.get(timeout=0) == 6  # First result is reused
+
+
+def test_get_wakes_up_all_waiting_threads(future: Future[int]) -> None:
+    results: list[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(future.get(timeout=1)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+
+    future.set(1)
+    for thread in threads:
+        thread.join(timeout=1)
+
+    assert results == [1, 1, 1]
+
+
+def test_get_after_timeout_still_gets_later_value(future: Future[int]) -> None:
+    with pytest.raises(Timeout):
+        future.get(timeout=0.01)
+
+    future.set(1)
+
+    assert future.get(timeout=0) == 1
+
+
+def test_get_wakes_up_if_get_hook_is_set_while_waiting(future: Future[int]) -> None:
+    threading.Timer(0.01, future.set_get_hook, args=(lambda timeout: 1,)).start()
+
+    assert future.get(timeout=1) == 1
+
+
+def test_done_callbacks_are_called_in_order_when_value_is_set(
+    future: Future[int],
+) -> None:
+    calls: list[tuple[str, int]] = []
+    future.add_done_callback(lambda f: calls.append(("a", f.get(timeout=0))))
+    future.add_done_callback(lambda f: calls.append(("b", f.get(timeout=0))))
+
+    assert calls == []
+
+    future.set(1)
+
+    assert calls == [("a", 1), ("b", 1)]
+
+
+def test_done_callback_is_called_when_exception_is_set(
+    future: Future[int],
+) -> None:
+    done: list[Future[int]] = []
+    future.add_done_callback(done.append)
+
+    future.set_exception((ValueError, ValueError("boom"), None))
+
+    assert done == [future]
+    with pytest.raises(ValueError, match="boom"):
+        done[0].get(timeout=0)
+
+
+def test_done_callback_is_called_immediately_if_value_is_set(
+    future: Future[int],
+) -> None:
+    future.set(1)
+    calls: list[int] = []
+
+    future.add_done_callback(lambda f: calls.append(f.get(timeout=0)))
+
+    assert calls == [1]
+
+
+def test_done_callback_is_called_when_get_hook_is_evaluated(
+    future: Future[int],
+) -> None:
+    future.set_get_hook(lambda timeout: 1)
+    calls: list[int] = []
+    future.add_done_callback(lambda f: calls.append(f.get(timeout=0)))
+
+    assert calls == []
+
+    assert future.get(timeout=0) == 1
+
+    assert calls == [1]
+
+
+def test_exception_in_done_callback_is_logged_and_ignored(
+    future: Future[int],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    calls: list[int] = []
+
+    def fail(_: Future[int]) -> None:
+        raise ValueError("boom")
+
+    future.add_done_callback(fail)
+    future.add_done_callback(lambda f: calls.append(f.get(timeout=0)))
+
+    future.set(1)
+
+    assert calls == [1]
+    assert "Exception in done callback" in caplog.text
+
+
+def test_map_is_computed_when_value_is_set(future: Future[int]) -> None:
+    calls: list[int] = []
+
+    def func(value: int) -> int:
+        calls.append(value)
+        return value + 1
+
+    mapped = future.map(func)
+    future.set(1)
+
+    assert calls == [1]
+    assert mapped.get(timeout=0) == 2
+
+
+def test_map_sets_exception_raised_by_func(future: Future[int]) -> None:
+    mapped = future.map(lambda value: value / 0)
+
+    future.set(1)
+
+    with pytest.raises(ZeroDivisionError):
+        mapped.get(timeout=0)
+
+
+def test_join_is_set_when_last_future_is_set(futures: list[Future[int]]) -> None:
+    joined = futures[0].join(futures[1], futures[2])
+    done: list[Future[Any]] = []
+    joined.add_done_callback(done.append)
+
+    futures[0].set(0)
+    futures[2].set(2)
+
+    assert done == []
+
+    futures[1].set(1)
+
+    assert done == [joined]
+    assert joined.get(timeout=0) == [0, 1, 2]
+
+
+def test_wait_returns_when_all_futures_are_completed(
+    futures: list[Future[int]],
+) -> None:
+    for i, future in enumerate(futures):
+        threading.Timer(0.01, future.set, args=(i,)).start()
+
+    done, not_done = wait(futures, timeout=1)
+
+    assert done == set(futures)
+    assert not_done == set()
+
+
+def test_wait_returns_completed_futures_on_timeout(
+    futures: list[Future[int]],
+) -> None:
+    futures[0].set(0)
+    futures[2].set(2)
+
+    done, not_done = wait(futures, timeout=0.01)
+
+    assert done == {futures[0], futures[2]}
+    assert not_done == {futures[1]}
+
+
+def test_wait_with_first_completed_returns_when_any_future_is_completed(
+    futures: list[Future[int]],
+) -> None:
+    threading.Timer(0.01, futures[1].set, args=(1,)).start()
+
+    done, not_done = wait(futures, timeout=1, return_when=FIRST_COMPLETED)
+
+    assert done == {futures[1]}
+    assert not_done == {futures[0], futures[2]}
+
+
+def test_wait_with_all_completed_and_no_futures_returns_immediately() -> None:
+    assert wait([], return_when=ALL_COMPLETED) == (set(), set())
+
+
+def test_wait_rejects_invalid_return_when(futures: list[Future[int]]) -> None:
+    with pytest.raises(ValueError, match="Invalid return_when"):
+        wait(futures, return_when="SOMETIME")
+
+
+def test_wait_considers_future_with_get_hook_completed(
+    future: Future[int],
+) -> None:
+    future.set_get_hook(lambda timeout: 1)
+
+    done, not_done = wait([future], timeout=0)
+
+    assert done == {future}
+    assert not_done == set()
+
+
+def test_as_completed_yields_futures_in_completion_order(
+    futures: list[Future[int]],
+) -> None:
+    futures[2].set(2)
+    threading.Timer(0.01, futures[0].set, args=(0,)).start()
+    threading.Timer(0.05, futures[1].set, args=(1,)).start()
+
+    result = [future.get() for future in as_completed(futures, timeout=1)]
+
+    assert result == [2, 0, 1]
+
+
+def test_as_completed_yields_duplicate_futures_once(
+    future: Future[int],
+) -> None:
+    future.set(1)
+
+    assert list(as_completed([future, future])) == [future]
+
+
+def test_as_completed_raises_timeout_at_deadline(
+    futures: list[Future[int]],
+) -> None:
+    futures[0].set(0)
+    completed = as_completed(futures, timeout=0.01)
+
+    assert next(completed) is futures[0]
+    with pytest.raises(Timeout):
+        next(completed)
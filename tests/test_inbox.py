@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pykka import ActorDeadError, MailboxFull, ThreadingActor, ThreadingFuture
+from pykka._envelope import Envelope
+from pykka._inbox import PriorityInbox, QueueInbox
+from pykka.messages import _ActorStop
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pykka import ActorRef
+
+
+def test_unbounded_inbox_accepts_any_number_of_messages() -> None:
+    inbox = QueueInbox()
+
+    for i in range(100):
+        inbox.put(Envelope(i))
+
+    assert inbox.qsize() == 100
+
+
+def test_raise_policy_raises_when_full() -> None:
+    inbox = QueueInbox(2, overflow_policy="raise")
+    inbox.put(Envelope(1))
+    inbox.put(Envelope(2))
+
+    with pytest.raises(MailboxFull):
+        inbox.put(Envelope(3))
+
+
+def test_block_policy_raises_after_timeout() -> None:
+    inbox = QueueInbox(1, overflow_policy="block", put_timeout=0.01)
+    inbox.put(Envelope(1))
+
+    with pytest.raises(MailboxFull):
+        inbox.put(Envelope(2))
+
+
+def test_block_policy_timeout_can_be_overridden_per_message() -> None:
+    inbox = QueueInbox(1, overflow_policy="block")
+    inbox.put(Envelope(1))
+
+    with pytest.raises(MailboxFull):
+        inbox.put(Envelope(2), timeout=0.01)
+
+
+def test_block_policy_unblocks_when_there_is_room() -> None:
+    inbox = QueueInbox(1, overflow_policy="block")
+    inbox.put(Envelope(1))
+
+    threading.Timer(0.01, inbox.get).start()
+    inbox.put(Envelope(2), timeout=1)
+
+    assert inbox.get().message == 2
+
+
+def test_drop_newest_policy_drops_the_new_message() -> None:
+    inbox = QueueInbox(1, overflow_policy="drop_newest")
+    future: ThreadingFuture[Any] = ThreadingFuture()
+    inbox.put(Envelope(1))
+    inbox.put(Envelope(2, reply_to=future))
+
+    assert [e.message for e in inbox.get_batch(10)] == [1]
+    with pytest.raises(MailboxFull):
+        future.get(timeout=0)
+
+
+def test_drop_oldest_policy_drops_the_oldest_message() -> None:
+    inbox = QueueInbox(2, overflow_policy="drop_oldest")
+    future: ThreadingFuture[Any] = ThreadingFuture()
+    inbox.put(Envelope(1, reply_to=future))
+    inbox.put(Envelope(2))
+    inbox.put(Envelope(3))
+
+    assert [e.message for e in inbox.get_batch(10)] == [2, 3]
+    with pytest.raises(MailboxFull):
+        future.get(timeout=0)
+
+
+@pytest.mark.parametrize("policy", ["block", "raise", "drop_newest", "drop_oldest"])
+def test_stop_requests_are_always_accepted(policy: Any) -> None:
+    inbox = QueueInbox(1, overflow_policy=policy, put_timeout=0)
+    inbox.put(Envelope(1))
+    inbox.put(Envelope(_ActorStop()))
+
+    assert [e.message for e in inbox.get_batch(10)] == [1, _ActorStop()]
+
+
+def test_drop_oldest_policy_never_drops_stop_requests() -> None:
+    inbox = QueueInbox(1, overflow_policy="drop_oldest")
+    inbox.put(Envelope(_ActorStop()))
+    inbox.put(Envelope(1))
+
+    assert [e.message for e in inbox.get_batch(10)] == [_ActorStop()]
+
+
+def test_unknown_policy_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown inbox overflow policy"):
+        QueueInbox(1, overflow_policy="nope")  # type: ignore[arg-type]
+
+
+def test_priority_inbox_hands_out_stop_requests_first() -> None:
+    inbox = PriorityInbox()
+    inbox.put(Envelope(1))
+    inbox.put(Envelope(2))
+    inbox.put(Envelope(_ActorStop()))
+
+    assert [e.message for e in inbox.get_batch(10)] == [_ActorStop(), 1, 2]
+
+
+def test_priority_inbox_orders_messages_by_priority_key() -> None:
+    inbox = PriorityInbox(priority_key=lambda message: message["priority"])
+    for i, priority in enumerate([3, 1, 2, 1]):
+        inbox.put(Envelope({"id": i, "priority": priority}))
+
+    assert [e.message["id"] for e in inbox.get_batch(10)] == [1, 3, 2, 0]
+
+
+def test_priority_inbox_can_be_bounded() -> None:
+    inbox = PriorityInbox(1, overflow_policy="raise")
+    inbox.put(Envelope(1))
+
+    with pytest.raises(MailboxFull):
+        inbox.put(Envelope(2))
+
+
+def test_priority_inbox_does_not_support_drop_oldest() -> None:
+    with pytest.raises(ValueError, match="drop_oldest"):
+        PriorityInbox(1, overflow_policy="drop_oldest")
+
+
+class PriorityActor(ThreadingActor):
+    use_priority_inbox = True
+
+    @staticmethod
+    def message_priority(message: Any) -> int:
+        return 0 if message == "urgent" else 1
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.received: list[Any] = []
+
+    def block(self, blocked: threading.Event, release: threading.Event) -> None:
+        blocked.set()
+        release.wait()
+
+    def on_receive(self, message: Any) -> Any:
+        self.received.append(message)
+        return list(self.received)
+
+
+def test_priority_actor_handles_urgent_messages_first() -> None:
+    ref = PriorityActor.start()
+    try:
+        blocked, release = threading.Event(), threading.Event()
+        ref.proxy().block(blocked, release)
+        blocked.wait()
+        ref.tell("normal")
+        future = ref.ask("urgent", block=False)
+        release.set()
+
+        assert future.get(timeout=1) == ["urgent"]
+    finally:
+        ref.stop()
+
+
+def test_priority_actor_stops_before_handling_backlog() -> None:
+    ref = PriorityActor.start()
+    blocked, release = threading.Event(), threading.Event()
+    ref.proxy().block(blocked, release)
+    blocked.wait()
+    backlog = [ref.ask(i, block=False) for i in range(100)]
+    stopped = ref.stop(block=False)
+    release.set()
+
+    assert stopped.get(timeout=1) is True
+    for future in backlog:
+        with pytest.raises(ActorDeadError):
+            future.get(timeout=1)
+
+
+class BoundedActor(ThreadingActor):
+    inbox_maxsize = 1
+    inbox_overflow_policy = "raise"
+
+    def block(self, blocked: threading.Event, release: threading.Event) -> None:
+        blocked.set()
+        release.wait()
+
+    def on_receive(self, message: Any) -> Any:
+        return message
+
+
+@pytest.fixture
+def blocked_actor() -> Iterator[tuple[ActorRef[BoundedActor], threading.Event]]:
+    ref = BoundedActor.start()
+    blocked, release = threading.Event(), threading.Event()
+    ref.proxy().block(blocked, release)
+    blocked.wait()
+    yield ref, release
+    release.set()
+    ref.stop()
+
+
+def test_tell_raises_mailbox_full(
+    blocked_actor: tuple[ActorRef[BoundedActor], threading.Event],
+) -> None:
+    ref, _ = blocked_actor
+    ref.tell(1)
+
+    with pytest.raises(MailboxFull):
+        ref.tell(2)
+
+
+def test_ask_sets_mailbox_full_on_the_future(
+    blocked_actor: tuple[ActorRef[BoundedActor], threading.Event],
+) -> None:
+    ref, _ = blocked_actor
+    ref.tell(1)
+
+    future = ref.ask(2, block=False)
+
+    with pytest.raises(MailboxFull):
+        future.get(timeout=0)
+
+
+def test_stop_works_with_full_inbox(
+    blocked_actor: tuple[ActorRef[BoundedActor], threading.Event],
+) -> None:
+    ref, release = blocked_actor
+    ref.tell(1)
+
+    future = ref.stop(block=False)
+    release.set()
+
+    assert future.get(timeout=1) is True
+
+
+def test_bounded_inbox_cannot_be_combined_with_simple_queue() -> None:
+    class InvalidActor(BoundedActor):
+        use_simple_queue_inbox = True
+
+    with pytest.raises(ValueError, match="cannot be combined"):
+        InvalidActor.start()
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import io
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import pykka.metrics
+from pykka import Actor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pykka import ActorRef
+    from tests.types import Runtime
+
+pytestmark = pytest.mark.usefixtures("_stop_all")
+
+
+class GateActor(Actor):
+    def __init__(self, gate: threading.Event) -> None:
+        super().__init__()
+        self.gate = gate
+
+    def on_receive(self, message: Any) -> Any:
+        if message == "wait":
+            self.gate.wait(timeout=5)
+        return message
+
+
+@pytest.fixture(autouse=True)
+def _metrics() -> Iterator[None]:
+    pykka.metrics.reset()
+    pykka.metrics.enable()
+    yield
+    pykka.metrics.disable()
+    pykka.metrics.reset()
+
+
+@pytest.fixture
+def actor_class(runtime: Runtime) -> type[GateActor]:
+    class GateActorImpl(GateActor, runtime.actor_class):  # type: ignore[name-defined]
+        pass
+
+    return GateActorImpl
+
+
+@pytest.fixture
+def gate() -> threading.Event:
+    return threading.Event()
+
+
+@pytest.fixture
+def actor_ref(
+    actor_class: type[GateActor],
+    gate: threading.Event,
+) -> ActorRef[GateActor]:
+    return actor_class.start(gate)
+
+
+def class_name(actor_class: type[Any]) -> str:
+    return f"{actor_class.__module__}.{actor_class.__qualname__}"
+
+
+def test_snapshot_counts_messages_per_actor(
+    actor_ref: ActorRef[GateActor],
+) -> None:
+    actor_ref.tell("a")
+    assert actor_ref.ask("b") == "b"
+
+    (metrics,) = pykka.metrics.snapshot().actors
+
+    assert metrics.actor_urn == actor_ref.actor_urn
+    assert metrics.actor_class == class_name(actor_ref.actor_class)
+    assert metrics.messages_sent == 2
+    assert metrics.messages_processed == 2
+    assert metrics.mailbox_depth == 0
+    assert metrics.wait_seconds_total >= 0
+    assert metrics.handler_seconds_total >= 0
+
+
+def test_mailbox_depth_counts_unprocessed_messages(
+    actor_ref: ActorRef[GateActor],
+    gate: threading.Event,
+) -> None:
+    future = actor_ref.ask("wait", block=False)
+    actor_ref.tell("a")
+    actor_ref.tell("b")
+
+    (metrics,) = pykka.metrics.snapshot().actors
+    gate.set()
+    future.get(timeout=5)
+
+    assert metrics.mailbox_depth >= 2
+
+
+def test_slow_handler_is_timed(
+    actor_ref: ActorRef[GateActor],
+    gate: threading.Event,
+) -> None:
+    future = actor_ref.ask("wait", block=False)
+    threading.Timer(0.05, gate.set).start()
+    future.get(timeout=5)
+
+    (metrics,) = pykka.metrics.snapshot().actors
+
+    assert metrics.handler_seconds_max >= 0.04
+    assert metrics.mean_handler_seconds > 0
+
+
+def test_classes_include_stopped_actors(actor_class: type[GateActor]) -> None:
+    gate = threading.Event()
+    ref_a = actor_class.start(gate)
+    ref_b = actor_class.start(gate)
+    ref_a.ask("a")
+    ref_b.ask("b")
+    ref_b.ask("c")
+
+    ref_a.stop()
+    snapshot = pykka.metrics.snapshot()
+
+    assert [metrics.actor_urn for metrics in snapshot.actors] == [ref_b.actor_urn]
+    (totals,) = snapshot.classes
+    assert totals.actor_class == class_name(actor_class)
+    assert totals.actor_urn is None
+    assert totals.messages_sent >= 3
+    assert totals.messages_processed >= 3
+
+
+def test_nothing_is_recorded_when_disabled(actor_ref: ActorRef[GateActor]) -> None:
+    pykka.metrics.disable()
+
+    actor_ref.ask("a")
+
+    assert pykka.metrics.snapshot() == ([], [])
+
+
+def test_reset_forgets_metrics(actor_ref: ActorRef[GateActor]) -> None:
+    actor_ref.ask("a")
+
+    pykka.metrics.reset()
+
+    assert pykka.metrics.snapshot() == ([], [])
+
+
+def test_format_prometheus() -> None:
+    snapshot = pykka.metrics.MetricsSnapshot(
+        actors=[
+            pykka.metrics.ActorMetrics(
+                actor_class="app.Worker",
+                actor_urn="urn:uuid:1",
+                messages_sent=3,
+                messages_processed=2,
+                wait_seconds_total=0.5,
+                wait_seconds_max=0.25,
+                handler_seconds_total=1.5,
+                handler_seconds_max=1.0,
+            ),
+        ],
+        classes=[
+            pykka.metrics.ActorMetrics(
+                actor_class='app."Worker"',
+                actor_urn=None,
+                messages_sent=5,
+                messages_processed=4,
+                wait_seconds_total=0.75,
+                wait_seconds_max=0.25,
+                handler_seconds_total=2.0,
+                handler_seconds_max=1.0,
+            ),
+        ],
+    )
+
+    text = pykka.metrics.format_prometheus(snapshot, per_actor=True)
+
+    assert "# TYPE pykka_messages_sent_total counter\n" in text
+    assert 'pykka_messages_sent_total{actor_class="app.\\"Worker\\""} 5\n' in text
+    assert (
+        'pykka_mailbox_depth{actor_class="app.Worker",actor_urn="urn:uuid:1"} 1\n'
+    ) in text
+    assert "# TYPE pykka_wait_seconds_total counter\n" in text
+    assert "pykka_wait_seconds_total_total" not in text
+    assert "# TYPE pykka_handler_seconds_max gauge\n" in text
+
+
+def test_format_prometheus_without_per_actor_series(
+    actor_ref: ActorRef[GateActor],
+) -> None:
+    actor_ref.ask("a")
+
+    text = pykka.metrics.format_prometheus()
+
+    assert "pykka_messages_processed_total{actor_class=" in text
+    assert "actor_urn=" not in text
+
+
+def test_write_prometheus_to_file(
+    actor_ref: ActorRef[GateActor],
+    tmp_path: Path,
+) -> None:
+    actor_ref.ask("a")
+    path = tmp_path / "pykka.prom"
+
+    pykka.metrics.write_prometheus(path, per_actor=True)
+
+    assert actor_ref.actor_urn in path.read_text()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_prometheus_to_file_object(actor_ref: ActorRef[GateActor]) -> None:
+    actor_ref.ask("a")
+    output = io.StringIO()
+
+    pykka.metrics.write_prometheus(output)
+
+    assert output.getvalue() == pykka.metrics.format_prometheus()
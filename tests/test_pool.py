@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pykka import Actor, ActorDeadError, Pool, ThreadingActor
+from pykka.messages import ProxyCall
+
+if TYPE_CHECKING:
+    from tests.types import Runtime
+
+pytestmark = pytest.mark.usefixtures("_stop_all")
+
+
+class WorkerActor(Actor):
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        super().__init__()
+        self.gate = gate
+
+    def on_receive(self, message: Any) -> Any:
+        if message == "wait" and self.gate is not None:
+            self.gate.wait(timeout=5)
+        return self.actor_urn
+
+    def whoami(self) -> str:
+        return self.actor_urn
+
+    def echo_urn(self, key: Any) -> str:
+        return self.actor_urn
+
+
+@pytest.fixture
+def actor_class(runtime: Runtime) -> type[WorkerActor]:
+    class WorkerActorImpl(WorkerActor, runtime.actor_class):  # type: ignore[name-defined]
+        pass
+
+    return WorkerActorImpl
+
+
+def test_start_starts_routees_with_arguments(actor_class: type[WorkerActor]) -> None:
+    gate = threading.Event()
+
+    pool = Pool.start(actor_class, 3, gate=gate)
+
+    assert len(pool.routees) == 3
+    assert pool.actor_class is actor_class
+    assert pool.is_alive()
+    for routee in pool.routees:
+        actor = routee._actor_weakref()  # noqa: SLF001
+        assert actor is not None
+        assert actor.gate is gate
+
+
+def test_round_robin_sends_to_each_routee_in_turn(
+    actor_class: type[WorkerActor],
+) -> None:
+    pool = Pool.start(actor_class, 3)
+
+    urns = [pool.ask("hi") for _ in range(6)]
+
+    expected = [routee.actor_urn for routee in pool.routees]
+    assert urns == expected + expected
+
+
+def test_random_sends_to_routees(actor_class: type[WorkerActor]) -> None:
+    pool = Pool.start(actor_class, 3, routing="random")
+
+    urns = {pool.ask("hi") for _ in range(20)}
+
+    assert urns <= {routee.actor_urn for routee in pool.routees}
+
+
+def test_smallest_mailbox_avoids_busy_routee(actor_class: type[WorkerActor]) -> None:
+    gate = threading.Event()
+    pool = Pool.start(actor_class, 2, gate=gate, routing="smallest_mailbox")
+    busy, idle = pool.routees
+    busy_futures = [busy.ask("wait", block=False) for _ in range(3)]
+
+    futures = [pool.ask("hi", block=False) for _ in range(2)]
+    gate.set()
+
+    assert [future.get(timeout=5) for future in futures] == [idle.actor_urn] * 2
+    for future in busy_futures:
+        future.get(timeout=5)
+
+
+def test_proxy_routes_method_calls(actor_class: type[WorkerActor]) -> None:
+    pool = Pool.start(actor_class, 2)
+    proxy = pool.proxy()
+
+    urns = [proxy.whoami().get() for _ in range(2)]
+
+    assert urns == [routee.actor_urn for routee in pool.routees]
+
+
+def test_tell_routes_messages(actor_class: type[WorkerActor]) -> None:
+    pool = Pool.start(actor_class, 2)
+
+    pool.tell("hi")
+
+    assert pool.ask("hi") == pool.routees[1].actor_urn
+
+
+def test_stopped_routee_is_skipped(actor_class: type[WorkerActor]) -> None:
+    pool = Pool.start(actor_class, 2)
+    pool.routees[0].stop()
+
+    urns = {pool.ask("hi") for _ in range(4)}
+
+    assert urns == {pool.routees[1].actor_urn}
+
+
+def test_stop_stops_all_routees(actor_class: type[WorkerActor]) -> None:
+    pool = Pool.start(actor_class, 2)
+
+    assert pool.stop() is True
+
+    assert not pool.is_alive()
+    assert not any(routee.is_alive() for routee in pool.routees)
+    assert pool.stop() is False
+    with pytest.raises(ActorDeadError):
+        pool.ask("hi")
+    with pytest.raises(ActorDeadError):
+        pool.tell("hi")
+
+
+def test_pool_is_dead_when_all_routees_are_stopped(
+    actor_class: type[WorkerActor],
+) -> None:
+    pool = Pool.start(actor_class, 2)
+
+    for routee in pool.routees:
+        routee.stop()
+
+    assert not pool.is_alive()
+    with pytest.raises(ActorDeadError):
+        pool.proxy()
+
+
+def test_pool_needs_routees() -> None:
+    with pytest.raises(ValueError, match="at least one routee"):
+        Pool([])
+
+
+def test_unknown_routing_strategy_is_rejected(actor_class: type[WorkerActor]) -> None:
+    with pytest.raises(ValueError, match="Unknown routing strategy"):
+        Pool([actor_class.start()], routing="fastest")  # type: ignore[arg-type]
+
+
+class BalancingWorkerActor(WorkerActor, ThreadingActor):
+    pass
+
+
+def test_balancing_idle_routee_takes_next_message() -> None:
+    gate = threading.Event()
+    pool = Pool.start(BalancingWorkerActor, 2, gate=gate, routing="balancing")
+    busy_future = pool.ask("wait", block=False)
+
+    urns = [pool.ask("hi", timeout=5) for _ in range(3)]
+    gate.set()
+
+    busy_urn = busy_future.get(timeout=5)
+    assert busy_urn in {routee.actor_urn for routee in pool.routees}
+    assert set(urns) == {routee.actor_urn for routee in pool.routees} - {busy_urn}
+
+
+def test_balancing_stop_stops_the_given_routee() -> None:
+    gate = threading.Event()
+    pool = Pool.start(BalancingWorkerActor, 3, gate=gate, routing="balancing")
+    busy_future = pool.ask("wait", block=False)
+
+    stop_futures = [routee.stop(block=False) for routee in pool.routees[:2]]
+    gate.set()
+
+    assert [future.get(timeout=5) for future in stop_futures] == [True, True]
+    busy_future.get(timeout=5)
+    assert [routee.is_alive() for routee in pool.routees] == [False, False, True]
+    assert pool.ask("hi", timeout=5) == pool.routees[2].actor_urn
+
+
+def test_balancing_stop_all_stops_all_routees() -> None:
+    gate = threading.Event()
+    pool = Pool.start(BalancingWorkerActor, 3, gate=gate, routing="balancing")
+    busy_future = pool.ask("wait", block=False)
+
+    stop_futures = [routee.stop(block=False) for routee in pool.routees]
+    gate.set()
+
+    assert [future.get(timeout=5) for future in stop_futures] == [True] * 3
+    # The message sent before the stop requests is not rejected.
+    assert busy_future.get(timeout=5) is not None
+    assert not any(routee.is_alive() for routee in pool.routees)
+
+
+def test_balancing_messages_are_kept_while_a_routee_is_alive() -> None:
+    gate = threading.Event()
+    pool = Pool.start(BalancingWorkerActor, 2, gate=gate, routing="balancing")
+    first, second = pool.routees
+    busy_futures = [pool.ask("wait", block=False) for _ in range(2)]
+    stop_future = first.stop(block=False)
+    futures = [pool.ask("hi", block=False) for _ in range(3)]
+
+    gate.set()
+
+    assert stop_future.get(timeout=5) is True
+
+    assert [future.get(timeout=5) for future in futures] == [second.actor_urn] * 3
+    for future in busy_futures:
+        future.get(timeout=5)
+
+
+def test_balancing_does_not_share_inbox_with_actors_started_by_routees() -> None:
+    class HelperActor(ThreadingActor):
+        def on_receive(self, message: Any) -> Any:
+            return "helper"
+
+    class StartingActor(ThreadingActor):
+        def __init__(self) -> None:
+            super().__init__()
+            self.helper = HelperActor.start()
+
+        def on_receive(self, message: Any) -> Any:
+            return "worker"
+
+    pool = Pool.start(StartingActor, 2, routing="balancing")
+
+    assert {pool.ask("hi", timeout=5) for _ in range(10)} == {"worker"}
+
+
+def test_balancing_requires_a_shared_queue(
+    runtime: Runtime,
+    actor_class: type[WorkerActor],
+) -> None:
+    if runtime.name == "threading":
+        pool = Pool.start(actor_class, 2, routing="balancing")
+        assert pool.ask("hi", timeout=5) is not None
+    else:
+        with pytest.raises(TypeError, match="Balancing pools require"):
+            Pool.start(actor_class, 2, routing="balancing")
+
+
+def test_balancing_pool_must_be_started_by_pool(
+    actor_class: type[WorkerActor],
+) -> None:
+    with pytest.raises(ValueError, match="must be started with"):
+        Pool([actor_class.start(), actor_class.start()], routing="balancing")
+
+
+def get_key(message: Any) -> Any:
+    if isinstance(message, ProxyCall):
+        return message.args[0]
+    return message["key"]
+
+
+def test_consistent_hash_sends_same_key_to_same_routee(
+    actor_class: type[WorkerActor],
+) -> None:
+    pool = Pool.start(actor_class, 4, routing="consistent_hash", hash_key=get_key)
+
+    first = [pool.ask({"key": key}) for key in range(50)]
+    second = [pool.ask({"key": key}) for key in range(50)]
+
+    assert first == second
+    assert set(first) == {routee.actor_urn for routee in pool.routees}
+
+
+def test_consistent_hash_routes_proxy_calls(actor_class: type[WorkerActor]) -> None:
+    pool = Pool.start(actor_class, 4, routing="consistent_hash", hash_key=get_key)
+    proxy = pool.proxy()
+
+    first = [proxy.echo_urn(key).get() for key in range(20)]
+    second = [proxy.echo_urn(key).get() for key in range(20)]
+
+    assert first == second
+    assert len(set(first)) > 1
+
+
+def test_consistent_hash_moves_only_keys_of_removed_routee(
+    actor_class: type[WorkerActor],
+) -> None:
+    pool = Pool.start(actor_class, 4, routing="consistent_hash", hash_key=get_key)
+    before = {key: pool.route({"key": key}) for key in range(1000)}
+    removed = pool.routees[0]
+
+    pool.remove_routee(removed)
+
+    after = {key: pool.route({"key": key}) for key in range(1000)}
+    moved = {key for key in before if before[key] != after[key]}
+    assert moved == {key for key in before if before[key] == removed}
+    assert removed not in after.values()
+
+
+def test_consistent_hash_moves_only_keys_to_added_routee(
+    actor_class: type[WorkerActor],
+) -> None:
+    pool = Pool.start(actor_class, 4, routing="consistent_hash", hash_key=get_key)
+    before = {key: pool.route({"key": key}) for key in range(1000)}
+    added = actor_class.start()
+
+    pool.add_routee(added)
+
+    after = {key: pool.route({"key": key}) for key in range(1000)}
+    moved = {key for key in before if before[key] != after[key]}
+    assert moved == {key for key in after if after[key] == added}
+    # With virtual nodes, the new routee takes about a fifth of the keys.
+    assert 100 < len(moved) < 350
+
+
+def test_consistent_hash_skips_stopped_routee(actor_class: type[WorkerActor]) -> None:
+    pool = Pool.start(actor_class, 3, routing="consistent_hash", hash_key=get_key)
+    before = {key: pool.route({"key": key}) for key in range(300)}
+    stopped = pool.routees[1]
+
+    stopped.stop()
+
+    for key, routee in before.items():
+        if routee == stopped:
+            assert pool.route({"key": key}) in (pool.routees[0], pool.routees[2])
+        else:
+            assert pool.route({"key": key}) == routee
+
+
+def test_consistent_hash_requires_hash_key(actor_class: type[WorkerActor]) -> None:
+    with pytest.raises(ValueError, match="requires a hash_key"):
+        Pool([actor_class.start()], routing="consistent_hash")
+
+
+def test_routees_cannot_be_added_to_balancing_pool() -> None:
+    pool = Pool.start(BalancingWorkerActor, 2, routing="balancing")
+
+    with pytest.raises(ValueError, match="cannot be added"):
+        pool.add_routee(BalancingWorkerActor.start())
+
+
+def test_removed_routee_is_not_routed_to(actor_class: type[WorkerActor]) -> None:
+    pool = Pool.start(actor_class, 2)
+    removed = pool.routees[0]
+
+    pool.remove_routee(removed)
+
+    assert {pool.ask("hi") for _ in range(4)} == {pool.routees[0].actor_urn}
+    assert removed.is_alive()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pykka import ActorDeadError, ActorRegistry, ProcessActor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pykka import ActorRef
+
+
+class CounterActor(ProcessActor):
+    use_daemon_process = True
+
+    def __init__(self, start: int = 0) -> None:
+        super().__init__()
+        self.count = start
+
+    def on_receive(self, message: Any) -> Any:
+        if message == "pid":
+            return os.getpid()
+        if message == "fail":
+            raise ValueError("boom")
+        if message == "unpicklable":
+            return lambda: None
+        self.count += message
+        return self.count
+
+    def increment(self, value: int = 1) -> int:
+        self.count += value
+        return self.count
+
+    def stop_self(self) -> None:
+        self.stop()
+
+
+@pytest.fixture
+def actor_ref() -> Iterator[ActorRef[CounterActor]]:
+    ref = CounterActor.start(10)
+    yield ref
+    ref.stop()
+
+
+def test_actor_runs_in_another_process(actor_ref: ActorRef[CounterActor]) -> None:
+    assert actor_ref.ask("pid") != os.getpid()
+
+
+def test_actor_is_created_with_start_arguments(
+    actor_ref: ActorRef[CounterActor],
+) -> None:
+    assert actor_ref.ask(1) == 11
+
+
+def test_tell_and_ask_are_handled_in_order(
+    actor_ref: ActorRef[CounterActor],
+) -> None:
+    actor_ref.tell(1)
+    actor_ref.tell(2)
+
+    assert actor_ref.ask(3) == 16
+
+
+def test_exception_is_returned_to_caller_with_remote_traceback(
+    actor_ref: ActorRef[CounterActor],
+) -> None:
+    with pytest.raises(ValueError, match="boom") as exc_info:
+        actor_ref.ask("fail")
+
+    assert "on_receive" in str(exc_info.value.__cause__)
+    assert actor_ref.is_alive()
+
+
+def test_unpicklable_reply_is_returned_as_exception(
+    actor_ref: ActorRef[CounterActor],
+) -> None:
+    with pytest.raises(Exception):  # noqa: B017, PT011
+        actor_ref.ask("unpicklable")
+
+    assert actor_ref.ask(0) == 10
+
+
+def test_proxy_calls_methods_and_gets_attributes_in_actor_process(
+    actor_ref: ActorRef[CounterActor],
+) -> None:
+    proxy = actor_ref.proxy()
+
+    assert proxy.increment(5).get() == 15
+    assert proxy.count.get() == 15
+
+
+def test_stop_unregisters_actor_before_returning() -> None:
+    ref = CounterActor.start()
+
+    assert ref.stop() is True
+
+    assert not ref.is_alive()
+    assert ref not in ActorRegistry.get_all()
+    with pytest.raises(ActorDeadError):
+        ref.ask(1)
+
+
+def test_actor_may_stop_itself() -> None:
+    ref = CounterActor.start()
+
+    ref.proxy().stop_self().get()
+    ref.actor_stopped.wait(timeout=5)
+
+    assert not ref.is_alive()
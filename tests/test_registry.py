@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from pykka import Actor, ActorRegistry
+from pykka import Actor, ActorRegistry, ThreadingActor, Timeout
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -105,6 +106,25 @@ def test_actor_may_be_unregistered_multiple_times_without_error(
     assert actor_ref in ActorRegistry.get_all()
 
 
+def test_actors_may_be_registered_concurrently(
+    actor_a_class: type[ActorA],
+) -> None:
+    refs: list[ActorRef[ActorA]] = []
+
+    def start_actors() -> None:
+        refs.extend(actor_a_class.start() for _ in range(10))
+
+    threads = [threading.Thread(target=start_actors) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=1)
+
+    assert len(refs) == 50
+    assert set(ActorRegistry.get_all()) == set(refs)
+    assert set(ActorRegistry.get_by_class(actor_a_class)) == set(refs)
+
+
 def test_all_actors_can_be_stopped_through_registry(
     a_actor_refs: list[ActorRef[ActorA]],
     b_actor_refs: list[ActorRef[ActorB]],
@@ -143,6 +163,39 @@ def test_stop_all_stops_last_started_actor_first_if_blocking(
     assert stopped_actors[2] == started_actors[0]
 
 
+class SlowStoppingActor(ThreadingActor):
+    def __init__(self, barrier: threading.Barrier) -> None:
+        super().__init__()
+        self.barrier = barrier
+
+    def on_stop(self) -> None:
+        # Only passes if all actors are stopping at the same time.
+        self.barrier.wait(timeout=1)
+
+
+def test_stop_all_in_parallel_stops_all_actors_at_once() -> None:
+    barrier = threading.Barrier(5)
+    refs = [SlowStoppingActor.start(barrier) for _ in range(5)]
+
+    result = ActorRegistry.stop_all(block=True, timeout=1, parallel=True)
+
+    assert result == [True] * 5
+    assert not barrier.broken
+    assert not any(ref.is_alive() for ref in refs)
+
+
+def test_stop_all_in_parallel_raises_timeout_at_deadline() -> None:
+    barrier = threading.Barrier(6)
+    refs = [SlowStoppingActor.start(barrier) for _ in range(5)]
+
+    with pytest.raises(Timeout):
+        ActorRegistry.stop_all(block=True, timeout=0.05, parallel=True)
+
+    barrier.wait(timeout=1)
+    for ref in refs:
+        ref.stop()
+
+
 def test_actors_may_be_looked_up_by_class(
     actor_a_class: type[ActorA],
     a_actor_refs: list[ActorRef[ActorA]],
@@ -196,6 +249,84 @@ def test_get_by_urn_returns_none_if_not_found() -> None:
     assert result is None
 
 
+def test_actors_are_removed_from_class_index_when_unregistered(
+    actor_a_class: type[ActorA],
+    a_actor_refs: list[ActorRef[ActorA]],
+) -> None:
+    for ref in a_actor_refs:
+        ActorRegistry.unregister(ref)
+
+    assert ActorRegistry.get_by_class(actor_a_class) == []
+    assert ActorRegistry.get_by_class_name("ActorAImpl") == []
+    assert ActorRegistry.get_by_urn(a_actor_refs[0].actor_urn) is None
+
+    for ref in a_actor_refs:
+        ref.stop()
+
+
+def test_get_all_returns_actors_in_order_of_registration(
+    a_actor_refs: list[ActorRef[ActorA]],
+    b_actor_refs: list[ActorRef[ActorB]],
+) -> None:
+    assert ActorRegistry.get_all() == [*a_actor_refs, *b_actor_refs]
+
+
+def test_actors_may_be_looked_up_by_name(
+    actor_ref: ActorRef[ActorA],
+) -> None:
+    ActorRegistry.register_name("service", actor_ref)
+
+    assert ActorRegistry.get_by_name("service") is actor_ref
+
+
+def test_get_by_name_returns_none_if_not_found() -> None:
+    assert ActorRegistry.get_by_name("service") is None
+
+
+def test_name_is_unregistered_when_actor_is_stopped(
+    actor_ref: ActorRef[ActorA],
+) -> None:
+    ActorRegistry.register_name("service", actor_ref)
+    ActorRegistry.register_name("other-service", actor_ref)
+
+    actor_ref.stop()
+
+    assert ActorRegistry.get_by_name("service") is None
+    assert ActorRegistry.get_by_name("other-service") is None
+
+
+def test_name_may_be_unregistered_manually(
+    actor_ref: ActorRef[ActorA],
+) -> None:
+    ActorRegistry.register_name("service", actor_ref)
+
+    ActorRegistry.unregister_name("service")
+    ActorRegistry.unregister_name("service")
+
+    assert ActorRegistry.get_by_name("service") is None
+    assert actor_ref in ActorRegistry.get_all()
+
+
+def test_name_cannot_be_registered_for_another_actor(
+    a_actor_refs: list[ActorRef[ActorA]],
+) -> None:
+    ActorRegistry.register_name("service", a_actor_refs[0])
+
+    with pytest.raises(ValueError, match="already registered"):
+        ActorRegistry.register_name("service", a_actor_refs[1])
+
+    assert ActorRegistry.get_by_name("service") is a_actor_refs[0]
+
+
+def test_name_cannot_be_registered_for_unregistered_actor(
+    actor_ref: ActorRef[ActorA],
+) -> None:
+    actor_ref.stop()
+
+    with pytest.raises(ValueError, match="is not registered"):
+        ActorRegistry.register_name("service", actor_ref)
+
+
 def test_broadcast_sends_message_to_all_actors_if_no_target(
     a_actor_refs: list[ActorRef[ActorA]],
     b_actor_refs: list[ActorRef[ActorB]],
@@ -250,3 +381,27 @@ def test_broadcast_sends_message_to_all_actors_of_given_class_name(
     for actor_b_ref in class_b_refs:
         received_messages = actor_b_ref.proxy().received_messages.get()
         assert {"command": "foo"} not in received_messages
+
+
+def test_broadcast_returns_no_skipped_actors_if_all_are_alive(
+    a_actor_refs: list[ActorRef[ActorA]],
+) -> None:
+    assert ActorRegistry.broadcast({"command": "foo"}) == []
+
+
+def test_broadcast_skips_and_returns_stopped_actors(
+    a_actor_refs: list[ActorRef[ActorA]],
+) -> None:
+    dead_ref = a_actor_refs[0]
+    dead_ref.stop()
+    # Simulate that the actor stopped after the broadcast found its ref.
+    ActorRegistry.register(dead_ref)
+
+    skipped = ActorRegistry.broadcast({"command": "foo"})
+
+    assert skipped == [dead_ref]
+    for actor_ref in a_actor_refs[1:]:
+        received_messages = actor_ref.proxy().received_messages.get()
+        assert {"command": "foo"} in received_messages
+
+    ActorRegistry.unregister(dead_ref)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pykka import ProcessActor, SharedBuffer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pykka import ActorRef
+
+
+class BufferActor(ProcessActor):
+    use_daemon_process = True
+
+    def on_receive(self, message: Any) -> Any:
+        with message:
+            with message.buf as view:
+                view[:] = bytes(reversed(view))
+            return message.name
+
+
+@pytest.fixture
+def buffer_ref() -> Iterator[ActorRef[BufferActor]]:
+    ref = BufferActor.start()
+    yield ref
+    ref.stop()
+
+
+def test_from_bytes_copies_data_into_shared_memory() -> None:
+    with SharedBuffer.from_bytes(bytearray(b"abc")) as shared:
+        assert len(shared) == 3
+        assert shared.owner
+        assert shared.tobytes() == b"abc"
+
+
+def test_size_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        SharedBuffer(0)
+
+
+def test_unpickled_buffer_borrows_the_same_memory() -> None:
+    with SharedBuffer.from_bytes(b"abc") as shared:
+        borrowed = pickle.loads(pickle.dumps(shared))  # noqa: S301
+
+        with borrowed.buf as view:
+            view[0:1] = b"x"
+        borrowed.release()
+
+        assert not borrowed.owner
+        assert shared.tobytes() == b"xbc"
+
+
+def test_released_buffer_cannot_be_used() -> None:
+    shared = SharedBuffer(3)
+
+    shared.release()
+    shared.release()
+
+    with pytest.raises(ValueError, match="has been released"):
+        shared.tobytes()
+    with pytest.raises(ValueError, match="has been released"):
+        pickle.dumps(shared)
+
+
+def test_owner_frees_the_shared_memory_on_release() -> None:
+    shared = SharedBuffer(3)
+    pickled = pickle.dumps(shared)
+
+    shared.release()
+
+    with pytest.raises(FileNotFoundError):
+        pickle.loads(pickled)  # noqa: S301
+
+
+def test_process_actor_works_on_the_buffer_in_place(
+    buffer_ref: ActorRef[BufferActor],
+) -> None:
+    with SharedBuffer.from_bytes(b"abc") as shared:
+        assert buffer_ref.ask(shared) == shared.name
+        assert shared.tobytes() == b"cba"
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import pytest
+
+from pykka import ActorRegistry, AsyncioActor, Supervisor, ThreadingActor
+
+if TYPE_CHECKING:
+    from pykka import ActorRef
+
+pytestmark = pytest.mark.usefixtures("_stop_all")
+
+
+class CounterActor(ThreadingActor):
+    def __init__(self, log: list[tuple[str, float]], fail_on_start: int = 0) -> None:
+        super().__init__()
+        self.log = log
+        self.fail_on_start = fail_on_start
+        self.count = 0
+
+    def on_start(self) -> None:
+        self.log.append(("start", time.monotonic()))
+        if sum(1 for event, _ in self.log if event == "start") <= self.fail_on_start:
+            raise RuntimeError("on_start failure")
+
+    def on_stop(self) -> None:
+        self.log.append(("stop", time.monotonic()))
+
+    def on_receive(self, message: Any) -> Any:
+        if message == "fail":
+            raise ValueError("boom")
+        if message == "inc":
+            self.count += 1
+        return self.count
+
+
+class OneForOneSupervisor(Supervisor):
+    pass
+
+
+class OneForAllSupervisor(Supervisor):
+    strategy = "one_for_all"
+
+
+def start_child(
+    supervisor: ActorRef[Supervisor],
+    *args: Any,
+    **kwargs: Any,
+) -> ActorRef[CounterActor]:
+    return supervisor.proxy().start_child(CounterActor, *args, **kwargs).get()
+
+
+def starts(log: list[tuple[str, float]]) -> list[float]:
+    return [timestamp for event, timestamp in log if event == "start"]
+
+
+def test_failed_child_is_restarted_in_place() -> None:
+    supervisor = OneForOneSupervisor.start()
+    log: list[tuple[str, float]] = []
+    child = start_child(supervisor, log)
+    child.tell("inc")
+
+    child.tell("fail")
+    child.tell("inc")
+
+    assert child.ask("count", timeout=5) == 1
+    assert child.is_alive()
+    assert ActorRegistry.get_by_urn(child.actor_urn) is child
+    assert len(starts(log)) == 2
+
+
+def test_messages_waiting_in_the_inbox_are_kept() -> None:
+    supervisor = OneForOneSupervisor.start()
+    log: list[tuple[str, float]] = []
+    child = start_child(supervisor, log)
+
+    child.tell("fail")
+    futures = [child.ask("inc", block=False) for _ in range(3)]
+
+    assert [future.get(timeout=5) for future in futures] == [1, 2, 3]
+
+
+def test_child_failing_on_start_is_restarted() -> None:
+    supervisor = OneForOneSupervisor.start()
+    log: list[tuple[str, float]] = []
+
+    child = start_child(supervisor, log, fail_on_start=2)
+
+    assert child.ask("inc", timeout=5) == 1
+    assert len(starts(log)) == 3
+
+
+def test_one_for_one_does_not_restart_siblings() -> None:
+    supervisor = OneForOneSupervisor.start()
+    failing_log: list[tuple[str, float]] = []
+    sibling_log: list[tuple[str, float]] = []
+    failing = start_child(supervisor, failing_log)
+    sibling = start_child(supervisor, sibling_log)
+    sibling.tell("inc")
+
+    failing.tell("fail")
+
+    assert failing.ask("inc", timeout=5) == 1
+    assert sibling.ask("inc", timeout=5) == 2
+    assert len(sibling_log) == 1
+
+
+def test_one_for_all_restarts_siblings() -> None:
+    supervisor = OneForAllSupervisor.start()
+    failing_log: list[tuple[str, float]] = []
+    sibling_log: list[tuple[str, float]] = []
+    failing = start_child(supervisor, failing_log)
+    sibling = start_child(supervisor, sibling_log)
+    sibling.tell("inc")
+
+    failing.tell("fail")
+
+    assert failing.ask("inc", timeout=5) == 1
+    assert sibling.ask("inc", timeout=5) == 1
+    assert [event for event, _ in sibling_log] == ["start", "stop", "start"]
+    assert sibling.is_alive()
+
+
+def test_supervisor_gives_up_after_max_restarts() -> None:
+    class StrictSupervisor(Supervisor):
+        max_restarts = 2
+        strategy = "one_for_one"
+
+    supervisor = StrictSupervisor.start()
+    log: list[tuple[str, float]] = []
+    failing = start_child(supervisor, log)
+    sibling = start_child(supervisor, [])
+
+    for _ in range(3):
+        failing.tell("fail")
+    failing.actor_stopped.wait(timeout=5)
+    supervisor.actor_stopped.wait(timeout=5)
+    sibling.actor_stopped.wait(timeout=5)
+
+    assert not failing.is_alive()
+    assert not supervisor.is_alive()
+    assert not sibling.is_alive()
+    assert len(starts(log)) == 3
+
+
+def test_restarts_are_delayed_with_exponential_backoff() -> None:
+    class BackoffSupervisor(Supervisor):
+        restart_backoff = 0.05
+        restart_backoff_max = 0.15
+        max_restarts: ClassVar[int] = 10
+
+    supervisor = BackoffSupervisor.start()
+    log: list[tuple[str, float]] = []
+    child = start_child(supervisor, log)
+
+    for _ in range(4):
+        child.tell("fail")
+    assert child.ask("inc", timeout=5) == 1
+
+    timestamps = starts(log)
+    delays = [b - a for a, b in zip(timestamps, timestamps[1:], strict=False)]
+    assert len(delays) == 4
+    assert delays[0] >= 0.05
+    assert delays[1] >= 0.1
+    assert delays[2] >= 0.15
+    assert delays[3] < 0.3
+
+
+def test_stopping_supervisor_stops_children() -> None:
+    supervisor = OneForOneSupervisor.start()
+    child = start_child(supervisor, [])
+
+    supervisor.stop()
+
+    assert child.actor_stopped.wait(timeout=5)
+
+
+def test_child_is_stopped_if_supervisor_is_dead() -> None:
+    supervisor = OneForOneSupervisor.start()
+    child = start_child(supervisor, [])
+    supervisor.actor_stopped.set()
+    ActorRegistry.unregister(supervisor)
+
+    child.tell("fail")
+
+    assert child.actor_stopped.wait(timeout=5)
+
+
+def test_supervised_actors_must_be_threading_actors() -> None:
+    class AsyncioCounterActor(AsyncioActor):
+        pass
+
+    supervisor = OneForOneSupervisor.start()
+
+    with pytest.raises(TypeError, match="ThreadingActor"):
+        supervisor.proxy().start_child(AsyncioCounterActor).get()
+
+
+def test_unknown_strategy_is_rejected() -> None:
+    class BadSupervisor(Supervisor):
+        strategy = "one_for_some"  # type: ignore[assignment]
+
+    with pytest.raises(ValueError, match="Unknown supervision strategy"):
+        BadSupervisor.start()
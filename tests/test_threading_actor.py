@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import queue
 import threading
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from pykka import ThreadingActor
+from pykka import ActorDeadError, ThreadingActor
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -21,6 +22,49 @@ class DaemonActor(ThreadingActor):
     use_daemon_thread = True
 
 
+class BatchingActor(ThreadingActor):
+    inbox_batch_size = 10
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[Any]] = []
+        self.proxy_calls: list[int] = []
+
+    def block(self, blocked: threading.Event, release: threading.Event) -> None:
+        blocked.set()
+        release.wait()
+
+    def record(self, value: int) -> None:
+        self.proxy_calls.append(value)
+
+    def on_receive_batch(self, messages: list[Any]) -> list[Any]:
+        self.batches.append(messages)
+        if "raise" in messages:
+            raise ValueError("batch failed")
+        if "stop" in messages:
+            self.stop()
+        return [message * 2 for message in messages]
+
+
+@pytest.fixture
+def batching_actor_ref() -> Iterator[ActorRef[BatchingActor]]:
+    ref = BatchingActor.start()
+    yield ref
+    ref.stop()
+
+
+def fill_inbox_while_blocked(
+    ref: ActorRef[Any],
+    messages: list[Any],
+) -> list[Any]:
+    blocked, release = threading.Event(), threading.Event()
+    ref.proxy().block(blocked, release)
+    blocked.wait()
+    futures = [ref.ask(message, block=False) for message in messages]
+    release.set()
+    return futures
+
+
 @pytest.fixture
 def regular_actor_ref() -> Iterator[ActorRef[RegularActor]]:
     ref = RegularActor.start()
@@ -65,3 +109,96 @@ def test_actor_thread_is_daemonic_if_use_daemon_thread_flag_is_set(
 
     assert len(actor_threads) == 1
     assert actor_threads[0].daemon
+
+
+def test_waiting_messages_are_handled_as_one_batch(
+    batching_actor_ref: ActorRef[BatchingActor],
+) -> None:
+    futures = fill_inbox_while_blocked(batching_actor_ref, [1, 2, 3])
+
+    assert [future.get(timeout=1) for future in futures] == [2, 4, 6]
+    assert batching_actor_ref.proxy().batches.get() == [[1, 2, 3]]
+
+
+def test_batches_are_limited_by_inbox_batch_size(
+    batching_actor_ref: ActorRef[BatchingActor],
+) -> None:
+    futures = fill_inbox_while_blocked(batching_actor_ref, list(range(15)))
+
+    assert [future.get(timeout=1) for future in futures] == list(range(0, 30, 2))
+    batches = batching_actor_ref.proxy().batches.get()
+    assert [len(batch) for batch in batches] == [10, 5]
+
+
+def test_proxy_messages_split_batches_and_keep_order(
+    batching_actor_ref: ActorRef[BatchingActor],
+) -> None:
+    proxy = batching_actor_ref.proxy()
+    blocked, release = threading.Event(), threading.Event()
+    proxy.block(blocked, release)
+    blocked.wait()
+    futures = [
+        batching_actor_ref.ask(1, block=False),
+        proxy.record(2),
+        batching_actor_ref.ask(3, block=False),
+        batching_actor_ref.ask(4, block=False),
+    ]
+    release.set()
+
+    assert [future.get(timeout=1) for future in futures] == [2, None, 6, 8]
+    assert proxy.batches.get() == [[1], [3, 4]]
+    assert proxy.proxy_calls.get() == [2]
+
+
+def test_exception_in_batch_is_returned_to_all_callers(
+    batching_actor_ref: ActorRef[BatchingActor],
+) -> None:
+    futures = fill_inbox_while_blocked(batching_actor_ref, [1, "raise", 3])
+
+    for future in futures:
+        with pytest.raises(ValueError, match="batch failed"):
+            future.get(timeout=1)
+    assert batching_actor_ref.is_alive()
+
+
+def test_messages_after_stop_in_batch_receive_an_error(
+    batching_actor_ref: ActorRef[BatchingActor],
+) -> None:
+    blocked, release = threading.Event(), threading.Event()
+    batching_actor_ref.proxy().block(blocked, release)
+    blocked.wait()
+    first = batching_actor_ref.ask("stop", block=False)
+    batching_actor_ref.stop(block=False)
+    later = batching_actor_ref.ask(1, block=False)
+    release.set()
+
+    assert first.get(timeout=1) == "stopstop"
+    with pytest.raises(ActorDeadError):
+        later.get(timeout=1)
+
+
+class SimpleQueueBatchingActor(BatchingActor):
+    use_simple_queue_inbox = True
+
+
+def test_simple_queue_inbox_is_opt_in(
+    regular_actor_ref: ActorRef[RegularActor],
+) -> None:
+    ref = SimpleQueueBatchingActor.start()
+    try:
+        assert isinstance(ref.actor_inbox, queue.SimpleQueue)
+        assert not isinstance(regular_actor_ref.actor_inbox, queue.SimpleQueue)
+    finally:
+        ref.stop()
+
+
+def test_simple_queue_inbox_supports_batches() -> None:
+    ref = SimpleQueueBatchingActor.start()
+    try:
+        futures = fill_inbox_while_blocked(ref, list(range(15)))
+
+        assert [future.get(timeout=1) for future in futures] == list(range(0, 30, 2))
+        batches = ref.proxy().batches.get()
+        assert [len(batch) for batch in batches] == [10, 5]
+    finally:
+        ref.stop()
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import pykka.tracing
+from pykka import Actor, ActorRegistry
+from tests.log_handler import LogLevel, PykkaTestLogHandler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pykka import ActorRef
+    from pykka.tracing import TraceEvent
+    from tests.types import Runtime
+
+pytestmark = pytest.mark.usefixtures("_stop_all")
+
+
+class Collector(pykka.tracing.Tracer):
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.events: list[tuple[str, TraceEvent]] = []
+
+    def _append(self, kind: str, event: TraceEvent) -> None:
+        with self.condition:
+            self.events.append((kind, event))
+            self.condition.notify_all()
+
+    def on_send(self, event: TraceEvent) -> None:
+        self._append("send", event)
+
+    def on_receive_start(self, event: TraceEvent) -> None:
+        self._append("receive_start", event)
+
+    def on_receive_end(self, event: TraceEvent) -> None:
+        self._append("receive_end", event)
+
+    def on_reply(self, event: TraceEvent) -> None:
+        self._append("reply", event)
+
+    def wait_for(self, num_events: int) -> list[tuple[str, TraceEvent]]:
+        with self.condition:
+            assert self.condition.wait_for(
+                lambda: len(self.events) >= num_events, timeout=5
+            )
+            return list(self.events)
+
+
+class RelayActor(Actor):
+    def __init__(self, downstream: ActorRef[Any] | None = None) -> None:
+        super().__init__()
+        self.downstream = downstream
+
+    def on_receive(self, message: Any) -> Any:
+        if message == "fail":
+            raise ValueError("boom")
+        if message == "context":
+            return pykka.tracing.current_context()
+        if self.downstream is not None:
+            # Don't block on the reply, as asyncio actors share one event loop.
+            self.downstream.tell(message)
+        return message
+
+
+@pytest.fixture
+def collector() -> Iterator[Collector]:
+    collector = Collector()
+    pykka.tracing.add_tracer(collector)
+    yield collector
+    pykka.tracing.remove_tracer(collector)
+
+
+@pytest.fixture
+def actor_class(runtime: Runtime) -> type[RelayActor]:
+    class RelayActorImpl(RelayActor, runtime.actor_class):  # type: ignore[name-defined]
+        pass
+
+    return RelayActorImpl
+
+
+def test_ask_is_traced_from_send_to_reply(
+    actor_class: type[RelayActor],
+    collector: Collector,
+) -> None:
+    actor_ref = actor_class.start()
+
+    assert actor_ref.ask("hi") == "hi"
+
+    events = collector.wait_for(4)
+    assert sorted(kind for kind, _ in events) == [
+        "receive_end",
+        "receive_start",
+        "reply",
+        "send",
+    ]
+    assert events[0][0] == "send"
+    assert events[1][0] == "receive_start"
+    assert {event.context for _, event in events} == {events[0][1].context}
+    assert {event.actor_ref for _, event in events} == {actor_ref}
+    assert {event.message for _, event in events} == {"hi"}
+    (reply,) = [event for kind, event in events if kind == "reply"]
+    assert reply.duration is not None
+    assert reply.duration >= 0
+    assert reply.exception is None
+
+
+def test_tell_is_traced_without_reply(
+    actor_class: type[RelayActor],
+    collector: Collector,
+) -> None:
+    actor_ref = actor_class.start()
+
+    actor_ref.tell("hi")
+
+    events = collector.wait_for(3)
+    assert [kind for kind, _ in events] == ["send", "receive_start", "receive_end"]
+    assert events[0][1].context.parent_span_id is None
+
+
+def test_messages_sent_by_an_actor_are_child_spans(
+    actor_class: type[RelayActor],
+    collector: Collector,
+) -> None:
+    downstream = actor_class.start()
+    upstream = actor_class.start(downstream)
+
+    assert upstream.ask("hi") == "hi"
+
+    events = collector.wait_for(7)
+    (parent,) = [
+        e.context for k, e in events if k == "send" and e.actor_ref == upstream
+    ]
+    (child,) = [
+        e.context for k, e in events if k == "send" and e.actor_ref == downstream
+    ]
+    assert child.trace_id == parent.trace_id
+    assert child.parent_span_id == parent.span_id
+    assert child.span_id != parent.span_id
+
+
+def test_current_context_is_the_handled_messages_context(
+    actor_class: type[RelayActor],
+    collector: Collector,
+) -> None:
+    actor_ref = actor_class.start()
+
+    context = actor_ref.ask("context")
+
+    assert context == collector.wait_for(1)[0][1].context
+    assert pykka.tracing.current_context() is None
+
+
+def test_exception_is_included_in_receive_end_and_reply(
+    actor_class: type[RelayActor],
+    collector: Collector,
+) -> None:
+    actor_ref = actor_class.start()
+
+    with pytest.raises(ValueError, match="boom"):
+        actor_ref.ask("fail")
+
+    events = collector.wait_for(4)
+    exceptions = {
+        kind: event.exception for kind, event in events if event.exception is not None
+    }
+    assert set(exceptions) == {"receive_end", "reply"}
+    assert all(isinstance(exc, ValueError) for exc in exceptions.values())
+
+
+def test_broadcast_recipients_get_a_span_each(
+    actor_class: type[RelayActor],
+    collector: Collector,
+) -> None:
+    actor_class.start()
+    actor_class.start()
+
+    ActorRegistry.broadcast("hi", target_class=actor_class)
+
+    events = collector.wait_for(6)
+    sent = [event for kind, event in events if kind == "send"]
+    assert len({event.context.span_id for event in sent}) == 2
+    assert len({event.actor_ref for event in sent}) == 2
+
+
+def test_failing_tracer_is_logged_and_ignored(
+    actor_class: type[RelayActor],
+    collector: Collector,
+    log_handler: PykkaTestLogHandler,
+) -> None:
+    class FailingTracer(pykka.tracing.Tracer):
+        def on_send(self, event: TraceEvent) -> None:
+            raise RuntimeError("oops")
+
+    failing = FailingTracer()
+    pykka.tracing.add_tracer(failing)
+    try:
+        actor_ref = actor_class.start()
+        assert actor_ref.ask("hi") == "hi"
+    finally:
+        pykka.tracing.remove_tracer(failing)
+
+    log_handler.wait_for_message(LogLevel.ERROR)
+    with log_handler.lock:
+        (record,) = log_handler.messages[LogLevel.ERROR]
+    assert "on_send()" in record.getMessage()
+    assert collector.wait_for(4)
+
+
+def test_removed_tracer_is_not_called(actor_class: type[RelayActor]) -> None:
+    collector = Collector()
+    pykka.tracing.add_tracer(collector)
+    pykka.tracing.remove_tracer(collector)
+
+    actor_class.start().ask("hi")
+
+    assert collector.events == []
+
+
+def test_removing_unknown_tracer_fails() -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        pykka.tracing.remove_tracer(Collector())